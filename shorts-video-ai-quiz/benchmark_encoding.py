@@ -0,0 +1,168 @@
+"""
+인코딩 모드 벤치마크 스크립트
+같은 퀴즈 영상을 인코딩 모드(standard/still/lowfps)별로 만들어 시간, 파일 크기, 화질(PSNR)을 비교
+
+사용법:
+    python benchmark_encoding.py
+    python benchmark_encoding.py --repeat 3 --moviepy
+"""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+from models import QuizQuestion, QuizType
+from ffmpeg_encoder import ENCODE_MODES, encode_frames, get_ffmpeg_exe
+import video_generator
+from video_generator import FPS, WIDTH, HEIGHT, build_frame_runs, get_audio_input
+
+# 벤치마크용 문제
+BENCHMARK_QUESTION = QuizQuestion(
+    id=1,
+    question="勉強",
+    options=["공부", "운동", "독서", "여행"],
+    correct_answer="공부",
+    explanation="勉(힘쓸 면) + 強(강할 강) = 힘써서 배우다, 공부하다",
+    jlpt_level=3,
+    quiz_type=QuizType.JP_TO_KR,
+)
+
+
+def decode_frame(video_path: str, seconds: float) -> np.ndarray:
+    """
+    영상에서 지정한 시각에 화면에 보이는 프레임을 RGB 배열로 디코딩
+    lowfps 출력은 프레임이 드물어서 fps 필터로 FPS에 맞춘 뒤 찾음 (입력 -ss는 그 시각 이후 프레임을 반환)
+    """
+    command = [
+        get_ffmpeg_exe(),
+        "-v", "error",
+        "-i", video_path,
+        "-vf", f"fps={FPS}",
+        "-ss", f"{seconds:.3f}",
+        "-frames:v", "1",
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "pipe:1",
+    ]
+    result = subprocess.run(command, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype=np.uint8).reshape(HEIGHT, WIDTH, 3)
+
+
+def psnr(reference: np.ndarray, decoded: np.ndarray) -> float:
+    """PSNR (dB) - 원본 프레임과 디코딩한 프레임 비교"""
+    mse = np.mean((reference.astype(np.float64) - decoded.astype(np.float64)) ** 2)
+    if mse == 0:
+        return float("inf")
+    return 10 * np.log10(255.0 ** 2 / mse)
+
+
+def measure_quality(video_path: str, runs: list) -> tuple[float, float]:
+    """
+    장면마다 중간 시각의 프레임을 원본과 비교
+
+    Returns:
+        tuple[float, float]: (평균 PSNR, 최소 PSNR)
+    """
+    scores = []
+    start_frame = 0
+    for frame, repeat in runs:
+        middle = (start_frame + repeat / 2) / FPS
+        scores.append(psnr(np.asarray(frame.convert("RGB")), decode_frame(video_path, middle)))
+        start_frame += repeat
+    return float(np.mean(scores)), float(np.min(scores))
+
+
+def count_frames(video_path: str) -> int:
+    """영상의 비디오 프레임 수"""
+    # framecrc는 패킷마다 한 줄씩 출력 (# 주석 줄 제외)
+    command = [get_ffmpeg_exe(), "-v", "error", "-i", video_path, "-map", "0:v:0", "-c", "copy", "-f", "framecrc", "-"]
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    return sum(1 for line in result.stdout.splitlines() if line and not line.startswith("#"))
+
+
+def benchmark_mode(mode: str, runs: list, audio, output_dir: str, repeat: int) -> dict:
+    """인코딩 모드 하나 측정 (단일 패스 인코딩)"""
+    output_path = os.path.join(output_dir, f"{mode}.mp4")
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        encode_frames(
+            runs,
+            output_path,
+            width=WIDTH,
+            height=HEIGHT,
+            fps=FPS,
+            audio=audio,
+            preset=video_generator.VIDEO_PRESET,
+            threads=video_generator.VIDEO_THREADS,
+            encode_mode=mode,
+        )
+        timings.append(time.perf_counter() - started)
+
+    psnr_avg, psnr_min = measure_quality(output_path, runs)
+    return {
+        "mode": mode,
+        "seconds": min(timings),
+        "size_bytes": os.path.getsize(output_path),
+        "frames": count_frames(output_path),
+        "psnr_avg": psnr_avg,
+        "psnr_min": psnr_min,
+    }
+
+
+def benchmark_moviepy(runs: list, output_dir: str) -> dict:
+    """기존 MoviePy 엔진 측정"""
+    output_path = os.path.join(output_dir, "moviepy.mp4")
+    started = time.perf_counter()
+    video_generator.generate_quiz_video(BENCHMARK_QUESTION, output_path, engine="moviepy")
+    seconds = time.perf_counter() - started
+
+    psnr_avg, psnr_min = measure_quality(output_path, runs)
+    return {
+        "mode": "moviepy",
+        "seconds": seconds,
+        "size_bytes": os.path.getsize(output_path),
+        "frames": count_frames(output_path),
+        "psnr_avg": psnr_avg,
+        "psnr_min": psnr_min,
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="인코딩 모드 벤치마크")
+    parser.add_argument("--repeat", type=int, default=1, help="모드별 반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--moviepy", action="store_true", help="기존 MoviePy 엔진도 측정 (느림)")
+    args = parser.parse_args()
+
+    print("🎬 프레임 렌더링 + 오디오 베드 준비...")
+    runs = build_frame_runs(BENCHMARK_QUESTION)
+    audio = get_audio_input()
+
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        for mode in ENCODE_MODES:
+            print(f"⏱️  {mode} 인코딩 중...")
+            results.append(benchmark_mode(mode, runs, audio, output_dir, args.repeat))
+        if args.moviepy:
+            print("⏱️  moviepy 인코딩 중...")
+            results.append(benchmark_moviepy(runs, output_dir))
+
+    baseline = results[0]
+    print()
+    print(f"{'모드':<10} {'시간(초)':>9} {'배속':>6} {'크기(KB)':>9} {'프레임':>6} {'PSNR 평균':>10} {'PSNR 최소':>10}")
+    for result in results:
+        speedup = baseline["seconds"] / result["seconds"] if result["seconds"] else 0.0
+        print(
+            f"{result['mode']:<10} {result['seconds']:>9.2f} {speedup:>5.1f}x "
+            f"{result['size_bytes'] / 1024:>9.1f} {result['frames']:>6} "
+            f"{result['psnr_avg']:>10.2f} {result['psnr_min']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+import 시간 벤치마크 스크립트 (python -X importtime 기반)
+새 인터프리터에서 모듈을 import하는 시간을 반복 측정하고 패키지별/모듈별 누적 시간을 JSON으로 저장
+scale-to-zero 환경에서는 시작 시간이 곧 첫 요청 지연이므로, 요청 처리에 필요 없는 무거운 패키지가
+시작 시 import되지 않는지(--check) 함께 확인
+
+사용법:
+    python benchmark_imports.py
+    python benchmark_imports.py --repeat 10 --output results/imports_new.json --compare results/imports_old.json
+    python benchmark_imports.py --module render_pool --top 30
+    python benchmark_imports.py --check                    # 지연 import 대상이 import되면 종료 코드 1
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+
+# 처음 사용할 때 import해야 하는 패키지 (시작 시 import되면 --check 실패)
+# moviepy: VIDEO_ENGINE=moviepy일 때만, google.cloud.storage: STORAGE_TYPE=gcs일 때만, httpx: 첫 웹훅 전송 시
+DEFERRED_MODULES = ("moviepy", "IPython", "imageio", "google.cloud.storage", "google.auth", "httpx")
+
+# -X importtime 출력: "import time:  self [us] | cumulative | imported package"
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure_once(module: str, env: dict) -> dict:
+    """새 인터프리터에서 module을 한 번 import (wall time + 모듈별 self/누적 시간, 초)"""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SCRIPT_DIR, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} 실패:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules[name] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    return {
+        "wall": wall,
+        "import": modules.get(module, (0.0, 0.0))[1],
+        "modules": modules,
+    }
+
+
+def summarize(samples: list[dict], top: int) -> dict:
+    """반복 측정 결과 요약 (중앙값, 밀리초)"""
+    def median_ms(values: list[float]) -> float:
+        return statistics.median(values) * 1000
+
+    # 패키지(최상위 이름)별 self 시간 합계 - 어떤 의존성이 시작 시간을 쓰는지
+    package_samples: dict[str, list[float]] = defaultdict(list)
+    module_samples: dict[str, list[float]] = defaultdict(list)
+    for sample in samples:
+        packages: dict[str, float] = defaultdict(float)
+        for name, (self_seconds, cumulative_seconds) in sample["modules"].items():
+            packages[name.split(".")[0]] += self_seconds
+            module_samples[name].append(cumulative_seconds)
+        for name, seconds in packages.items():
+            package_samples[name].append(seconds)
+
+    packages = sorted(
+        ((name, median_ms(values)) for name, values in package_samples.items()),
+        key=lambda item: item[1], reverse=True,
+    )
+    modules = sorted(
+        ((name, median_ms(values)) for name, values in module_samples.items()),
+        key=lambda item: item[1], reverse=True,
+    )
+    imported = set().union(*(sample["modules"] for sample in samples))
+    return {
+        "wall_ms": median_ms([sample["wall"] for sample in samples]),
+        "import_ms": median_ms([sample["import"] for sample in samples]),
+        "module_count": len(imported),
+        "packages_ms": dict(packages[:top]),
+        "modules_cumulative_ms": dict(modules[:top]),
+        "deferred_imported": [
+            deferred for deferred in DEFERRED_MODULES
+            if any(name == deferred or name.startswith(f"{deferred}.") for name in imported)
+        ],
+    }
+
+
+def git_revision() -> str | None:
+    """현재 커밋 (git 저장소가 아니면 None)"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SCRIPT_DIR, capture_output=True, text=True, check=True,
+        )
+        return result.stdout.strip()
+    except Exception:
+        return None
+
+
+def print_summary(summary: dict, baseline: dict | None):
+    """결과 출력 (baseline이 있으면 변화율 포함)"""
+    def change(current: float, previous: float | None) -> str:
+        if not previous:
+            return ""
+        return f" (이전 {previous:.1f}ms, {(current - previous) / previous * 100:+.1f}%)"
+
+    baseline = baseline or {}
+    print(f"인터프리터 시작 + import: {summary['wall_ms']:.1f}ms{change(summary['wall_ms'], baseline.get('wall_ms'))}")
+    print(f"import만:                 {summary['import_ms']:.1f}ms{change(summary['import_ms'], baseline.get('import_ms'))}")
+    print(f"import된 모듈 수:         {summary['module_count']}")
+
+    print(f"\n{'패키지 (self 합계)':<40} {'ms':>10}")
+    for name, ms in summary["packages_ms"].items():
+        print(f"{name:<40} {ms:>10.1f}")
+
+    print(f"\n{'모듈 (누적)':<60} {'ms':>10}")
+    for name, ms in summary["modules_cumulative_ms"].items():
+        print(f"{name:<60} {ms:>10.1f}")
+
+    if summary["deferred_imported"]:
+        print(f"\n⚠️  시작 시 import된 지연 대상: {', '.join(summary['deferred_imported'])}")
+    else:
+        print(f"\n✅ 지연 대상({', '.join(DEFERRED_MODULES)})은 시작 시 import되지 않음")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="import 시간 벤치마크 (python -X importtime)")
+    parser.add_argument("--module", default="main", help="측정할 모듈 (기본: main - API 서버)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 패키지/모듈 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표준 출력만)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--check", action="store_true", help="지연 import 대상이 import되면 종료 코드 1")
+    args = parser.parse_args()
+
+    # 측정 환경 고정 (로컬 저장소, 기본 엔진) - 바이트코드 캐시는 첫 실행에서 만들어지므로 한 번 버림
+    env = {**os.environ, "STORAGE_TYPE": "local", "VIDEO_ENGINE": "ffmpeg"}
+    print(f"⏱️  import {args.module} 측정 중 ({args.repeat}회)...")
+    measure_once(args.module, env)
+    samples = [measure_once(args.module, env) for _ in range(args.repeat)]
+    summary = summarize(samples, args.top)
+
+    result = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "settings": {
+            "module": args.module,
+            "repeat": args.repeat,
+        },
+        **summary,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print()
+    print_summary(summary, baseline)
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 결과 저장: {args.output}")
+
+    if args.check and summary["deferred_imported"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
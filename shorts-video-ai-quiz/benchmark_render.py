@@ -0,0 +1,378 @@
+"""
+렌더링 벤치마크 스크립트
+합성 퀴즈 문제(4개 퀴즈 유형 x 기본/이모지 많음/긴 해설)로 단계별 시간을 측정하고 JSON으로 저장
+커밋 간 비교: 이전 결과 파일을 --compare로 넘기면 단계별 변화율 출력
+
+사용법:
+    python benchmark_render.py
+    python benchmark_render.py --repeat 5 --output results/render_new.json --compare results/render_old.json
+    python benchmark_render.py --encode-samples 0          # 렌더링 단계만
+    python benchmark_render.py --moviepy                   # MoviePy write_videofile도 측정 (느림)
+    python benchmark_render.py --handoff-samples 3         # 프로세스 간 프레임 전달 (pickle 큐 vs 공유 메모리)
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import PIL
+
+from models import QuizQuestion, QuizType
+import frame_renderer
+import video_generator
+from ffmpeg_encoder import encode_audio, encode_frames
+from frame_ring import FrameRing
+
+SCRIPT_DIR = Path(__file__).parent
+
+# 유형별 기본 문제 (문제, 선택지, 정답)
+BASE_QUESTIONS = {
+    QuizType.JP_TO_KR: ("勉強", ["공부", "운동", "독서", "여행"], "공부"),
+    QuizType.KR_TO_JP: ("공부", ["勉強", "運動", "読書", "旅行"], "勉強"),
+    QuizType.KANJI_READING: ("勉強", ["べんきょう", "うんどう", "どくしょ", "りょこう"], "べんきょう"),
+    QuizType.FILL_BLANK: ("毎日（　　）をします。", ["勉強", "運動", "読書", "旅行"], "勉強"),
+}
+
+SHORT_EXPLANATION = "勉(힘쓸 면) + 強(강할 강) = 공부하다"
+LONG_EXPLANATION = (
+    "勉(힘쓸 면) + 強(강할 강) = 힘써서 배우다, 공부하다. "
+    "勉強する(べんきょうする)는 '공부하다'라는 동사로 가장 많이 쓰이며, "
+    "勉強になる는 '공부가 되다, 배울 점이 있다'라는 뜻입니다. "
+    "상점에서 勉強してください라고 하면 '값을 깎아 주세요'라는 의미로도 쓰입니다. "
+    "비슷한 말로 学習(がくしゅう), 研究(けんきゅう)가 있습니다."
+)
+
+
+def build_corpus() -> list[tuple[str, QuizQuestion]]:
+    """합성 문제 목록 (케이스 이름, 문제) - 4개 퀴즈 유형 x 3개 케이스"""
+    corpus = []
+    question_id = 1
+    for quiz_type, (question, options, answer) in BASE_QUESTIONS.items():
+        cases = {
+            "basic": (question, options, answer, SHORT_EXPLANATION),
+            "emoji": (
+                f"🇯🇵 {question} ⏱️",
+                [f"✅ {option}" if option == answer else f"👆 {option}" for option in options],
+                f"✅ {answer}",
+                f"💡 {SHORT_EXPLANATION} ✅ 👆 💡",
+            ),
+            "long_explanation": (question, options, answer, LONG_EXPLANATION),
+        }
+        for case, (text, case_options, case_answer, explanation) in cases.items():
+            corpus.append((
+                f"{quiz_type.value}/{case}",
+                QuizQuestion(
+                    id=question_id,
+                    question=text,
+                    options=case_options,
+                    correct_answer=case_answer,
+                    explanation=explanation,
+                    jlpt_level=(question_id % 5) + 1,
+                    quiz_type=quiz_type,
+                ),
+            ))
+            question_id += 1
+    return corpus
+
+
+class StageTimer:
+    """단계별 실행 시간 수집"""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples[name].append(time.perf_counter() - started)
+
+    def summary(self) -> dict:
+        """단계별 통계 (밀리초)"""
+        result = {}
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            result[name] = {
+                "count": len(samples),
+                "mean_ms": statistics.fmean(samples) * 1000,
+                "median_ms": statistics.median(samples) * 1000,
+                "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+                "min_ms": ordered[0] * 1000,
+                "max_ms": ordered[-1] * 1000,
+                "total_ms": sum(samples) * 1000,
+            }
+        return result
+
+
+def benchmark_assets(timer: StageTimer, repeat: int):
+    """폰트/그라데이션 배경 (캐시 비운 상태 + 캐시된 상태)"""
+    for _ in range(repeat):
+        frame_renderer._load_font.cache_clear()
+        with timer.stage("get_font.cold"):
+            for size, bold in frame_renderer.COMMON_FONT_SPECS:
+                frame_renderer.get_font(size, bold)
+        with timer.stage("get_font.warm"):
+            for size, bold in frame_renderer.COMMON_FONT_SPECS:
+                frame_renderer.get_font(size, bold)
+
+        frame_renderer._gradient_cache.clear()
+        with timer.stage("create_gradient_background.cold"):
+            frame_renderer.create_gradient_background(frame_renderer.WIDTH, frame_renderer.HEIGHT)
+        with timer.stage("create_gradient_background.warm"):
+            frame_renderer.create_gradient_background(frame_renderer.WIDTH, frame_renderer.HEIGHT)
+
+
+def benchmark_frames(timer: StageTimer, corpus: list[tuple[str, QuizQuestion]], repeat: int):
+    """프레임 렌더링 단계"""
+    for _ in range(repeat):
+        for _, question in corpus:
+            with timer.stage("render_intro_frame"):
+                frame_renderer.render_intro_frame(question)
+            with timer.stage("render_question_base"):
+                base = frame_renderer.render_question_base(question)
+            for countdown in range(video_generator.QUESTION_DURATION, 0, -1):
+                with timer.stage("render_countdown_overlay"):
+                    frame_renderer.render_countdown_overlay(base, countdown)
+            with timer.stage("render_question_frames"):
+                frame_renderer.render_question_frames(question, video_generator.QUESTION_DURATION)
+            with timer.stage("render_answer_frame"):
+                frame_renderer.render_answer_frame(question)
+            with timer.stage("render_account_frame"):
+                frame_renderer.render_account_frame()
+            with timer.stage("build_frame_runs"):
+                video_generator.build_frame_runs(question)
+
+
+def benchmark_clip_composition(timer: StageTimer, corpus: list[tuple[str, QuizQuestion]]):
+    """MoviePy 클립 합성 (write_videofile 제외)"""
+    from moviepy.video.compositing.concatenate import concatenate_videoclips
+
+    for _, question in corpus:
+        with timer.stage("moviepy.clip_composition"):
+            clips = [
+                video_generator.create_intro_clip(question),
+                video_generator.create_question_clip(question),
+                video_generator.create_answer_clip(question),
+                video_generator.create_account_clip(),
+            ]
+            final_clip = concatenate_videoclips(clips, method="compose")
+        final_clip.close()
+        for clip in clips:
+            clip.close()
+
+
+def benchmark_audio(timer: StageTimer, repeat: int, work_dir: str):
+    """오디오 믹싱 + 오디오 베드 AAC 인코딩"""
+    for index in range(repeat):
+        video_generator.load_sound.cache_clear()
+        with timer.stage("audio.mix.cold"):
+            track = video_generator.build_audio_track()
+        with timer.stage("audio.mix.warm"):
+            video_generator.build_audio_track()
+        if track is not None:
+            with timer.stage("audio.encode_bed"):
+                encode_audio(track, os.path.join(work_dir, f"bed_{index}.m4a"))
+
+
+def benchmark_encoding(timer: StageTimer, corpus: list[tuple[str, QuizQuestion]], samples: int, work_dir: str, moviepy: bool):
+    """영상 인코딩 (ffmpeg 엔진 메모리 출력, 선택 시 MoviePy write_videofile)"""
+    if samples <= 0:
+        return
+    # 아웃트로/인트로 세그먼트, 오디오 베드는 미리 준비 (요청 처리 시와 같은 상태)
+    video_generator.warm_up_assets()
+    for _, question in corpus[:samples]:
+        if video_generator.SEGMENT_CACHE_ENABLED:
+            video_generator.get_intro_segment(question)
+        with timer.stage("encode.ffmpeg"):
+            video_generator.generate_quiz_video(question, engine="ffmpeg")
+        if moviepy:
+            output_path = os.path.join(work_dir, f"moviepy_{question.id}.mp4")
+            with timer.stage("encode.moviepy_write_videofile"):
+                video_generator.generate_quiz_video(question, output_path, engine="moviepy")
+
+
+def _send_frames_pickled(question: QuizQuestion, queue, started):
+    """렌더러 프로세스: 프레임을 모두 렌더링한 뒤 numpy 배열로 큐에 전달 (pickle)"""
+    frames = [(video_generator.pil_to_numpy(frame), repeat) for frame, repeat in video_generator.build_frame_runs(question)]
+    started.set()
+    for item in frames:
+        queue.put(item)
+    queue.put(None)
+
+
+def _send_frames_ring(question: QuizQuestion, ring: FrameRing, started):
+    """렌더러 프로세스: 프레임을 모두 렌더링한 뒤 FrameRing 슬롯으로 전달"""
+    frames = [(video_generator.pil_to_numpy(frame), repeat) for frame, repeat in video_generator.build_frame_runs(question)]
+    started.set()
+    for frame, repeat in frames:
+        ring.write(frame, repeat)
+    ring.finish()
+
+
+def _render_into_ring_warm(question: QuizQuestion, ring: FrameRing, started):
+    """렌더러 프로세스: 에셋을 미리 로드한 뒤 렌더링하는 대로 FrameRing에 쓰기"""
+    frame_renderer.preload_assets()
+    started.set()
+    video_generator.render_into_ring(ring, question)
+
+
+def benchmark_frame_handoff(timer: StageTimer, corpus: list[tuple[str, QuizQuestion]], samples: int):
+    """
+    렌더러 프로세스 → 인코더 프로세스 프레임 전달
+    handoff.*: 미리 렌더링한 영상 한 편 분량 프레임 전달 시간 (pickle 큐 vs 공유 메모리 링)
+    encode.ffmpeg.*: 같은 프로세스에서 렌더링 후 인코딩 vs 렌더러 프로세스가 링에 쓰는 동안 인코딩
+    """
+    if samples <= 0:
+        return
+    ctx = multiprocessing.get_context("spawn")
+    video_generator.warm_up_assets()
+    for _, question in corpus[:samples]:
+        queue, started = ctx.Queue(), ctx.Event()
+        sender = ctx.Process(target=_send_frames_pickled, args=(question, queue, started))
+        sender.start()
+        started.wait()
+        with timer.stage("handoff.pickle_queue"):
+            while queue.get() is not None:
+                pass
+        sender.join()
+
+        with FrameRing(frame_renderer.WIDTH, frame_renderer.HEIGHT, ctx=ctx) as ring:
+            started = ctx.Event()
+            sender = ctx.Process(target=_send_frames_ring, args=(question, ring, started))
+            sender.start()
+            started.wait()
+            with timer.stage("handoff.frame_ring"):
+                for _ in ring.runs():
+                    pass
+            sender.join()
+
+        with timer.stage("encode.ffmpeg.inline"):
+            encode_frames(
+                video_generator.build_frame_runs(question),
+                None,
+                width=frame_renderer.WIDTH,
+                height=frame_renderer.HEIGHT,
+                fps=video_generator.FPS,
+                audio=video_generator.get_audio_input(),
+                preset=video_generator.VIDEO_PRESET,
+                threads=video_generator.VIDEO_THREADS,
+                memory_format=video_generator.VIDEO_MEMORY_FORMAT,
+                encode_mode=video_generator.VIDEO_ENCODE_MODE,
+            )
+
+        with FrameRing(frame_renderer.WIDTH, frame_renderer.HEIGHT, ctx=ctx) as ring:
+            started = ctx.Event()
+            renderer = ctx.Process(target=_render_into_ring_warm, args=(question, ring, started))
+            renderer.start()
+            started.wait()
+            with timer.stage("encode.ffmpeg.frame_ring"):
+                video_generator.encode_from_ring(ring)
+            renderer.join()
+
+
+def git_revision() -> str | None:
+    """현재 커밋 (git 저장소가 아니면 None)"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SCRIPT_DIR, capture_output=True, text=True, check=True,
+        )
+        return result.stdout.strip()
+    except Exception:
+        return None
+
+
+def print_summary(stages: dict, baseline: dict | None):
+    """단계별 결과 출력 (baseline이 있으면 변화율 포함)"""
+    header = f"{'단계':<36} {'횟수':>5} {'평균(ms)':>10} {'p95(ms)':>10}"
+    if baseline:
+        header += f" {'이전(ms)':>10} {'변화':>8}"
+    print(header)
+    for name, stats in stages.items():
+        line = f"{name:<36} {stats['count']:>5} {stats['mean_ms']:>10.2f} {stats['p95_ms']:>10.2f}"
+        if baseline:
+            previous = baseline.get(name)
+            if previous:
+                change = (stats["mean_ms"] - previous["mean_ms"]) / previous["mean_ms"] * 100
+                line += f" {previous['mean_ms']:>10.2f} {change:>+7.1f}%"
+            else:
+                line += f" {'-':>10} {'-':>8}"
+        print(line)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="렌더링 단계별 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3, help="렌더링 단계 반복 횟수")
+    parser.add_argument("--encode-samples", type=int, default=1, help="인코딩까지 측정할 문제 수 (0이면 생략)")
+    parser.add_argument("--moviepy", action="store_true", help="MoviePy write_videofile도 측정 (느림)")
+    parser.add_argument("--handoff-samples", type=int, default=1, help="프로세스 간 프레임 전달까지 측정할 문제 수 (0이면 생략)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표준 출력만)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    timer = StageTimer()
+
+    print(f"🎬 합성 문제 {len(corpus)}개로 측정 시작...")
+    frame_renderer.resolve_fonts()
+    benchmark_assets(timer, args.repeat)
+    frame_renderer.preload_assets()
+    benchmark_frames(timer, corpus, args.repeat)
+    benchmark_clip_composition(timer, corpus)
+    with tempfile.TemporaryDirectory() as work_dir:
+        benchmark_audio(timer, args.repeat, work_dir)
+        benchmark_encoding(timer, corpus, args.encode_samples, work_dir, args.moviepy)
+    benchmark_frame_handoff(timer, corpus, args.handoff_samples)
+
+    result = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": {
+            "repeat": args.repeat,
+            "encode_samples": args.encode_samples,
+            "handoff_samples": args.handoff_samples,
+            "video_engine": video_generator.VIDEO_ENGINE,
+            "encode_mode": video_generator.VIDEO_ENCODE_MODE,
+            "segment_cache": video_generator.SEGMENT_CACHE_ENABLED,
+            "fonts": {str(bold): source[0] if source else None for bold, source in frame_renderer.resolve_fonts().items()},
+        },
+        "corpus": [name for name, _ in corpus],
+        "stages": timer.summary(),
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f).get("stages")
+
+    print()
+    print_summary(result["stages"], baseline)
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
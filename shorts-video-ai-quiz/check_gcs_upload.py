@@ -0,0 +1,183 @@
+"""
+GCS 업로드 확인 스크립트 (로컬 가짜 GCS 서버 사용, 실제 버킷/인증 불필요)
+StorageManager의 청크 단위 업로드(open_video_upload → GCSStorage.save_stream)가
+- 끝까지 쓰면 resumable upload로 나눠 올린 뒤 같은 내용의 블롭을 만드는지
+- 중간에 abort()하면 업로드 세션을 취소(DELETE)하고 블롭을 만들지 않는지
+- save_video_async가 응답을 기다리게 하지 않고 콜백으로 완료를 알리는지
+확인
+
+STORAGE_EMULATOR_HOST가 없으면 gcp-storage-emulator를 이 프로세스 안에서 메모리 모드로 띄움
+(pip install gcp-storage-emulator)
+
+사용법:
+    python check_gcs_upload.py
+    STORAGE_EMULATOR_HOST=http://localhost:9023 python check_gcs_upload.py   # 이미 떠 있는 가짜 서버 사용
+"""
+
+import os
+import socket
+import sys
+import threading
+from concurrent.futures import Future
+
+from models import QuizQuestion, QuizType
+
+CHECK_BUCKET = "quiz-video-check"
+
+CHECK_QUESTION = QuizQuestion(
+    id=1,
+    question="勉強",
+    options=["공부", "운동", "독서", "여행"],
+    correct_answer="공부",
+    explanation="勉(힘쓸 면) + 強(강할 강) = 공부하다",
+    jlpt_level=3,
+    quiz_type=QuizType.JP_TO_KR,
+)
+
+
+def start_emulator():
+    """gcp-storage-emulator를 빈 포트에서 메모리 모드로 시작 (반환한 서버는 끝나면 stop() 호출)"""
+    try:
+        from gcp_storage_emulator.server import create_server
+    except ImportError:
+        print("❌ gcp-storage-emulator가 설치되지 않았습니다. pip install gcp-storage-emulator 를 실행하거나")
+        print("   STORAGE_EMULATOR_HOST로 실행 중인 가짜 GCS 서버 주소를 지정해주세요.")
+        sys.exit(1)
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = create_server("127.0.0.1", port, in_memory=True)
+    server.start()
+    os.environ["STORAGE_EMULATOR_HOST"] = f"http://127.0.0.1:{port}"
+    return server
+
+
+def payload(size: int) -> list[bytes]:
+    """size 바이트를 1MB 청크로 나눈 테스트 데이터 (청크마다 내용이 다름)"""
+    chunk_size = 1024 * 1024
+    return [bytes([index % 251]) * min(chunk_size, size - offset) for index, offset in enumerate(range(0, size, chunk_size))]
+
+
+def check_complete_upload(manager, requests_log: list[tuple[str, str]]) -> list[str]:
+    """끝까지 쓴 업로드: 여러 번 나눠 전송 + 같은 내용의 블롭"""
+    import storage
+
+    chunks = payload(storage.GCS_UPLOAD_CHUNK_SIZE * 2 + 123)
+    requests_log.clear()
+    upload = manager.open_video_upload(CHECK_QUESTION, force=True)
+    for chunk in chunks:
+        upload.write(chunk)
+    upload.close()
+    url = upload.future.result(timeout=60)
+
+    errors = []
+    blob_name = url.removeprefix(f"gs://{CHECK_BUCKET}/")
+    data = manager.storage.bucket.blob(blob_name).download_as_bytes()
+    if data != b"".join(chunks):
+        errors.append(f"블롭 내용이 다름 ({len(data)} != {sum(map(len, chunks))} 바이트)")
+    puts = sum(1 for method, _ in requests_log if method == "PUT")
+    if puts < 2:
+        errors.append(f"resumable upload로 나눠 전송하지 않음 (PUT {puts}회)")
+    return errors
+
+
+def check_aborted_upload(manager, requests_log: list[tuple[str, str]]) -> list[str]:
+    """
+    중간에 취소한 업로드: 세션 취소(DELETE) + 블롭 없음 + future는 예외
+    (gcp-storage-emulator는 세션 DELETE를 구현하지 않으므로 요청을 보냈는지만 확인)
+    """
+    import storage
+
+    question = CHECK_QUESTION.model_copy(update={"id": 2})
+    requests_log.clear()
+    upload = manager.open_video_upload(question, force=True)
+    # 첫 청크 전송(세션 생성)까지 진행된 뒤 취소
+    for chunk in payload(storage.GCS_UPLOAD_CHUNK_SIZE + 123):
+        upload.write(chunk)
+    upload.abort()
+
+    errors = []
+    try:
+        upload.future.result(timeout=60)
+        errors.append("취소한 업로드가 성공으로 끝남")
+    except Exception:
+        pass
+    if not any(method == "PUT" for method, _ in requests_log):
+        errors.append("취소 전에 청크를 전송하지 않음 (세션 취소를 확인할 수 없음)")
+    if not any(method == "DELETE" for method, _ in requests_log):
+        errors.append("업로드 세션을 취소(DELETE)하지 않음")
+    filename = manager._video_filename(question)
+    if manager.storage.bucket.blob(f"{manager.storage.prefix}/{filename}").exists():
+        errors.append("취소한 업로드의 블롭이 만들어짐")
+    return errors
+
+
+def check_async_save(manager) -> list[str]:
+    """save_video_async: 바로 반환 + 완료 콜백 + 저장된 블롭"""
+    question = CHECK_QUESTION.model_copy(update={"id": 3})
+    data = b"".join(payload(3 * 1024 * 1024))
+    done = threading.Event()
+    results: list[Future] = []
+
+    def callback(future: Future):
+        results.append(future)
+        done.set()
+
+    started = manager.save_video_async(data, question, force=True, callback=callback)
+    if started is None:
+        return ["업로드를 시작하지 않음"]
+    url, _ = started
+    errors = []
+    if not done.wait(timeout=60):
+        return ["완료 콜백이 호출되지 않음"]
+    if results[0].exception() is not None:
+        return [f"업로드 실패: {results[0].exception()}"]
+    blob_name = url.removeprefix(f"gs://{CHECK_BUCKET}/")
+    if manager.storage.bucket.blob(blob_name).download_as_bytes() != data:
+        errors.append("블롭 내용이 다름")
+    return errors
+
+
+def main():
+    """메인 함수"""
+    emulator = None if os.getenv("STORAGE_EMULATOR_HOST") else start_emulator()
+    os.environ["STORAGE_TYPE"] = "gcs"
+    os.environ["GCS_BUCKET"] = CHECK_BUCKET
+    print(f"☁️  가짜 GCS 서버: {os.environ['STORAGE_EMULATOR_HOST']}")
+
+    from storage import StorageManager, get_gcs_client
+
+    # 공유 클라이언트의 HTTP 요청 기록 (메서드, URL)
+    requests_log: list[tuple[str, str]] = []
+    get_gcs_client()._http.hooks["response"].append(
+        lambda response, *args, **kwargs: requests_log.append((response.request.method, response.request.url))
+    )
+
+    manager = StorageManager()
+    checks = {
+        "청크 단위 업로드 완료": lambda: check_complete_upload(manager, requests_log),
+        "청크 단위 업로드 취소": lambda: check_aborted_upload(manager, requests_log),
+        "비동기 저장 + 완료 콜백": lambda: check_async_save(manager),
+    }
+    failed = 0
+    for name, check in checks.items():
+        try:
+            errors = check()
+        except Exception as e:
+            errors = [f"{type(e).__name__}: {e}"]
+        if errors:
+            failed += 1
+            print(f"❌ {name}")
+            for error in errors:
+                print(f"   - {error}")
+        else:
+            print(f"✅ {name}")
+    manager.shutdown()
+    if emulator is not None:
+        emulator.stop()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Emoji Atlas - 이모지 PNG를 한 번만 디코딩해서 크기별 RGBA 시트로 보관
+자주 쓰는 크기는 시트에서 잘라 쓰고, 그 외 크기는 제한된 LRU 캐시에 보관 (스레드 안전)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+# 시트에 없는 크기의 이모지 최대 캐시 수
+EMOJI_CACHE_SIZE = 128
+
+# 파일명에서 제외하는 문자 (Variation Selector, Zero Width Joiner)
+IGNORED_CODE_POINTS = (0xFE0F, 0x200D)
+
+
+def emoji_filename(emoji_char: str) -> str:
+    """이모지 문자를 파일명(U1F1EFU1F1F5)으로 변환 (Variation Selector/ZWJ 제외)"""
+    return "".join(f"U{ord(c):04X}" for c in emoji_char if ord(c) not in IGNORED_CODE_POINTS)
+
+
+class EmojiSheet:
+    """한 크기의 이모지를 가로로 이어 붙인 RGBA 시트"""
+
+    def __init__(self, size: int, originals: dict[str, Image.Image]):
+        self.size = size
+        self.boxes: dict[str, tuple[int, int, int, int]] = {}
+        self.image = Image.new("RGBA", (max(1, size * len(originals)), size), (0, 0, 0, 0))
+        for index, (name, original) in enumerate(sorted(originals.items())):
+            tile = _resize(original, size)
+            x = index * size
+            self.image.paste(tile, (x, 0))
+            self.boxes[name] = (x, 0, x + tile.width, tile.height)
+
+    def crop(self, name: str) -> Image.Image | None:
+        """시트에서 이모지 한 개 잘라내기 (없으면 None)"""
+        box = self.boxes.get(name)
+        if box is None:
+            return None
+        return self.image.crop(box)
+
+
+def _resize(original: Image.Image, size: int) -> Image.Image:
+    """크기 조절 (비율 유지)"""
+    img = original.copy()
+    img.thumbnail((size, size), Image.Resampling.LANCZOS)
+    return img
+
+
+class EmojiAtlas:
+    """
+    이모지 에셋 캐시
+    - load(): EMOJIS_DIR의 PNG를 모두 디코딩하고 sheet_sizes 크기별 시트 생성
+    - get(): 시트 크기는 시트에서, 그 외 크기는 LRU 캐시에서 반환
+    """
+
+    def __init__(self, emojis_dir: Path, sheet_sizes: list[int], max_entries: int = EMOJI_CACHE_SIZE):
+        self.emojis_dir = Path(emojis_dir)
+        self.sheet_sizes = sorted(set(sheet_sizes))
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._originals: dict[str, Image.Image] | None = None
+        self._sheets: dict[int, EmojiSheet] = {}
+        self._resized: OrderedDict[tuple[str, int], Image.Image] = OrderedDict()
+        self._missing: set[str] = set()
+
+        # 통계
+        self._sheet_hits = 0
+        self._cache_hits = 0
+        self._misses = 0
+
+    def _load_originals(self) -> dict[str, Image.Image]:
+        """원본 PNG 디코딩 (lock 안에서 호출)"""
+        if self._originals is None:
+            originals = {}
+            if self.emojis_dir.exists():
+                for emoji_path in sorted(self.emojis_dir.glob("*.png")):
+                    try:
+                        with Image.open(emoji_path) as img:
+                            # RGBA 모드로 변환 (투명도 지원)
+                            originals[emoji_path.stem] = img.convert("RGBA")
+                    except Exception as e:
+                        logger.error(f"이모지 이미지 로드 실패 {emoji_path.name}: {e}")
+            self._originals = originals
+        return self._originals
+
+    def _get_sheet(self, size: int) -> EmojiSheet:
+        """크기별 시트 (lock 안에서 호출, 없으면 생성)"""
+        sheet = self._sheets.get(size)
+        if sheet is None:
+            sheet = EmojiSheet(size, self._load_originals())
+            self._sheets[size] = sheet
+        return sheet
+
+    def load(self):
+        """원본 디코딩 + 자주 쓰는 크기의 시트 미리 생성 (워커 시작 시 호출)"""
+        with self._lock:
+            for size in self.sheet_sizes:
+                self._get_sheet(size)
+
+    def get(self, emoji_char: str, size: int) -> Image.Image | None:
+        """
+        크기 조절된 이모지 이미지 반환 (RGBA, 캐시된 이미지일 수 있으므로 읽기 전용으로 사용)
+        이미지 파일이 없으면 None
+        """
+        name = emoji_filename(emoji_char)
+        with self._lock:
+            originals = self._load_originals()
+            if name not in originals:
+                self._misses += 1
+                if name not in self._missing:
+                    self._missing.add(name)
+                    logger.warning(f"이모지 이미지 없음: {emoji_char} ({self.emojis_dir / f'{name}.png'})")
+                return None
+
+            if size in self.sheet_sizes:
+                self._sheet_hits += 1
+                return self._get_sheet(size).crop(name)
+
+            key = (name, size)
+            img = self._resized.get(key)
+            if img is not None:
+                self._cache_hits += 1
+                self._resized.move_to_end(key)
+                return img
+
+            self._misses += 1
+            img = _resize(originals[name], size)
+            self._resized[key] = img
+            if len(self._resized) > self.max_entries:
+                self._resized.popitem(last=False)
+            return img
+
+    def get_stats(self) -> dict:
+        """이모지 캐시 통계"""
+        with self._lock:
+            return {
+                "emojis": len(self._originals or {}),
+                "sheet_sizes": sorted(self._sheets),
+                "sheet_hits": self._sheet_hits,
+                "cache_hits": self._cache_hits,
+                "misses": self._misses,
+                "cache_size": len(self._resized),
+                "max_size": self.max_entries,
+            }
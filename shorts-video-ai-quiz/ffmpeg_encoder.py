@@ -0,0 +1,738 @@
+"""
+FFmpeg Encoder - 렌더링된 프레임을 raw RGB로 ffmpeg 프로세스에 직접 전달하여 인코딩
+MoviePy 클립 합성 없이 고유 프레임만 반복 횟수만큼 파이프로 흘려보냄
+"""
+
+import os
+import math
+import shutil
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+import numpy as np
+from PIL import Image
+
+# 오디오 설정 (MoviePy AudioFileClip 기본값과 동일)
+AUDIO_SAMPLE_RATE = 44100
+AUDIO_CHANNELS = 2
+AUDIO_BITRATE = "128k"
+
+# 메모리 출력 형식
+# faststart: memfd(메모리 파일)에 일반 MP4로 쓰고 moov를 앞으로 이동 (Linux 전용)
+# fragmented: fragmented MP4로 stdout 파이프에 바로 출력
+MEMORY_FORMAT_FASTSTART = "faststart"
+MEMORY_FORMAT_FRAGMENTED = "fragmented"
+FRAGMENTED_MOVFLAGS = "frag_keyframe+empty_moov+default_base_moof"
+
+# 인코딩 모드
+# standard: 반복 프레임까지 fps대로 모두 입력해서 인코딩
+# still: 장면마다 한 장만 입력하고 출력 fps로 복제 (x264 stillimage 튜닝 + 긴 GOP, 복제 프레임은 거의 skip 블록)
+# lowfps: 장면마다 한 장만 인코딩하고 낮은 고정 프레임레이트로 출력 (30fps에서 1초 단위 장면 → 1fps, 23장)
+ENCODE_MODE_STANDARD = "standard"
+ENCODE_MODE_STILL = "still"
+ENCODE_MODE_LOWFPS = "lowfps"
+ENCODE_MODES = (ENCODE_MODE_STANDARD, ENCODE_MODE_STILL, ENCODE_MODE_LOWFPS)
+STILL_GOP_SECONDS = 60  # still/lowfps 모드 키프레임 최대 간격 (장면 전환은 scenecut으로 키프레임)
+
+# 스트리밍 출력 설정
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_FRAGMENT_DURATION = 1.0  # 초
+
+# 출력 종류
+OUTPUT_KIND_VIDEO = "video"  # H.264/AAC MP4 (video_codec_args + 오디오)
+OUTPUT_KIND_ANIMATION = "animation"  # 무음 애니메이션 (WebP/GIF), 구간만 잘라서 출력
+OUTPUT_KIND_IMAGE = "image"  # 한 장 (포스터 JPEG 등)
+
+# (프레임 이미지 또는 raw RGB 버퍼, 반복 프레임 수) - 버퍼는 FrameRing 슬롯처럼 변환 없이 그대로 씀
+FrameRun = tuple[Image.Image | memoryview, int]
+
+
+@dataclass(frozen=True)
+class OutputProfile:
+    """
+    출력 프로필 - encode_profiles()가 프레임을 한 번만 입력받아 프로필별로 동시에 출력
+    크기가 입력과 다르면 비율을 유지해서 줄이고 남는 영역은 pad_color로 채움
+    """
+    name: str
+    kind: str  # OUTPUT_KIND_*
+    width: int
+    height: int
+    format: str  # ffmpeg muxer (mp4, webp, gif, image2)
+    extension: str
+    media_type: str
+    pad_color: str = "black"
+    fps: int | None = None  # 애니메이션 프레임레이트 (video는 인코딩 fps 사용)
+    start: float = 0.0  # 애니메이션/이미지 시작 시각 (초)
+    duration: float | None = None  # 애니메이션 길이 (초, None이면 끝까지)
+    codec_args: tuple[str, ...] = ()  # video 외 출력의 코덱 인자
+
+# 오디오 입력: float32 PCM 배열(파이프로 전달 후 AAC 인코딩) 또는 미리 인코딩된 AAC 파일 경로(그대로 복사)
+AudioInput = np.ndarray | str
+
+
+@lru_cache(maxsize=1)
+def get_ffmpeg_exe() -> str:
+    """
+    ffmpeg 실행 파일 경로 반환
+
+    우선순위:
+    1. FFMPEG_BINARY 환경 변수 (MoviePy와 동일한 변수)
+    2. imageio-ffmpeg 번들 바이너리 (MoviePy 의존성)
+    3. PATH의 ffmpeg
+    """
+    env_binary = os.getenv("FFMPEG_BINARY")
+    if env_binary and env_binary != "auto-detect":
+        return env_binary
+
+    try:
+        import imageio_ffmpeg
+
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        pass
+
+    system_binary = shutil.which("ffmpeg")
+    if system_binary is None:
+        raise RuntimeError("ffmpeg 실행 파일을 찾을 수 없습니다. FFmpeg를 설치해주세요.")
+    return system_binary
+
+
+def decode_audio(
+    path: str,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    channels: int = AUDIO_CHANNELS,
+) -> np.ndarray:
+    """
+    오디오 파일을 float32 PCM 배열로 디코딩
+
+    Returns:
+        np.ndarray: (샘플 수, 채널 수) 모양의 float32 배열 (-1.0 ~ 1.0)
+    """
+    command = [
+        get_ffmpeg_exe(),
+        "-v", "error",
+        "-i", str(path),
+        "-f", "f32le",
+        "-acodec", "pcm_f32le",
+        "-ac", str(channels),
+        "-ar", str(sample_rate),
+        "pipe:1",
+    ]
+    result = subprocess.run(command, capture_output=True, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"오디오 디코딩 실패 {path}: {result.stderr.decode(errors='ignore').strip()}")
+    return np.frombuffer(result.stdout, dtype=np.float32).reshape(-1, channels)
+
+
+def encode_audio(
+    samples: np.ndarray,
+    output_path: str,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    bitrate: str = AUDIO_BITRATE,
+):
+    """
+    float32 PCM 배열을 AAC(m4a) 파일로 인코딩
+    영상 인코딩 시 -c:a copy로 그대로 mux할 수 있도록 미리 만들어두는 용도
+    """
+    command = [
+        get_ffmpeg_exe(),
+        "-y",
+        "-v", "error",
+        "-f", "f32le",
+        "-ar", str(sample_rate),
+        "-ac", str(samples.shape[1]),
+        "-i", "pipe:0",
+        "-c:a", "aac",
+        "-b:a", bitrate,
+        "-f", "mp4",
+        output_path,
+    ]
+    pcm_bytes = np.ascontiguousarray(samples, dtype=np.float32).tobytes()
+    result = subprocess.run(command, input=pcm_bytes, capture_output=True, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"오디오 인코딩 실패 {output_path}: {result.stderr.decode(errors='ignore').strip()}")
+
+
+def _write_and_close(fd: int, data: bytes):
+    """파이프에 데이터를 모두 쓰고 닫기 (오디오 입력용 스레드)"""
+    try:
+        with os.fdopen(fd, "wb") as pipe:
+            pipe.write(data)
+    except BrokenPipeError:
+        # ffmpeg가 먼저 종료된 경우 - 종료 코드로 에러 처리
+        pass
+
+
+def _drain(stream, chunks: list[bytes]):
+    """stderr를 계속 읽어 파이프가 가득 차서 멈추는 것을 방지"""
+    for line in iter(stream.readline, b""):
+        chunks.append(line)
+    stream.close()
+
+
+def _collect(stream, chunks: list[bytes]):
+    """stdout으로 출력되는 영상 데이터 수집"""
+    for chunk in iter(lambda: stream.read(64 * 1024), b""):
+        chunks.append(chunk)
+    stream.close()
+
+
+def _read_memfd(fd: int) -> bytes:
+    """memfd 내용을 처음부터 모두 읽고 닫기"""
+    os.lseek(fd, 0, os.SEEK_SET)
+    with os.fdopen(fd, "rb") as f:
+        return f.read()
+
+
+def video_codec_args(
+    preset: str,
+    threads: int,
+    encode_mode: str = ENCODE_MODE_STANDARD,
+    fps: int | None = None,
+) -> list[str]:
+    """
+    H.264 인코딩 인자
+    미리 인코딩한 세그먼트와 문제별 세그먼트를 스트림 복사로 이어 붙이려면 같은 인자로 인코딩해야 함
+
+    Args:
+        encode_mode: 인코딩 모드 (still/lowfps는 정지 화면용 튜닝, still은 fps로 복제 출력)
+        fps: 출력 FPS (still/lowfps 모드에서 GOP 길이, still 모드에서 출력 프레임레이트)
+    """
+    command = [
+        "-c:v", "libx264",
+        "-preset", preset,
+        "-pix_fmt", "yuv420p",
+        "-threads", str(threads),
+    ]
+    if encode_mode in (ENCODE_MODE_STILL, ENCODE_MODE_LOWFPS):
+        command += ["-tune", "stillimage", "-g", str((fps or 1) * STILL_GOP_SECONDS)]
+    if encode_mode == ENCODE_MODE_STILL:
+        command += ["-r", str(fps)]
+    return command
+
+
+def _collapse_runs(
+    runs: Iterable[FrameRun],
+    fps: int,
+    encode_mode: str,
+    repeat_step: int | None = None,
+) -> tuple[Iterable[FrameRun], str]:
+    """
+    인코딩 모드에 맞게 입력 프레임 수와 입력 프레임레이트 결정
+    still/lowfps 모드는 반복 프레임 수의 최대공약수(fps 포함)만큼 묶어 한 장으로 입력
+    (예: 30fps에서 1초 단위 장면 → 1fps 입력, 23초 영상이 23장)
+    runs가 리스트가 아니면(FrameRing 등 지연 입력) 미리 볼 수 없으므로 repeat_step으로 묶음 (None이면 묶지 않음)
+
+    Returns:
+        tuple: (입력할 (프레임, 반복 수) 목록, 입력 프레임레이트)
+    """
+    if encode_mode == ENCODE_MODE_STANDARD:
+        return runs, str(fps)
+    if isinstance(runs, list):
+        if not runs:
+            return runs, str(fps)
+        step = math.gcd(fps, *(repeat for _, repeat in runs))
+        return [(frame, repeat // step) for frame, repeat in runs], f"{fps}/{step}"
+    step = math.gcd(fps, repeat_step or 1)
+    return ((frame, repeat // step) for frame, repeat in runs), f"{fps}/{step}"
+
+
+def _audio_input_args(audio: AudioInput | None, sample_rate: int, audio_fd: int | None) -> list[str]:
+    """두 번째 입력(오디오) 인자 - PCM 배열은 audio_fd 파이프, AAC 파일은 경로로 입력"""
+    if isinstance(audio, str):
+        # 오디오 입력: 미리 인코딩된 AAC 파일
+        return ["-i", audio]
+    if audio is not None:
+        # 오디오 입력: 별도 파이프로 미리 믹싱된 float32 PCM
+        return [
+            "-f", "f32le",
+            "-ar", str(sample_rate),
+            "-ac", str(audio.shape[1]),
+            "-i", f"pipe:{audio_fd}",
+        ]
+    return []
+
+
+def _audio_output_args(audio: AudioInput | None, video_map: str = "0:v:0") -> list[str]:
+    """오디오 출력 인자 - AAC 파일은 다시 인코딩하지 않고 복사"""
+    if audio is None:
+        return ["-an"]
+    command = ["-map", video_map, "-map", "1:a:0"]
+    if isinstance(audio, str):
+        return command + ["-c:a", "copy"]
+    return command + ["-c:a", "aac", "-b:a", AUDIO_BITRATE]
+
+
+def _encoder_command(
+    width: int,
+    height: int,
+    fps: int,
+    preset: str,
+    threads: int,
+    audio: AudioInput | None,
+    sample_rate: int,
+    audio_fd: int | None,
+    encode_mode: str = ENCODE_MODE_STANDARD,
+    input_rate: str | None = None,
+) -> list[str]:
+    """
+    raw RGB(stdin) + 오디오 입력 → H.264/AAC 인코딩 명령 (출력 인자 제외)
+    오디오가 PCM 배열이면 audio_fd 파이프로 받아 AAC 인코딩, AAC 파일 경로면 다시 인코딩하지 않고 복사
+    """
+    command = [
+        get_ffmpeg_exe(),
+        "-y",
+        "-v", "error",
+        # 비디오 입력: stdin으로 raw RGB 프레임
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{width}x{height}",
+        "-r", input_rate or str(fps),
+        "-i", "pipe:0",
+    ]
+    command += _audio_input_args(audio, sample_rate, audio_fd)
+    command += video_codec_args(preset, threads, encode_mode, fps)
+    command += _audio_output_args(audio)
+    return command
+
+
+def _output_args(output_path: str | None, memory_format: str) -> tuple[list[str], int | None, int]:
+    """
+    출력 인자 결정
+
+    Returns:
+        tuple: (출력 인자, memfd - faststart 메모리 출력일 때, stdout 대상)
+    """
+    if output_path is not None:
+        return [output_path], None, subprocess.DEVNULL
+    if memory_format == MEMORY_FORMAT_FASTSTART and hasattr(os, "memfd_create"):
+        # faststart는 moov 이동을 위해 다시 읽을 수 있는(seek 가능한) 출력이 필요 → memfd 사용
+        memfd = os.memfd_create("quiz_video")
+        return ["-movflags", "+faststart", "-f", "mp4", f"/dev/fd/{memfd}"], memfd, subprocess.DEVNULL
+    return ["-movflags", FRAGMENTED_MOVFLAGS, "-f", "mp4", "pipe:1"], None, subprocess.PIPE
+
+
+def _write_frames(stdin, runs: Iterable[FrameRun]):
+    """프레임을 stdin에 쓰고 닫기 - 같은 프레임은 한 번만 바이트로 변환 (raw RGB 버퍼는 그대로)"""
+    try:
+        for frame, repeat in runs:
+            if isinstance(frame, Image.Image):
+                if frame.mode != "RGB":
+                    frame = frame.convert("RGB")
+                frame_bytes = frame.tobytes()
+            else:
+                frame_bytes = frame
+            for _ in range(repeat):
+                stdin.write(frame_bytes)
+    except (BrokenPipeError, ValueError):
+        # ffmpeg가 먼저 종료됐거나 스트림이 중단된 경우 - 종료 코드로 에러 처리
+        pass
+    finally:
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def _start_encoder(
+    runs: Iterable[FrameRun],
+    command: list[str],
+    audio: AudioInput | None,
+    audio_fds: tuple[int, int] | None,
+    extra_fds: list[int],
+    stdout_target,
+    write_frames_in_thread: bool,
+) -> tuple[subprocess.Popen, list[threading.Thread], list[bytes]]:
+    """
+    ffmpeg 프로세스와 보조 스레드(stderr 수집, 오디오 쓰기, 필요 시 프레임 쓰기) 시작
+
+    Returns:
+        tuple: (프로세스, 보조 스레드 목록, stderr 청크 목록)
+    """
+    pass_fds = list(extra_fds)
+    if audio_fds is not None:
+        pass_fds.append(audio_fds[0])
+
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=stdout_target,
+            stderr=subprocess.PIPE,
+            pass_fds=pass_fds,
+        )
+    except Exception:
+        for fd in (*(audio_fds or ()), *extra_fds):
+            os.close(fd)
+        raise
+
+    stderr_chunks: list[bytes] = []
+    workers = [threading.Thread(target=_drain, args=(process.stderr, stderr_chunks), daemon=True)]
+    if audio_fds is not None:
+        audio_read_fd, audio_write_fd = audio_fds
+        # 자식 프로세스에 넘긴 읽기 쪽은 부모에서 닫아야 EOF가 전달됨
+        os.close(audio_read_fd)
+        audio_bytes = np.ascontiguousarray(audio, dtype=np.float32).tobytes()
+        workers.append(threading.Thread(target=_write_and_close, args=(audio_write_fd, audio_bytes), daemon=True))
+    if write_frames_in_thread:
+        workers.append(threading.Thread(target=_write_frames, args=(process.stdin, runs), daemon=True))
+    for worker in workers:
+        worker.start()
+    return process, workers, stderr_chunks
+
+
+def _raise_on_failure(return_code: int, stderr_chunks: list[bytes]):
+    """ffmpeg 종료 코드 확인"""
+    if return_code != 0:
+        error_message = b"".join(stderr_chunks).decode(errors="ignore").strip()
+        raise RuntimeError(f"ffmpeg 인코딩 실패 (code={return_code}): {error_message}")
+
+
+def _finish_encoder(
+    process: subprocess.Popen,
+    workers: list[threading.Thread],
+    stderr_chunks: list[bytes],
+    runs: Iterable[FrameRun],
+    output_path: str | None,
+    memfd: int | None,
+    stdout_target,
+) -> bytes | None:
+    """프레임을 모두 쓰고 ffmpeg 종료를 기다린 뒤 출력 반환 (output_path가 있으면 None)"""
+    output_chunks: list[bytes] = []
+    if stdout_target == subprocess.PIPE:
+        collector = threading.Thread(target=_collect, args=(process.stdout, output_chunks), daemon=True)
+        collector.start()
+        workers.append(collector)
+
+    try:
+        _write_frames(process.stdin, runs)
+    except Exception:
+        # 지연 입력(FrameRing 등)이 실패하면 일부만 인코딩된 출력을 버림
+        process.kill()
+        process.wait()
+        if memfd is not None:
+            os.close(memfd)
+        raise
+
+    return_code = process.wait()
+    for worker in workers:
+        worker.join()
+
+    if return_code != 0 and memfd is not None:
+        os.close(memfd)
+    _raise_on_failure(return_code, stderr_chunks)
+
+    if output_path is not None:
+        return None
+    if memfd is not None:
+        return _read_memfd(memfd)
+    return b"".join(output_chunks)
+
+
+def encode_frames(
+    runs: Iterable[FrameRun],
+    output_path: str | None,
+    width: int,
+    height: int,
+    fps: int,
+    audio: AudioInput | None = None,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    preset: str = "medium",
+    threads: int = 4,
+    memory_format: str = MEMORY_FORMAT_FASTSTART,
+    encode_mode: str = ENCODE_MODE_STANDARD,
+    repeat_step: int | None = None,
+) -> bytes | None:
+    """
+    프레임 목록을 ffmpeg로 직접 인코딩 (H.264 + AAC MP4)
+
+    Args:
+        runs: (프레임, 반복 프레임 수) 목록 - 같은 프레임은 한 번만 변환해서 반복 전송
+            (FrameRing.runs()처럼 지연 입력이면 받는 대로 전송)
+        output_path: 출력 파일 경로 (None이면 디스크를 거치지 않고 메모리로 출력)
+        width, height: 프레임 크기
+        fps: 출력 FPS
+        audio: (샘플 수, 채널 수) float32 PCM 또는 미리 인코딩된 AAC 파일 경로 (None이면 무음 영상)
+        sample_rate: 오디오 샘플레이트
+        preset: libx264 프리셋
+        threads: 인코딩 스레드 수
+        memory_format: 메모리 출력 형식 ("faststart" / "fragmented")
+        encode_mode: 인코딩 모드 ("standard" / "still" / "lowfps")
+        repeat_step: runs가 지연 입력일 때 모든 반복 프레임 수의 공약수 (still/lowfps 모드에서 입력 프레임 수를 줄임)
+
+    Returns:
+        bytes | None: output_path가 None이면 영상 바이트 데이터, 아니면 None
+
+    Raises:
+        ValueError: 알 수 없는 인코딩 모드
+    """
+    if encode_mode not in ENCODE_MODES:
+        raise ValueError(f"알 수 없는 인코딩 모드: {encode_mode} (사용 가능: {', '.join(ENCODE_MODES)})")
+    runs, input_rate = _collapse_runs(runs, fps, encode_mode, repeat_step)
+    audio_fds = os.pipe() if isinstance(audio, np.ndarray) else None
+    command = _encoder_command(
+        width, height, fps, preset, threads, audio, sample_rate, audio_fds[0] if audio_fds else None,
+        encode_mode, input_rate,
+    )
+
+    output_args, memfd, stdout_target = _output_args(output_path, memory_format)
+    command += output_args
+    extra_fds = [memfd] if memfd is not None else []
+
+    process, workers, stderr_chunks = _start_encoder(
+        runs, command, audio, audio_fds, extra_fds, stdout_target, write_frames_in_thread=False
+    )
+    return _finish_encoder(process, workers, stderr_chunks, runs, output_path, memfd, stdout_target)
+
+
+def concat_segments(
+    segment_paths: list[str],
+    output_path: str | None,
+    audio: AudioInput | None = None,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    memory_format: str = MEMORY_FORMAT_FASTSTART,
+) -> bytes | None:
+    """
+    같은 인자(video_codec_args)로 인코딩한 영상 세그먼트를 다시 인코딩하지 않고 이어 붙이고 오디오를 mux
+    (concat demuxer + 스트림 복사)
+
+    Args:
+        segment_paths: 이어 붙일 MP4 세그먼트 경로 (재생 순서대로)
+        output_path: 출력 파일 경로 (None이면 메모리로 출력)
+        audio: 전체 길이 오디오 - float32 PCM 또는 미리 인코딩된 AAC 파일 경로 (None이면 무음 영상)
+        sample_rate: 오디오 샘플레이트
+        memory_format: 메모리 출력 형식 ("faststart" / "fragmented")
+
+    Returns:
+        bytes | None: output_path가 None이면 영상 바이트 데이터, 아니면 None
+    """
+    # concat demuxer 목록 파일은 첫 세그먼트 옆에 작성
+    list_fd, list_path = tempfile.mkstemp(suffix=".txt", dir=os.path.dirname(segment_paths[0]) or None)
+    with os.fdopen(list_fd, "w") as list_file:
+        for segment_path in segment_paths:
+            escaped = os.path.abspath(segment_path).replace("'", "'\\''")
+            list_file.write(f"file '{escaped}'\n")
+
+    try:
+        audio_fds = os.pipe() if isinstance(audio, np.ndarray) else None
+        command = [
+            get_ffmpeg_exe(),
+            "-y",
+            "-v", "error",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", list_path,
+        ]
+        command += _audio_input_args(audio, sample_rate, audio_fds[0] if audio_fds else None)
+        command += ["-c:v", "copy"]
+        command += _audio_output_args(audio)
+
+        output_args, memfd, stdout_target = _output_args(output_path, memory_format)
+        command += output_args
+        extra_fds = [memfd] if memfd is not None else []
+
+        process, workers, stderr_chunks = _start_encoder(
+            [], command, audio, audio_fds, extra_fds, stdout_target, write_frames_in_thread=False
+        )
+        return _finish_encoder(process, workers, stderr_chunks, [], output_path, memfd, stdout_target)
+    finally:
+        os.remove(list_path)
+
+
+def iter_encode_frames(
+    runs: list[FrameRun],
+    width: int,
+    height: int,
+    fps: int,
+    audio: AudioInput | None = None,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    preset: str = "medium",
+    threads: int = 4,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    fragment_duration: float = STREAM_FRAGMENT_DURATION,
+    encode_mode: str = ENCODE_MODE_STANDARD,
+) -> Iterator[bytes]:
+    """
+    프레임 목록을 fragmented MP4로 인코딩하면서 출력되는 대로 청크 단위로 반환 (스트리밍용)
+
+    프레임 쓰기는 별도 스레드에서 진행하고, 호출 측은 ffmpeg stdout을 읽는 즉시 청크를 받음.
+    제너레이터를 중간에 닫으면 (클라이언트 연결 종료 등) ffmpeg 프로세스도 종료함.
+
+    Args:
+        chunk_size: 한 번에 읽을 최대 바이트 수
+        fragment_duration: fragment 최대 길이 (초) - 짧을수록 첫 바이트가 빨리 나감
+        (나머지 인자는 encode_frames와 동일)
+    """
+    runs, input_rate = _collapse_runs(runs, fps, encode_mode)
+    audio_fds = os.pipe() if isinstance(audio, np.ndarray) else None
+    command = _encoder_command(
+        width, height, fps, preset, threads, audio, sample_rate, audio_fds[0] if audio_fds else None,
+        encode_mode, input_rate,
+    )
+    command += [
+        "-movflags", FRAGMENTED_MOVFLAGS,
+        "-frag_duration", str(int(fragment_duration * 1_000_000)),
+        "-f", "mp4",
+        "pipe:1",
+    ]
+
+    process, workers, stderr_chunks = _start_encoder(
+        runs, command, audio, audio_fds, [], subprocess.PIPE, write_frames_in_thread=True
+    )
+    completed = False
+    try:
+        while True:
+            chunk = process.stdout.read1(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        completed = True
+    finally:
+        if not completed:
+            process.kill()
+        process.stdout.close()
+        return_code = process.wait()
+        for worker in workers:
+            worker.join()
+
+    _raise_on_failure(return_code, stderr_chunks)
+
+
+def _profile_filter(profile: OutputProfile, width: int, height: int) -> str:
+    """프로필 하나의 필터 체인 (구간 자르기 → 크기 맞추기 → GIF 팔레트)"""
+    filters = []
+    if profile.kind != OUTPUT_KIND_VIDEO:
+        if profile.fps:
+            filters.append(f"fps={profile.fps}")
+        if profile.start or profile.duration:
+            trim = f"trim=start={profile.start:g}"
+            if profile.duration:
+                trim += f":duration={profile.duration:g}"
+            filters += [trim, "setpts=PTS-STARTPTS"]
+    if (profile.width, profile.height) != (width, height):
+        filters.append(
+            f"scale={profile.width}:{profile.height}:force_original_aspect_ratio=decrease:flags=lanczos"
+        )
+        filters.append(f"pad={profile.width}:{profile.height}:(ow-iw)/2:(oh-ih)/2:color={profile.pad_color}")
+    if profile.format == "gif":
+        # GIF는 256색이므로 구간 전체로 팔레트를 만들어 적용
+        filters.append("split[palette_in][gif_in];[palette_in]palettegen[palette];[gif_in][palette]paletteuse")
+    return ",".join(filters) or "null"
+
+
+def _profile_output_args(
+    profile: OutputProfile,
+    label: str,
+    fps: int,
+    preset: str,
+    threads: int,
+    audio: AudioInput | None,
+    encode_mode: str,
+) -> list[str]:
+    """프로필 하나의 출력 인자 (출력 대상 제외)"""
+    if profile.kind == OUTPUT_KIND_VIDEO:
+        command = video_codec_args(preset, threads, encode_mode, fps)
+        command += _audio_output_args(audio, f"[{label}]")
+        if audio is None:
+            command += ["-map", f"[{label}]"]
+        return command + ["-movflags", "+faststart", "-f", profile.format]
+    command = ["-map", f"[{label}]", "-an", *profile.codec_args]
+    if profile.kind == OUTPUT_KIND_IMAGE:
+        command += ["-frames:v", "1", "-update", "1"]
+    return command + ["-f", profile.format]
+
+
+def encode_profiles(
+    runs: list[FrameRun],
+    profiles: list[OutputProfile],
+    width: int,
+    height: int,
+    fps: int,
+    audio: AudioInput | None = None,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    preset: str = "medium",
+    threads: int = 4,
+    encode_mode: str = ENCODE_MODE_STANDARD,
+    output_dir: str | None = None,
+) -> dict[str, bytes | str]:
+    """
+    프레임을 ffmpeg 프로세스 하나에 한 번만 입력하고 split 필터로 나눠 여러 프로필로 동시에 출력
+
+    Args:
+        runs: (프레임, 반복 프레임 수) 목록
+        profiles: 출력 프로필 목록
+        output_dir: 출력 디렉토리 (None이면 메모리로 출력 - Linux는 memfd, 그 외는 임시 디렉토리)
+        (나머지 인자는 encode_frames와 동일)
+
+    Returns:
+        dict[str, bytes | str]: {프로필 이름: 출력 바이트 (output_dir이 None) 또는 파일 경로}
+    """
+    if not profiles:
+        return {}
+
+    runs, input_rate = _collapse_runs(runs, fps, encode_mode)
+    audio_fds = os.pipe() if isinstance(audio, np.ndarray) else None
+    command = [
+        get_ffmpeg_exe(),
+        "-y",
+        "-v", "error",
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{width}x{height}",
+        "-r", input_rate,
+        "-i", "pipe:0",
+    ]
+    command += _audio_input_args(audio, sample_rate, audio_fds[0] if audio_fds else None)
+
+    labels = [f"out{index}" for index in range(len(profiles))]
+    split = f"[0:v]split={len(profiles)}" + "".join(f"[in{index}]" for index in range(len(profiles)))
+    chains = [
+        f"[in{index}]{_profile_filter(profile, width, height)}[{label}]"
+        for index, (profile, label) in enumerate(zip(profiles, labels))
+    ]
+    command += ["-filter_complex", ";".join([split, *chains])]
+
+    temp_dir = None
+    use_memfd = output_dir is None and hasattr(os, "memfd_create")
+    if output_dir is None and not use_memfd:
+        temp_dir = tempfile.mkdtemp(prefix="quiz_profiles_")
+    memfds: dict[str, int] = {}
+    paths: dict[str, str] = {}
+    for profile, label in zip(profiles, labels):
+        command += _profile_output_args(profile, label, fps, preset, threads, audio, encode_mode)
+        if use_memfd:
+            memfds[profile.name] = os.memfd_create(f"quiz_{profile.name}")
+            command.append(f"/dev/fd/{memfds[profile.name]}")
+        else:
+            paths[profile.name] = os.path.join(output_dir or temp_dir, f"{profile.name}.{profile.extension}")
+            command.append(paths[profile.name])
+
+    try:
+        try:
+            process, workers, stderr_chunks = _start_encoder(
+                runs, command, audio, audio_fds, list(memfds.values()), subprocess.DEVNULL, write_frames_in_thread=False
+            )
+        except Exception:
+            # 프로세스 시작 실패 시 _start_encoder가 memfd를 이미 닫음
+            memfds.clear()
+            raise
+        # 출력은 프로필별 대상(memfd/파일)에서 읽으므로 output_path는 빈 값으로 전달
+        _finish_encoder(process, workers, stderr_chunks, runs, "", None, subprocess.DEVNULL)
+        if output_dir is not None:
+            return dict(paths)
+        if use_memfd:
+            return {name: _read_memfd(memfds.pop(name)) for name in list(memfds)}
+        outputs = {}
+        for name, path in paths.items():
+            with open(path, "rb") as f:
+                outputs[name] = f.read()
+        return outputs
+    finally:
+        for fd in memfds.values():
+            os.close(fd)
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
@@ -5,10 +5,15 @@ Frame Renderer - Pillow를 사용하여 각 프레임 이미지 생성
 
 import os
 import logging
+import threading
+from functools import lru_cache
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
 from models import QuizQuestion, QuizType
+from emoji_atlas import EmojiAtlas
+from text_layout import TextLayout, TextLayoutCache
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +28,8 @@ TEXT_COLOR = "#ffffff"
 ACCENT_COLOR = "#0f3460"  # 미드 블루
 CORRECT_COLOR = "#4ade80"  # 초록
 WRONG_COLOR = "#f87171"  # 빨강
+GRADIENT_START_COLOR = (26, 26, 46)  # #1a1a2e
+GRADIENT_END_COLOR = (15, 52, 96)  # #0f3460
 
 # Safe Zone 규격 (유동적 적용 - 상하단 우선, 좌우는 유동적)
 SAFE_ZONE_TOP = 250
@@ -37,13 +44,32 @@ ASSETS_DIR = Path(__file__).parent / "assets"
 FONTS_DIR = ASSETS_DIR / "fonts"
 EMOJIS_DIR = ASSETS_DIR / "emojis"
 
-# 이모지 캐시
-_emoji_cache = {}
+FALLBACK_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FONT_PROBE_SIZE = 12  # 폰트 경로 검증용 크기
+FONT_CACHE_SIZE = 64  # (size, bold) 조합 최대 캐시 수
 
+# 프레임 렌더링에 쓰이는 (size, bold) 조합 - 워커 시작 시 미리 로드
+COMMON_FONT_SPECS = [
+    (32, False), (36, False), (40, False), (42, False), (48, False),
+    (36, True), (40, True), (44, True), (48, True), (52, True),
+    (56, True), (64, True), (72, True), (80, True),
+]
 
-def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+# 폰트 경로 캐시 (bold -> (경로, TTC 인덱스) 또는 None)
+_font_sources: dict[bool, tuple[str, int] | None] = {}
+_font_source_lock = threading.Lock()
+
+# 이모지 캐시 (자주 쓰는 크기는 시트, 그 외는 LRU) - get_emoji_atlas()로 접근
+_emoji_atlas: EmojiAtlas | None = None
+_emoji_atlas_lock = threading.Lock()
+
+# 그라데이션 배경 캐시 (width, height, start_color, end_color) -> Image
+_gradient_cache: dict[tuple, Image.Image] = {}
+
+
+def _resolve_font_source(bold: bool) -> tuple[str, int] | None:
     """
-    폰트 로드 (한글/일본어/한자/이모지 모두 지원)
+    사용할 폰트 파일 결정 (한글/일본어/한자/이모지 모두 지원)
     
     우선순위:
     1. SpoqaHanSansNeo (영어/한글/일본어/이모지 모두 지원, 최우선)
@@ -51,39 +77,24 @@ def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     3. assets/fonts 폴더의 기타 폰트
     4. 시스템 폰트 (macOS)
     5. 기본 폰트 (fallback)
+    
+    Returns:
+        tuple[str, int] | None: (폰트 경로, TTC 인덱스), 사용할 수 있는 폰트가 없으면 None
     """
-    # 1. SpoqaHanSansNeo 최우선 (영어/한글/일본어/이모지 모두 지원)
-    spoqa_bold_path = FONTS_DIR / "SpoqaHanSansNeo-Bold.ttf"
-    spoqa_regular_path = FONTS_DIR / "SpoqaHanSansNeo-Regular.ttf"
+    candidates: list[tuple[str, str]] = []
     
-    if bold and spoqa_bold_path.exists():
-        try:
-            font = ImageFont.truetype(str(spoqa_bold_path), size)
-            logger.info(f"폰트 로드 성공: {spoqa_bold_path} (SpoqaHanSansNeo Bold)")
-            return font
-        except Exception as e:
-            logger.warning(f"SpoqaHanSansNeo Bold 로드 실패: {e}")
-    elif not bold and spoqa_regular_path.exists():
-        try:
-            font = ImageFont.truetype(str(spoqa_regular_path), size)
-            logger.info(f"폰트 로드 성공: {spoqa_regular_path} (SpoqaHanSansNeo Regular)")
-            return font
-        except Exception as e:
-            logger.warning(f"SpoqaHanSansNeo Regular 로드 실패: {e}")
+    # 1. SpoqaHanSansNeo 최우선 (영어/한글/일본어/이모지 모두 지원)
+    if bold:
+        candidates.append((str(FONTS_DIR / "SpoqaHanSansNeo-Bold.ttf"), "SpoqaHanSansNeo Bold"))
+    else:
+        candidates.append((str(FONTS_DIR / "SpoqaHanSansNeo-Regular.ttf"), "SpoqaHanSansNeo Regular"))
     
     # 2. NotoSansKR-VariableFont_wght.ttf (fallback - 한글/일본어 지원)
-    variable_font_path = FONTS_DIR / "NotoSansKR-VariableFont_wght.ttf"
-    if variable_font_path.exists():
-        try:
-            # Variable Font는 weight를 조절할 수 있지만, PIL에서는 기본 weight 사용
-            # bold 옵션은 무시하고 기본 weight 사용 (필요시 나중에 개선 가능)
-            font = ImageFont.truetype(str(variable_font_path), size)
-            logger.info(f"폰트 로드 성공: {variable_font_path} (Variable Font, 한글/일본어 지원)")
-            return font
-        except Exception as e:
-            logger.warning(f"Variable Font 로드 실패 {variable_font_path}: {e}")
+    # Variable Font는 weight를 조절할 수 있지만, PIL에서는 기본 weight 사용
+    # bold 옵션은 무시하고 기본 weight 사용 (필요시 나중에 개선 가능)
+    candidates.append((str(FONTS_DIR / "NotoSansKR-VariableFont_wght.ttf"), "Variable Font, 한글/일본어 지원"))
     
-    # 2. 프로젝트 assets/fonts 폴더의 기타 폰트
+    # 3. 프로젝트 assets/fonts 폴더의 기타 폰트
     font_candidates = [
         # Hiragino (한글/일본어 모두 지원)
         "HiraginoKakuGothic-W6.ttc",
@@ -96,24 +107,9 @@ def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
         "NotoSansJP-Regular.ttf" if not bold else "NotoSansJP-Bold.ttf",
         "NotoSansJP-Regular.otf" if not bold else "NotoSansJP-Bold.otf",
     ]
+    candidates.extend((str(FONTS_DIR / font_name), "assets") for font_name in font_candidates)
     
-    for font_name in font_candidates:
-        font_path = FONTS_DIR / font_name
-        if font_path.exists():
-            try:
-                # TTC 파일의 경우 인덱스 0 사용 (Hiragino는 인덱스 0이 한글/일본어 모두 지원)
-                if font_path.suffix.lower() == ".ttc":
-                    font = ImageFont.truetype(str(font_path), size, index=0)
-                    logger.info(f"폰트 로드 성공: {font_path} (TTC 인덱스 0)")
-                else:
-                    font = ImageFont.truetype(str(font_path), size)
-                    logger.info(f"폰트 로드 성공: {font_path}")
-                return font
-            except Exception as e:
-                logger.warning(f"폰트 로드 실패 {font_path}: {e}")
-                continue
-    
-    # 2. 시스템 폰트 경로에서 찾기 (macOS - 한글/일본어 지원)
+    # 4. 시스템 폰트 경로에서 찾기 (macOS - 한글/일본어 지원)
     # Hiragino를 우선 (한글과 일본어 모두 지원)
     system_font_paths = [
         "/System/Library/Fonts/ヒラギノ角ゴシック W6.ttc",
@@ -125,46 +121,95 @@ def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
         "/System/Library/Fonts/AppleGothic.ttf",
         "/Library/Fonts/AppleGothic.ttf",
     ]
+    candidates.extend((font_path, "시스템 폰트") for font_path in system_font_paths)
     
-    for font_path in system_font_paths:
-        if os.path.exists(font_path):
-            try:
-                # TTC 파일은 인덱스 0 사용, TTF는 인덱스 없이
-                if font_path.endswith('.ttc'):
-                    font = ImageFont.truetype(font_path, size, index=0)
-                else:
-                    font = ImageFont.truetype(font_path, size)
-                logger.info(f"시스템 폰트 로드 성공: {font_path}")
-                return font
-            except Exception as e:
-                logger.warning(f"시스템 폰트 로드 실패 {font_path}: {e}")
-                continue
-    
-    # 3. 기본 폰트 (fallback - 한글/일본어 미지원)
+    for font_path, label in candidates:
+        if not os.path.exists(font_path):
+            continue
+        try:
+            # TTC 파일의 경우 인덱스 0 사용 (Hiragino는 인덱스 0이 한글/일본어 모두 지원)
+            ImageFont.truetype(font_path, FONT_PROBE_SIZE, index=0)
+            logger.info(f"폰트 선택: {font_path} ({label}, bold={bold})")
+            return font_path, 0
+        except Exception as e:
+            logger.warning(f"폰트 로드 실패 {font_path}: {e}")
+    
+    # 5. 기본 폰트 (fallback - 한글/일본어 미지원)
     logger.warning("한글/일본어 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다. 한글/일본어가 깨질 수 있습니다.")
     try:
-        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size)
-    except:
+        ImageFont.truetype(FALLBACK_FONT_PATH, FONT_PROBE_SIZE)
+        return FALLBACK_FONT_PATH, 0
+    except Exception:
+        return None
+
+
+def resolve_fonts() -> dict[bool, tuple[str, int] | None]:
+    """일반/볼드 폰트 경로를 미리 결정 (서버 시작 시 호출, 이후 재탐색 없음)"""
+    with _font_source_lock:
+        for bold in (False, True):
+            if bold not in _font_sources:
+                _font_sources[bold] = _resolve_font_source(bold)
+        return dict(_font_sources)
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def _load_font(size: int, bold: bool) -> ImageFont.FreeTypeFont:
+    """(size, bold) 조합별 폰트 로드 (LRU 캐시)"""
+    source = _font_sources.get(bold)
+    if source is None and bold not in _font_sources:
+        source = resolve_fonts()[bold]
+    if source is None:
         return ImageFont.load_default()
+    font_path, index = source
+    return ImageFont.truetype(font_path, size, index=index)
 
 
-def create_gradient_background(width: int, height: int) -> Image.Image:
-    """그라데이션 배경 생성"""
-    img = Image.new("RGB", (width, height))
-    draw = ImageDraw.Draw(img)
-    
-    # 세로 그라데이션 (위에서 아래로)
-    start_color = (26, 26, 46)  # #1a1a2e
-    end_color = (15, 52, 96)    # #0f3460
-    
-    for y in range(height):
-        ratio = y / height
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    """
+    폰트 로드 (한글/일본어/한자/이모지 모두 지원)
+    폰트 경로는 프로세스당 한 번만 결정하고, 로드된 폰트는 (size, bold)별로 캐시
+    """
+    return _load_font(size, bold)
+
+
+def get_font_cache_stats() -> dict:
+    """폰트 캐시 통계 (hits/misses 등)"""
+    info = _load_font.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "resolved": {
+            "regular": (_font_sources.get(False) or (None,))[0],
+            "bold": (_font_sources.get(True) or (None,))[0],
+        },
+    }
+
+
+def create_gradient_background(
+    width: int,
+    height: int,
+    start_color: tuple[int, int, int] = GRADIENT_START_COLOR,
+    end_color: tuple[int, int, int] = GRADIENT_END_COLOR,
+) -> Image.Image:
+    """
+    그라데이션 배경 생성
+    (width, height, 색상) 조합별로 한 번만 계산해 캐시하고, 호출마다 복사본 반환
+    """
+    cache_key = (width, height, start_color, end_color)
+    base = _gradient_cache.get(cache_key)
+    if base is None:
+        # 세로 그라데이션 (위에서 아래로) - 행 단위 색상을 한 번에 계산
+        ratio = np.arange(height, dtype=np.float64)[:, None] / height
+        start = np.array(start_color, dtype=np.float64)
+        end = np.array(end_color, dtype=np.float64)
+        rows = (start + (end - start) * ratio).astype(np.uint8)  # (height, 3), 소수점 버림
+        pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+        base = Image.fromarray(pixels, "RGB")
+        _gradient_cache[cache_key] = base
     
-    return img
+    return base.copy()
 
 
 def draw_rounded_rectangle(
@@ -205,41 +250,39 @@ def get_text_size(draw: ImageDraw.Draw, text: str, font: ImageFont.FreeTypeFont)
     return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
 
+def get_emoji_size(font_size: int) -> int:
+    """폰트 크기에 맞는 이모지 크기 (폰트보다 약간 크게)"""
+    return int(font_size * 1.2)
+
+
+def get_emoji_atlas() -> EmojiAtlas:
+    """이모지 아틀라스 싱글톤 (렌더링에 쓰는 폰트 크기별 이모지 크기로 시트 구성)"""
+    global _emoji_atlas
+    if _emoji_atlas is None:
+        with _emoji_atlas_lock:
+            if _emoji_atlas is None:
+                sheet_sizes = [get_emoji_size(size) for size, _ in COMMON_FONT_SPECS]
+                _emoji_atlas = EmojiAtlas(EMOJIS_DIR, sheet_sizes)
+    return _emoji_atlas
+
+
 def load_emoji_image(emoji_char: str, size: int) -> Image.Image | None:
-    """이모지 이미지 로드 및 크기 조절"""
-    # 캐시 확인
-    cache_key = f"{emoji_char}_{size}"
-    if cache_key in _emoji_cache:
-        return _emoji_cache[cache_key]
-    
-    # 파일명 생성 (유니코드 코드포인트, Variation Selector 제외)
-    safe_name = "".join([f"U{ord(c):04X}" for c in emoji_char if ord(c) not in [0xFE0F, 0x200D]])
-    emoji_path = EMOJIS_DIR / f"{safe_name}.png"
-    
-    if not emoji_path.exists():
-        logger.warning(f"이모지 이미지 없음: {emoji_char} ({emoji_path})")
-        return None
+    """이모지 이미지 로드 및 크기 조절 (이미지가 없으면 None)"""
+    return get_emoji_atlas().get(emoji_char, size)
+
+
+def preload_assets():
+    """
+    렌더링 에셋 미리 로드 (폰트, 그라데이션 배경, 이모지 이미지)
+    워커 프로세스 시작 시 한 번 호출하면 이후 요청은 로드 비용 없이 캐시 사용
+    """
+    resolve_fonts()
+    for size, bold in COMMON_FONT_SPECS:
+        get_font(size, bold)
     
-    try:
-        # PNG 파일 로드 (Twemoji는 PNG로 다운로드됨)
-        if emoji_path.exists():
-            img = Image.open(emoji_path)
-            # RGBA 모드로 변환 (투명도 지원)
-            if img.mode != "RGBA":
-                img = img.convert("RGBA")
-        else:
-            logger.warning(f"이모지 이미지 파일 없음: {emoji_path}")
-            return None
-        
-        # 크기 조절 (비율 유지)
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
-        
-        # 캐시에 저장
-        _emoji_cache[cache_key] = img
-        return img
-    except Exception as e:
-        logger.error(f"이모지 이미지 로드 실패 {emoji_char}: {e}")
-        return None
+    create_gradient_background(WIDTH, HEIGHT)
+    
+    get_emoji_atlas().load()
 
 
 def is_emoji(char: str) -> bool:
@@ -302,6 +345,15 @@ def split_text_and_emojis(text: str) -> list[tuple[str, bool]]:
     return result
 
 
+# 텍스트 레이아웃/글자 마스크 캐시 (반복되는 문구는 측정/렌더링 없이 재사용)
+_text_layout_cache = TextLayoutCache(split_text_and_emojis)
+
+
+def get_text_layout_cache() -> TextLayoutCache:
+    """텍스트 레이아웃 캐시 반환"""
+    return _text_layout_cache
+
+
 def draw_centered_text(
     draw: ImageDraw.Draw,
     text: str,
@@ -323,52 +375,59 @@ def draw_centered_text(
         width: 전체 너비 (기본값: 전체 화면 너비, 필요시 SAFE_ZONE_WIDTH 사용 가능)
         img: 배경 이미지 (이모지 삽입용)
     """
-    # 이모지와 텍스트 분리
-    parts = split_text_and_emojis(text)
-    
-    # 전체 너비 계산
-    total_width = 0
-    emoji_size = int(font.size * 1.2)  # 이모지 크기 (폰트보다 약간 크게)
-    
-    for part_text, is_emoji in parts:
-        if is_emoji:
-            total_width += emoji_size
-        else:
-            part_width, _ = get_text_size(draw, part_text, font)
-            total_width += part_width
+    emoji_size = get_emoji_size(font.size)  # 이모지 크기 (폰트보다 약간 크게)
+    layout = get_text_layout_cache().layout(text, font, emoji_size)
     
     # 시작 X 좌표 (중앙 정렬)
     # width가 WIDTH인 경우 전체 화면 기준, SAFE_ZONE_WIDTH인 경우 Safe Zone 기준
     if width == WIDTH:
-        x = (width - total_width) // 2
+        x = (width - layout.width) // 2
     else:
-        x = SAFE_ZONE_LEFT + (width - total_width) // 2
+        x = SAFE_ZONE_LEFT + (width - layout.width) // 2
     
-    # 각 부분 그리기
-    for part_text, is_emoji in parts:
-        if is_emoji:
+    draw_text_layout(draw, img, layout, x, y, font, fill, emoji_size)
+
+
+def draw_text_layout(
+    draw: ImageDraw.Draw,
+    img: Image.Image | None,
+    layout: TextLayout,
+    x: int,
+    y: int,
+    font: ImageFont.FreeTypeFont,
+    fill: str,
+    emoji_size: int,
+):
+    """
+    레이아웃대로 텍스트/이모지 그리기
+    텍스트는 캐시된 글자 마스크를, 이모지는 이모지 아틀라스 이미지를 붙여넣음
+    """
+    text_layout_cache = get_text_layout_cache()
+    for run in layout.runs:
+        if run.is_emoji:
             # 이모지 이미지 삽입
-            emoji_img = load_emoji_image(part_text, emoji_size)
+            emoji_img = load_emoji_image(run.text, emoji_size)
             if emoji_img and img:
                 # 이미지에 이모지 삽입 (투명도 처리)
-                emoji_x = x
                 emoji_y = y + (font.size - emoji_size) // 2  # 수직 정렬
                 # RGBA 모드인 경우 alpha 채널을 마스크로 사용
                 if emoji_img.mode == "RGBA":
-                    img.paste(emoji_img, (emoji_x, emoji_y), emoji_img.split()[3])  # alpha 채널을 마스크로
+                    img.paste(emoji_img, (x, emoji_y), emoji_img.split()[3])  # alpha 채널을 마스크로
                 else:
-                    img.paste(emoji_img, (emoji_x, emoji_y))
+                    img.paste(emoji_img, (x, emoji_y))
                 x += emoji_size
             else:
                 # 이모지 이미지가 없으면 텍스트로 대체
-                draw.text((x, y), part_text, font=font, fill=fill)
-                part_width, _ = get_text_size(draw, part_text, font)
+                draw.text((x, y), run.text, font=font, fill=fill)
+                part_width, _ = get_text_size(draw, run.text, font)
                 x += part_width
         else:
             # 일반 텍스트
-            draw.text((x, y), part_text, font=font, fill=fill)
-            part_width, _ = get_text_size(draw, part_text, font)
-            x += part_width
+            if img is not None:
+                text_layout_cache.draw_text(img, (x, y), run.text, font, fill)
+            else:
+                draw.text((x, y), run.text, font=font, fill=fill)
+            x += run.width
 
 
 def render_intro_frame(question: QuizQuestion) -> Image.Image:
@@ -416,17 +475,24 @@ def render_intro_frame(question: QuizQuestion) -> Image.Image:
     return img
 
 
-def render_question_frame(question: QuizQuestion, countdown: int) -> Image.Image:
+# 카운트다운 타이머 영역 (하단 중앙) - 기존 "정답을 생각해보세요..." 위치
+TIMER_FONT_SIZE = 72
+TIMER_Y = HEIGHT - SAFE_ZONE_BOTTOM - 50
+# 타이머가 그려지는 가로 띠 (이모지/글자 상하 여유 포함), 이 영역만 매 초 다시 그림
+TIMER_REGION_TOP = TIMER_Y - 40
+TIMER_REGION_BOTTOM = TIMER_Y + 140
+
+
+def render_question_base(question: QuizQuestion) -> Image.Image:
     """
-    문제 프레임 렌더링 (3-13초)
-    - 문제와 4개의 선택지
-    - 카운트다운 타이머
+    문제 프레임의 정적 레이어 렌더링
+    - 문제와 4개의 선택지 (카운트다운 타이머 제외)
+    - 문제당 한 번만 렌더링하고 카운트다운 프레임은 여기에 타이머만 합성
     """
     img = create_gradient_background(WIDTH, HEIGHT)
     draw = ImageDraw.Draw(img)
     
     # 폰트
-    timer_font = get_font(72, bold=True)
     question_font = get_font(64, bold=True)
     option_font = get_font(52, bold=True)  # 크기 키우고 bold
     level_font = get_font(48, bold=True)  # 크기 키우고 bold
@@ -483,45 +549,50 @@ def render_question_frame(question: QuizQuestion, countdown: int) -> Image.Image
         
         draw.text((option_padding + 100, y + 45), option_text, font=option_font_size, fill=TEXT_COLOR)
     
-    # 카운트다운 타이머 (하단 중앙) - 기존 "정답을 생각해보세요..." 위치로 이동
+    return img
+
+
+def render_countdown_overlay(base: Image.Image, countdown: int) -> Image.Image:
+    """
+    정적 레이어 위에 카운트다운 타이머 합성
+    - 타이머 영역(가로 띠)만 잘라서 그린 뒤 base 복사본에 붙여넣음
+    """
+    strip = base.crop((0, TIMER_REGION_TOP, WIDTH, TIMER_REGION_BOTTOM))
+    draw = ImageDraw.Draw(strip)
+    timer_font = get_font(TIMER_FONT_SIZE, bold=True)
+    
     timer_color = WRONG_COLOR if countdown <= 3 else TEXT_COLOR
     timer_text = f"⏱️ {countdown}"
-    # 이모지가 포함된 텍스트는 draw_centered_text 대신 수동 처리
-    timer_parts = split_text_and_emojis(timer_text)
-    timer_y = HEIGHT - SAFE_ZONE_BOTTOM - 50
-    # 전체 너비 계산
-    total_timer_width = 0
-    emoji_size = int(timer_font.size * 1.2)
-    for part_text, is_emoji in timer_parts:
-        if is_emoji:
-            total_timer_width += emoji_size
-        else:
-            part_width, _ = get_text_size(draw, part_text, timer_font)
-            total_timer_width += part_width
-    
-    timer_x = (WIDTH - total_timer_width) // 2
-    for part_text, is_emoji in timer_parts:
-        if is_emoji:
-            emoji_img = load_emoji_image(part_text, emoji_size)
-            if emoji_img:
-                # RGBA 모드인 경우 alpha 채널을 마스크로 사용
-                if emoji_img.mode == "RGBA":
-                    img.paste(emoji_img, (timer_x, timer_y + (timer_font.size - emoji_size) // 2), emoji_img.split()[3])
-                else:
-                    img.paste(emoji_img, (timer_x, timer_y + (timer_font.size - emoji_size) // 2))
-                timer_x += emoji_size
-            else:
-                draw.text((timer_x, timer_y), part_text, font=timer_font, fill=timer_color)
-                part_width, _ = get_text_size(draw, part_text, timer_font)
-                timer_x += part_width
-        else:
-            draw.text((timer_x, timer_y), part_text, font=timer_font, fill=timer_color)
-            part_width, _ = get_text_size(draw, part_text, timer_font)
-            timer_x += part_width
-    
+    emoji_size = get_emoji_size(timer_font.size)
+    layout = get_text_layout_cache().layout(timer_text, timer_font, emoji_size)
+    # 띠 기준 좌표
+    timer_y = TIMER_Y - TIMER_REGION_TOP
+    timer_x = (WIDTH - layout.width) // 2
+    draw_text_layout(draw, strip, layout, timer_x, timer_y, timer_font, timer_color, emoji_size)
+    
+    img = base.copy()
+    img.paste(strip, (0, TIMER_REGION_TOP))
     return img
 
 
+def render_question_frames(question: QuizQuestion, start: int = 10) -> list[Image.Image]:
+    """
+    카운트다운 프레임 일괄 렌더링 (start ~ 1초)
+    정적 레이어는 한 번만 렌더링하고 타이머 영역만 매 초 합성
+    """
+    base = render_question_base(question)
+    return [render_countdown_overlay(base, countdown) for countdown in range(start, 0, -1)]
+
+
+def render_question_frame(question: QuizQuestion, countdown: int) -> Image.Image:
+    """
+    문제 프레임 렌더링 (3-13초)
+    - 문제와 4개의 선택지
+    - 카운트다운 타이머
+    """
+    return render_countdown_overlay(render_question_base(question), countdown)
+
+
 def render_answer_frame(question: QuizQuestion) -> Image.Image:
     """
     정답 프레임 렌더링 (13-18초, 5초)
@@ -0,0 +1,177 @@
+"""
+Frame Ring - 프로세스 사이에 raw RGB 프레임을 공유 메모리 링 버퍼로 전달
+렌더링과 인코딩을 서로 다른 프로세스에서 실행할 때 프레임(1080x1920 RGB = 약 6MB)을 pickle로
+주고받지 않도록, 렌더러가 미리 할당한 슬롯에 프레임을 쓰고 인코더는 슬롯을 그대로(복사 없이) ffmpeg에 씀
+큐로는 슬롯 번호와 반복 프레임 수만 전달하고, 다 쓴 슬롯은 다시 렌더러가 재사용
+
+사용법:
+    ring = FrameRing(WIDTH, HEIGHT)
+    renderer = ctx.Process(target=render_into, args=(ring, question))  # spawn 시점에 전달
+    renderer.start()
+    encode_frames(ring.runs(), ...)  # 인코더 프로세스
+    ring.close()
+"""
+
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+from queue import Empty
+from typing import Iterator
+
+import numpy as np
+from PIL import Image
+
+# 슬롯 수 - 렌더러가 인코더보다 앞서 나갈 수 있는 프레임 수 (슬롯이 모두 차면 렌더러가 기다림)
+FRAME_RING_SLOTS = 4
+
+# 상대 프로세스가 응답하지 않을 때 기다리는 최대 시간 (초)
+FRAME_RING_TIMEOUT = 30.0
+
+# ready 큐 종료 표시 (None: 정상 종료, 문자열: 렌더러 오류 메시지)
+_END = None
+
+
+class FrameRingError(Exception):
+    """렌더러 프로세스 오류 또는 응답 없음"""
+    pass
+
+
+class FrameRing:
+    """
+    공유 메모리 프레임 링 버퍼 (렌더러 1개 → 인코더 1개)
+    만든 프로세스가 공유 메모리를 소유하고 close()에서 해제
+    큐는 pickle로 넘길 수 없으므로 프로세스를 시작할 때 인자로 전달 (ProcessPoolExecutor.submit 불가)
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        slots: int = FRAME_RING_SLOTS,
+        timeout: float = FRAME_RING_TIMEOUT,
+        ctx=None,
+    ):
+        ctx = ctx or multiprocessing.get_context("spawn")
+        self.width = width
+        self.height = height
+        self.slots = max(1, slots)
+        self.timeout = timeout
+        self.frame_size = width * height * 3
+
+        self._shm = shared_memory.SharedMemory(create=True, size=self.frame_size * self.slots)
+        self._owner = True
+        self._free = ctx.Queue()  # 비어 있는 슬롯 번호
+        self._ready = ctx.Queue()  # (슬롯 번호, 반복 프레임 수) 또는 종료 표시
+        for slot in range(self.slots):
+            self._free.put(slot)
+        self._attach()
+
+        # 통계 (렌더러 쪽)
+        self.frames_written = 0
+        self.wait_seconds = 0.0  # 빈 슬롯을 기다린 시간 (인코더가 느리면 늘어남)
+
+    def _attach(self):
+        """슬롯별 numpy 뷰 (공유 메모리를 그대로 가리킴)"""
+        self._frames = np.ndarray(
+            (self.slots, self.height, self.width, 3), dtype=np.uint8, buffer=self._shm.buf
+        )
+
+    def __getstate__(self) -> dict:
+        return {
+            "name": self._shm.name,
+            "width": self.width,
+            "height": self.height,
+            "slots": self.slots,
+            "timeout": self.timeout,
+            "free": self._free,
+            "ready": self._ready,
+        }
+
+    def __setstate__(self, state: dict):
+        self.width = state["width"]
+        self.height = state["height"]
+        self.slots = state["slots"]
+        self.timeout = state["timeout"]
+        self.frame_size = self.width * self.height * 3
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner = False
+        self._free = state["free"]
+        self._ready = state["ready"]
+        self._attach()
+        self.frames_written = 0
+        self.wait_seconds = 0.0
+
+    def _get(self, queue, side: str):
+        """큐에서 꺼내기 (timeout 동안 응답이 없으면 FrameRingError)"""
+        try:
+            return queue.get(timeout=self.timeout)
+        except Empty:
+            raise FrameRingError(f"{side}가 {self.timeout:.0f}초 동안 응답하지 않습니다") from None
+
+    # 렌더러 쪽
+
+    def write(self, frame: Image.Image | np.ndarray, repeat: int = 1):
+        """
+        프레임을 빈 슬롯에 복사하고 인코더에 전달 (빈 슬롯이 없으면 인코더가 반환할 때까지 기다림)
+
+        Args:
+            frame: PIL 이미지 또는 (height, width, 3) uint8 배열 (pil_to_numpy 결과)
+            repeat: 반복 프레임 수
+        """
+        if isinstance(frame, Image.Image) and frame.mode != "RGB":
+            frame = frame.convert("RGB")
+        started = time.perf_counter()
+        slot = self._get(self._free, "인코더")
+        self.wait_seconds += time.perf_counter() - started
+        self._frames[slot] = np.asarray(frame)
+        self._ready.put((slot, repeat))
+        self.frames_written += 1
+
+    def finish(self):
+        """모든 프레임을 썼음을 알림"""
+        self._ready.put(_END)
+
+    def fail(self, message: str):
+        """렌더링 실패를 인코더에 알림 (runs()에서 FrameRingError 발생)"""
+        self._ready.put(message)
+
+    # 인코더 쪽
+
+    def runs(self) -> Iterator[tuple[memoryview, int]]:
+        """
+        (슬롯 버퍼, 반복 프레임 수)를 렌더러가 쓴 순서대로 반환 (encode_frames의 runs로 사용)
+        슬롯 버퍼는 다음 프레임을 요청하는 시점에 렌더러에게 돌려주므로 그 전에 다 써야 함
+
+        Raises:
+            FrameRingError: 렌더러가 실패했거나 timeout 동안 응답이 없는 경우
+        """
+        while True:
+            item = self._get(self._ready, "렌더러")
+            if item is _END:
+                return
+            if isinstance(item, str):
+                raise FrameRingError(f"렌더러 오류: {item}")
+            slot, repeat = item
+            start = slot * self.frame_size
+            view = self._shm.buf[start:start + self.frame_size]
+            try:
+                yield view, repeat
+            finally:
+                view.release()
+                self._free.put(slot)
+
+    def close(self):
+        """공유 메모리 연결 해제 (소유한 프로세스는 공유 메모리도 삭제)"""
+        if self._shm is None:
+            return
+        del self._frames
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "FrameRing":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
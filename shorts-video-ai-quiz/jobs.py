@@ -0,0 +1,545 @@
+"""
+Jobs - 비동기 영상 생성 작업 (POST /jobs → GET /jobs/{id})
+HTTP 연결을 렌더링/인코딩 내내 붙잡지 않도록 요청은 작업 ID만 받고 바로 반환,
+프로세스 안의 작업 대기열을 워커가 처리하면서 단계별 진행 상황을 저장소(메모리/SQLite)에 기록
+같은 문제(question_cache_key)의 작업이 진행 중이면 새로 만들지 않고 기존 작업 반환
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import asyncio
+import ipaddress
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, asdict
+from typing import TYPE_CHECKING, Awaitable, Callable
+from urllib.parse import urlsplit
+
+from fastapi.concurrency import run_in_threadpool
+
+from models import QuizQuestion, JobResponse
+from render_cache import question_cache_key
+from render_pool import get_render_pool
+from storage import get_storage_manager
+from metrics import STAGE_QUEUE_WAIT, STAGE_RENDER, STAGE_STORAGE_UPLOAD, StageTimings, observe_stages
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# 작업 설정
+JOB_STORE_TYPE = os.getenv("JOB_STORE_TYPE", "memory").lower()  # memory / sqlite
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", "./jobs.db")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", os.getenv("RENDER_WORKERS", "2")))  # 동시에 처리하는 작업 수
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "1000"))  # 대기 가능한 작업 수 (초과 시 429)
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", str(24 * 60 * 60)))  # 끝난 작업 보관 시간
+JOB_WEBHOOK_TIMEOUT = float(os.getenv("JOB_WEBHOOK_TIMEOUT", "10"))
+JOB_WEBHOOK_RETRIES = int(os.getenv("JOB_WEBHOOK_RETRIES", "3"))
+# 웹훅을 보낼 수 있는 호스트 (쉼표로 구분, 비어 있으면 공인 주소로 확인되는 모든 호스트)
+JOB_WEBHOOK_ALLOWED_HOSTS = {
+    host.strip().lower() for host in os.getenv("JOB_WEBHOOK_ALLOWED_HOSTS", "").split(",") if host.strip()
+}
+
+# 끝난 작업 정리 간격 (초)
+PURGE_INTERVAL_SECONDS = 60
+# 종료 시 전송 중인 웹훅을 기다리는 최대 시간 (초, 넘으면 취소)
+WEBHOOK_DRAIN_SECONDS = JOB_WEBHOOK_TIMEOUT
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+FINISHED_STATUSES = (JOB_COMPLETED, JOB_FAILED)
+
+# 웹훅 전송 결과
+WEBHOOK_DELIVERED = "delivered"
+WEBHOOK_FAILED = "failed"
+
+# 렌더 캐시 확인 + 렌더 풀에서 영상 생성 (question, timings) -> (영상 바이트, 캐시 적중 여부)
+RenderFunc = Callable[[QuizQuestion, StageTimings], Awaitable[tuple[bytes, bool]]]
+
+
+class JobQueueFull(Exception):
+    """작업 대기열이 가득 찬 경우"""
+
+
+class WebhookURLError(ValueError):
+    """웹훅을 보낼 수 없는 URL (허용하지 않는 호스트 또는 내부 주소)"""
+
+
+async def check_webhook_url(url: str):
+    """
+    웹훅 URL 확인 - 서비스 안에서 POST하므로 내부 주소(메타데이터 서버 169.254.169.254, 사설/루프백/링크 로컬 대역 등)는 거절
+    JOB_WEBHOOK_ALLOWED_HOSTS가 있으면 목록의 호스트만 허용 (목록에 넣은 호스트는 내부 주소여도 허용)
+
+    Raises:
+        WebhookURLError: 허용하지 않는 호스트이거나 호스트가 내부 주소로 확인되는 경우
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    if not host:
+        raise WebhookURLError(f"웹훅 URL에 호스트가 없습니다: {url}")
+    if JOB_WEBHOOK_ALLOWED_HOSTS:
+        if host not in JOB_WEBHOOK_ALLOWED_HOSTS:
+            raise WebhookURLError(f"허용하지 않는 웹훅 호스트입니다: {host}")
+        return
+
+    # 호스트 이름이 내부 주소를 가리킬 수도 있으므로(metadata.google.internal 등) 확인된 주소를 모두 검사
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        raise WebhookURLError(f"웹훅 호스트를 찾을 수 없습니다: {host}") from e
+    for *_, sockaddr in infos:
+        address = ipaddress.ip_address(sockaddr[0].split("%")[0])
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if not address.is_global or address.is_multicast:
+            raise WebhookURLError(f"내부 주소로는 웹훅을 보낼 수 없습니다: {host} ({address})")
+
+
+@dataclass
+class Job:
+    """영상 생성 작업"""
+    id: str
+    question: QuizQuestion
+    cache_key: str
+    webhook_urls: list[str] = field(default_factory=list)  # 같은 작업으로 합쳐진 요청들의 웹훅
+    status: str = JOB_QUEUED
+    stage: str | None = STAGE_QUEUE_WAIT  # 진행 중인 단계 (끝나면 None)
+    stages: StageTimings = field(default_factory=dict)  # 끝난 단계별 처리 시간 (초)
+    video_url: str | None = None
+    file_size_bytes: int | None = None
+    cached: bool = False
+    error: str | None = None
+    webhook_status: str | None = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["question"] = self.question.model_dump(mode="json")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        return cls(**{**data, "question": QuizQuestion.model_validate(data["question"])})
+
+    def to_response(self, deduplicated: bool = False) -> JobResponse:
+        return JobResponse(
+            job_id=self.id,
+            status=self.status,
+            stage=self.stage,
+            stages=self.stages,
+            question_id=self.question.id,
+            video_url=self.video_url,
+            file_size_bytes=self.file_size_bytes,
+            cached=self.cached,
+            error=self.error,
+            webhook_status=self.webhook_status,
+            deduplicated=deduplicated,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            finished_at=self.finished_at,
+        )
+
+
+class JobStore(ABC):
+    """작업 저장소 추상 클래스 (호출은 스레드 풀에서 하므로 스레드 안전해야 함)"""
+
+    @abstractmethod
+    def save(self, job: Job):
+        """작업 저장 (있으면 덮어씀)"""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Job | None:
+        """작업 조회 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    def list_unfinished(self) -> list[Job]:
+        """끝나지 않은 작업 목록 (생성 순서, 재시작 시 다시 대기열에 넣기 위해 사용)"""
+        pass
+
+    @abstractmethod
+    def purge(self, finished_before: float) -> int:
+        """finished_before 이전에 끝난 작업 삭제, 삭제한 수 반환"""
+        pass
+
+
+class MemoryJobStore(JobStore):
+    """프로세스 메모리 저장소 (재시작하면 사라짐)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: dict[str, dict] = {}
+
+    def save(self, job: Job):
+        data = job.to_dict()
+        with self._lock:
+            self._jobs[job.id] = data
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            data = self._jobs.get(job_id)
+        return Job.from_dict(data) if data is not None else None
+
+    def list_unfinished(self) -> list[Job]:
+        with self._lock:
+            items = [data for data in self._jobs.values() if data["status"] not in FINISHED_STATUSES]
+        return [Job.from_dict(data) for data in sorted(items, key=lambda data: data["created_at"])]
+
+    def purge(self, finished_before: float) -> int:
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, data in self._jobs.items()
+                if data["finished_at"] is not None and data["finished_at"] < finished_before
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite 파일 저장소 (로컬 개발/단일 인스턴스, 재시작 후에도 작업 유지)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    finished_at REAL,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)")
+
+    def save(self, job: Job):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, status, created_at, finished_at, data) VALUES (?, ?, ?, ?, ?)",
+                (job.id, job.status, job.created_at, job.finished_at, json.dumps(job.to_dict(), ensure_ascii=False)),
+            )
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_dict(json.loads(row[0])) if row else None
+
+    def list_unfinished(self) -> list[Job]:
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM jobs WHERE status NOT IN ({placeholders}) ORDER BY created_at",
+                FINISHED_STATUSES,
+            ).fetchall()
+        return [Job.from_dict(json.loads(row[0])) for row in rows]
+
+    def purge(self, finished_before: float) -> int:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (finished_before,)
+            )
+        return cursor.rowcount
+
+
+class JobManager:
+    """
+    작업 대기열 + 워커 (이벤트 루프에서 실행)
+    워커 수만큼만 렌더 풀 용량을 점유하므로 동기 요청(/generate 등)이 쓸 대기열 자리는 남겨 둠
+    """
+
+    def __init__(self, store: JobStore, workers: int = JOB_WORKERS, queue_size: int = JOB_QUEUE_SIZE):
+        self.store = store
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self._queue: asyncio.Queue[Job] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._webhook_tasks: set[asyncio.Task] = set()  # 전송 중인 웹훅 (워커와 별도로 실행)
+        self._in_flight: dict[str, Job] = {}  # {캐시 키: 워커가 처리하는 작업 (상태 변경이 반영되는 객체)}
+        self._render: RenderFunc | None = None
+        self._http: "httpx.AsyncClient | None" = None  # 첫 웹훅 전송 시 생성
+        self._last_purge = 0.0
+
+        # 통계
+        self._submitted = 0
+        self._deduplicated = 0
+        self._completed = 0
+        self._failed = 0
+
+    async def start(self, render: RenderFunc):
+        """워커 시작 + 이전 실행에서 끝나지 않은 작업 다시 대기열에 넣기"""
+        if self._queue is not None:
+            return
+        self._render = render
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+        await self._purge(force=True)
+        for job in await run_in_threadpool(self.store.list_unfinished):
+            try:
+                self._enqueue(job)
+            except JobQueueFull as e:
+                await self._finish(job, error=str(e))
+        logger.info(
+            f"📋 작업 대기열 시작: workers={self.workers}, store={type(self.store).__name__}, "
+            f"recovered={self._queue.qsize()}"
+        )
+
+    async def shutdown(self):
+        """워커 종료 (진행 중인 작업은 SQLite 저장소라면 다음 시작 시 다시 처리)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._webhook_tasks:
+            _, pending = await asyncio.wait(self._webhook_tasks, timeout=WEBHOOK_DRAIN_SECONDS)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if pending:
+                logger.warning(f"⚠️ 종료 시 전송하지 못한 웹훅 {len(pending)}건 취소")
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._queue = None
+        self._in_flight.clear()
+
+    def _enqueue(self, job: Job):
+        """대기열에 추가 + 진행 중 작업으로 등록 (가득 차면 JobQueueFull)"""
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFull(f"작업 대기열이 가득 찼습니다 (최대 {self.queue_size}건)")
+        self._in_flight[job.cache_key] = job
+
+    async def submit(self, question: QuizQuestion, webhook_url: str | None = None) -> tuple[Job, bool]:
+        """
+        작업 등록
+
+        Returns:
+            tuple[Job, bool]: (작업, 진행 중인 같은 문제의 작업을 반환했는지 여부)
+
+        Raises:
+            JobQueueFull: 대기열이 가득 찬 경우
+        """
+        if self._queue is None:
+            raise RuntimeError("JobManager가 시작되지 않았습니다")
+
+        cache_key = question_cache_key(question)
+        existing = self._in_flight.get(cache_key)
+        if existing is not None and not existing.finished:
+            self._deduplicated += 1
+            if webhook_url and webhook_url not in existing.webhook_urls:
+                # 합쳐진 요청도 웹훅을 받도록 추가 (워커와 같은 객체라 이후 저장에도 유지됨)
+                existing.webhook_urls.append(webhook_url)
+                await run_in_threadpool(self.store.save, existing)
+            logger.info(f"🔁 진행 중인 작업 반환: job_id={existing.id}, question_id={question.id}")
+            return existing, True
+
+        job = Job(
+            id=uuid.uuid4().hex,
+            question=question,
+            cache_key=cache_key,
+            webhook_urls=[webhook_url] if webhook_url else [],
+        )
+        self._enqueue(job)
+        self._submitted += 1
+        try:
+            await run_in_threadpool(self.store.save, job)
+        except Exception:
+            # 저장하지 못한 작업은 조회할 수 없으므로 워커가 처리하지 않고 건너뜀
+            self._in_flight.pop(cache_key, None)
+            raise
+        logger.info(f"📥 작업 등록: job_id={job.id}, question_id={question.id}, queue={self._queue.qsize()}")
+        return job, False
+
+    async def get(self, job_id: str) -> Job | None:
+        """작업 조회"""
+        return await run_in_threadpool(self.store.get, job_id)
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                if self._in_flight.get(job.cache_key) is job:
+                    await self._run(job)
+            except Exception as e:
+                logger.error(f"❌ 작업 실패: job_id={job.id}, {e}", exc_info=True)
+                try:
+                    await self._finish(job, error=str(e))
+                except Exception as store_error:
+                    logger.error(f"❌ 작업 상태 저장 실패: job_id={job.id}, {store_error}")
+            finally:
+                if self._in_flight.get(job.cache_key) is job:
+                    del self._in_flight[job.cache_key]
+                self._queue.task_done()
+            await self._purge()
+
+    async def _update(self, job: Job, **changes):
+        """작업 상태 변경 후 저장"""
+        for name, value in changes.items():
+            setattr(job, name, value)
+        job.updated_at = time.time()
+        await run_in_threadpool(self.store.save, job)
+
+    async def _run(self, job: Job):
+        """렌더 캐시 확인/렌더링 → 저장소 업로드"""
+        question = job.question
+        await self._update(job, status=JOB_RUNNING)
+
+        await get_render_pool().acquire_waiting()
+        job_wait = time.time() - job.created_at
+        timings: StageTimings = {}
+        try:
+            await self._update(job, stage=STAGE_RENDER, stages={STAGE_QUEUE_WAIT: job_wait})
+            video_bytes, cached = await self._render(question, timings)
+        finally:
+            get_render_pool().release()
+        # 작업 대기열 대기 시간 + 렌더 풀 대기 시간
+        timings[STAGE_QUEUE_WAIT] = job_wait + timings.get(STAGE_QUEUE_WAIT, 0.0)
+
+        await self._update(job, stage=STAGE_STORAGE_UPLOAD, stages=dict(timings), cached=cached)
+        upload_timings: StageTimings = {}
+        video_url, future = get_storage_manager().save_video_async(
+            video_bytes, question, force=True, timings=upload_timings
+        )
+        await asyncio.wrap_future(future)
+        observe_stages(upload_timings)
+        timings.update(upload_timings)
+
+        await self._finish(job, stages=timings, video_url=video_url, file_size_bytes=len(video_bytes))
+
+    async def _finish(self, job: Job, error: str | None = None, **changes):
+        """작업 완료/실패 처리 + 웹훅 전송"""
+        now = time.time()
+        await self._update(
+            job,
+            status=JOB_FAILED if error else JOB_COMPLETED,
+            stage=None,
+            error=error,
+            finished_at=now,
+            **changes,
+        )
+        if error:
+            self._failed += 1
+        else:
+            self._completed += 1
+            logger.info(
+                f"✅ 작업 완료: job_id={job.id}, {job.video_url} "
+                f"({now - job.created_at:.2f}s, cached={job.cached})"
+            )
+        if job.webhook_urls:
+            # 재시도까지 수십 초 걸릴 수 있으므로 워커는 기다리지 않고 다음 작업 처리
+            task = asyncio.create_task(self._send_webhook(job))
+            self._webhook_tasks.add(task)
+            task.add_done_callback(self._webhook_done)
+
+    def _webhook_done(self, task: asyncio.Task):
+        """끝난 웹훅 전송 제거 (예외는 로그만 남김)"""
+        self._webhook_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"❌ 웹훅 처리 실패: {task.exception()}")
+
+    async def _send_webhook(self, job: Job):
+        """완료 웹훅을 모든 URL에 동시에 전송 (하나라도 실패하면 webhook_status는 failed)"""
+        import httpx
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=JOB_WEBHOOK_TIMEOUT)
+        payload = job.to_response().model_dump(mode="json")
+        delivered = await asyncio.gather(*(self._post_webhook(job, url, payload) for url in job.webhook_urls))
+        await self._update(job, webhook_status=WEBHOOK_DELIVERED if all(delivered) else WEBHOOK_FAILED)
+
+    async def _post_webhook(self, job: Job, url: str, payload: dict) -> bool:
+        """웹훅 하나 전송 (GET /jobs/{id}와 같은 본문, 실패 시 1, 2, 4...초 간격으로 재시도), 성공 여부 반환"""
+        import httpx
+
+        # 등록 후 DNS가 내부 주소로 바뀌었을 수 있으므로 전송 직전에 다시 확인
+        try:
+            await check_webhook_url(url)
+        except WebhookURLError as e:
+            logger.warning(f"⚠️ 웹훅 전송 거절: job_id={job.id}, {e}")
+            return False
+
+        for attempt in range(JOB_WEBHOOK_RETRIES):
+            try:
+                response = await self._http.post(url, json=payload)
+                response.raise_for_status()
+                return True
+            except httpx.HTTPError as e:
+                logger.warning(
+                    f"⚠️ 웹훅 전송 실패 ({attempt + 1}/{JOB_WEBHOOK_RETRIES}): job_id={job.id}, {url}, {e}"
+                )
+                if attempt + 1 < JOB_WEBHOOK_RETRIES:
+                    await asyncio.sleep(2 ** attempt)
+        return False
+
+    async def _purge(self, force: bool = False):
+        """보관 시간이 지난 작업 삭제 (PURGE_INTERVAL_SECONDS마다 한 번)"""
+        now = time.time()
+        if not force and now - self._last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        try:
+            removed = await run_in_threadpool(self.store.purge, now - JOB_RETENTION_SECONDS)
+        except Exception as e:
+            logger.warning(f"작업 정리 실패: {e}")
+            return
+        if removed:
+            logger.info(f"🧹 끝난 작업 {removed}건 삭제")
+
+    def get_stats(self) -> dict:
+        """작업 대기열 통계"""
+        return {
+            "store": type(self.store).__name__,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "in_flight": len(self._in_flight),
+            "webhooks_in_flight": len(self._webhook_tasks),
+            "submitted": self._submitted,
+            "deduplicated": self._deduplicated,
+            "completed": self._completed,
+            "failed": self._failed,
+        }
+
+
+def _create_job_store() -> JobStore:
+    """환경 변수(JOB_STORE_TYPE)에 맞는 작업 저장소 생성"""
+    if JOB_STORE_TYPE == "sqlite":
+        return SQLiteJobStore(JOB_DB_PATH)
+    return MemoryJobStore()
+
+
+# 싱글톤 인스턴스
+_job_manager: JobManager | None = None
+
+
+def get_job_manager() -> JobManager:
+    """JobManager 싱글톤 인스턴스 반환"""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager(_create_job_store())
+    return _job_manager
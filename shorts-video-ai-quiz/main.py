@@ -4,22 +4,52 @@ FastAPI 서버 - 퀴즈 데이터를 받아 쇼츠 영상 생성
 """
 
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from concurrent.futures import Future
+from itertools import chain
+from typing import Iterator
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 
 from models import (
     QuizQuestion,
     GenerateRequest,
     GenerateResponse,
+    BatchGenerateRequest,
+    BatchGenerateResponse,
+    BatchItemResult,
+    OutputsGenerateRequest,
+    OutputsGenerateResponse,
+    OutputResult,
+    JobCreateRequest,
+    JobResponse,
     HealthResponse,
     ErrorResponse,
 )
-from video_generator import generate_quiz_video
+from video_generator import OUTPUT_PROFILES, stream_quiz_video
+from frame_renderer import get_font_cache_stats, get_emoji_atlas, get_text_layout_cache
+from render_pool import RenderQueueFull, get_render_pool
+from render_cache import get_render_cache, question_cache_key
+from preview import render_preview
+from jobs import JobQueueFull, WebhookURLError, check_webhook_url, get_job_manager
 from storage import get_storage_manager
+from single_flight import SingleFlight
+from warmup import get_warmup_state, run_warmup
+from metrics import (
+    PROMETHEUS_AVAILABLE,
+    STAGE_QUEUE_WAIT,
+    StageTimings,
+    observe_stages,
+    record_cache_lookup,
+    record_video,
+    register_gauges,
+    render_metrics,
+)
 
 # 환경 변수 로드
 load_dotenv()
@@ -31,6 +61,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 대기열이 가득 찼을 때 클라이언트에게 안내할 재시도 대기 시간 (초)
+RETRY_AFTER_SECONDS = int(os.getenv("RETRY_AFTER_SECONDS", "10"))
+
+# 배치 요청 하나에 담을 수 있는 최대 문제 수
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "50"))
+
+# 같은 문제(question_cache_key)의 동시 렌더링 요청은 한 번만 렌더링하고 결과 공유
+_render_flight: SingleFlight[tuple[bytes, bool, StageTimings]] = SingleFlight()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,8 +78,25 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Quiz Shorts Video Generator 시작")
     storage_manager = get_storage_manager()
     logger.info(f"📁 저장소 설정: {storage_manager.get_storage_info()}")
+    # 영상 생성은 이벤트 루프 밖의 프로세스 풀에서 실행
+    render_pool = get_render_pool()
+    render_pool.start()
+    # 에셋 로드 + 버리는 영상 인코딩 + 워커 준비는 백그라운드에서 진행 (끝날 때까지 /health는 503)
+    warmup_task = asyncio.create_task(run_warmup(render_pool))
+    register_gauges(
+        render_pool.get_stats,
+        lambda: get_render_cache().get_stats() if get_render_cache() else None,
+    )
+    # 비동기 작업(/jobs) 워커 시작 (SQLite 저장소면 이전에 끝나지 않은 작업도 다시 처리)
+    job_manager = get_job_manager()
+    await job_manager.start(lambda question, timings: _render_video(question, acquire=False, timings=timings))
     yield
     # 종료 시
+    warmup_task.cancel()
+    await job_manager.shutdown()
+    render_pool.shutdown()
+    # 진행 중인 업로드는 끝까지 완료
+    storage_manager.shutdown(wait=True)
     logger.info("👋 Quiz Shorts Video Generator 종료")
 
 
@@ -59,10 +115,21 @@ async def root():
     return HealthResponse(status="ok", version="1.0.0")
 
 
-@app.get("/health", response_model=HealthResponse)
+@app.get("/health", response_model=HealthResponse, responses={503: {"model": HealthResponse}})
 async def health_check():
-    """헬스체크 엔드포인트"""
-    return HealthResponse(status="ok", version="1.0.0")
+    """
+    헬스체크 엔드포인트 (readiness)
+    
+    시작 워밍업(에셋 로드, 버리는 영상 인코딩, 렌더 풀 워커 준비)이 끝날 때까지 503을 반환합니다.
+    warmup에 단계별 처리 시간이 담깁니다.
+    """
+    warmup = get_warmup_state()
+    if not warmup.ready:
+        return JSONResponse(
+            status_code=503,
+            content=HealthResponse(status="starting", version="1.0.0", warmup=warmup.to_dict()).model_dump(),
+        )
+    return HealthResponse(status="ok", version="1.0.0", warmup=warmup.to_dict())
 
 
 @app.get("/storage-info")
@@ -72,6 +139,183 @@ async def storage_info():
     return storage_manager.get_storage_info()
 
 
+@app.get("/cache-stats")
+async def cache_stats():
+    """렌더링 캐시 통계 확인"""
+    render_cache = get_render_cache()
+    return {
+        "fonts": get_font_cache_stats(),
+        "emoji": get_emoji_atlas().get_stats(),
+        "text": get_text_layout_cache().get_stats(),
+        "render": render_cache.get_stats() if render_cache else {"enabled": False},
+    }
+
+
+@app.get("/pool-stats")
+async def pool_stats():
+    """렌더 풀 상태 확인 (대기열 깊이, 대기 시간, 동시 요청 공유 수 등)"""
+    return {**get_render_pool().get_stats(), "single_flight": _render_flight.get_stats()}
+
+
+@app.get("/job-stats")
+async def job_stats():
+    """작업 대기열 상태 확인 (대기 중/진행 중 작업 수, 중복 제거 수 등)"""
+    return get_job_manager().get_stats()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 지표 (단계별 처리 시간 히스토그램, 퀴즈 유형별 요청 수, 캐시 적중률)"""
+    if not PROMETHEUS_AVAILABLE:
+        raise HTTPException(status_code=503, detail="prometheus-client가 설치되지 않았습니다")
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
+def _queue_full_error(e: RenderQueueFull) -> HTTPException:
+    """대기열 초과 응답 (429)"""
+    logger.warning(f"⏳ 요청 거절: {e}")
+    return HTTPException(
+        status_code=429,
+        detail=str(e),
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
+
+
+async def _get_cached_video(question: QuizQuestion) -> bytes | None:
+    """렌더 캐시에서 영상 조회 (캐시 비활성화 또는 미적중 시 None)"""
+    render_cache = get_render_cache()
+    if render_cache is None:
+        return None
+    cached = await run_in_threadpool(render_cache.get, question)
+    record_cache_lookup("render", cached is not None)
+    if cached is not None:
+        logger.info(f"⚡ 렌더 캐시 적중: question_id={question.id}, {len(cached)} bytes")
+    return cached
+
+
+async def _render_video(
+    question: QuizQuestion,
+    acquire: bool = True,
+    check_cache: bool = True,
+    timings: StageTimings | None = None,
+) -> tuple[bytes, bool]:
+    """
+    렌더 캐시 확인 후 렌더 풀에서 영상 생성 (대기열이 가득 차면 429)
+    같은 문제가 이미 렌더링 중이면 새로 렌더링하지 않고 그 결과를 기다림
+    풀 용량은 공유 렌더링에 들어가기 전에 호출마다 점유하므로, 먼저 들어온 호출이 429로 거절돼도
+    이미 용량을 점유한 호출(비동기 작업, 배치 항목)은 그 거절을 이어받지 않음
+    
+    Args:
+        question: 퀴즈 문제 데이터
+        acquire: 렌더 풀 용량 점유 여부 (비동기 작업/배치 항목처럼 호출 측이 이미 점유했으면 False)
+        check_cache: 렌더 캐시 조회 여부 (배치처럼 미리 일괄 확인해서 없는 것을 알면 False)
+        timings: 렌더링 단계별 처리 시간을 기록할 dict (캐시 적중 시 비어 있음)
+    
+    Returns:
+        tuple[bytes, bool]: (영상 바이트 데이터, 캐시 적중 여부)
+    """
+    quiz_type = question.quiz_type.value
+    if not check_cache:
+        record_cache_lookup("render", False)
+    elif acquire:
+        # 캐시 적중은 풀 용량과 무관하므로 용량을 점유하기 전에 확인
+        cached = await _get_cached_video(question)
+        if cached is not None:
+            record_video(quiz_type, "cached")
+            return cached, True
+        check_cache = False
+    
+    render_pool = get_render_pool()
+    if acquire:
+        try:
+            render_pool.acquire()
+        except RenderQueueFull as e:
+            record_video(quiz_type, "rejected")
+            raise _queue_full_error(e)
+    try:
+        (video_bytes, cached, stages), shared = await _render_flight.do(
+            question_cache_key(question),
+            lambda: _render_video_once(question, check_cache),
+        )
+    finally:
+        if acquire:
+            render_pool.release()
+    if shared:
+        record_video(quiz_type, "coalesced")
+        logger.info(f"🔗 진행 중인 렌더링 결과 공유: question_id={question.id}, {len(video_bytes)} bytes")
+    if timings is not None:
+        timings.update(stages)
+    return video_bytes, cached
+
+
+async def _render_video_once(
+    question: QuizQuestion,
+    check_cache: bool,
+) -> tuple[bytes, bool, StageTimings]:
+    """
+    _render_video 실제 처리 (같은 문제의 동시 요청 중 첫 요청만 실행)
+    풀 용량은 호출마다 _render_video에서 점유하므로 여기서는 점유하지 않음
+    
+    Returns:
+        tuple[bytes, bool, StageTimings]: (영상 바이트 데이터, 캐시 적중 여부, 렌더링 단계별 처리 시간)
+    """
+    quiz_type = question.quiz_type.value
+    cached = await _get_cached_video(question) if check_cache else None
+    if cached is not None:
+        record_video(quiz_type, "cached")
+        return cached, True, {}
+    
+    try:
+        result = await get_render_pool().render(question, acquire=False)
+    except Exception:
+        record_video(quiz_type, "error")
+        raise
+    
+    record_video(quiz_type, "rendered")
+    stages = {STAGE_QUEUE_WAIT: result.wait_seconds, **result.stages}
+    observe_stages(stages)
+    logger.info(
+        f"✅ 영상 생성 완료: {len(result.video_bytes)} bytes "
+        f"(대기 {result.wait_seconds:.2f}s, 렌더링 {result.render_seconds:.2f}s)"
+    )
+    
+    # 캐시 저장은 응답을 기다리게 하지 않도록 백그라운드 스레드에서 진행
+    render_cache = get_render_cache()
+    if render_cache is not None:
+        asyncio.get_running_loop().run_in_executor(None, render_cache.put, question, result.video_bytes)
+    return result.video_bytes, False, stages
+
+
+def _upload_callback(question: QuizQuestion, timings: StageTimings):
+    """업로드 완료 콜백 (업로드 시간 기록 + 결과 로그, 업로드 스레드에서 실행)"""
+    def callback(future: Future):
+        error = future.exception()
+        if error is not None:
+            logger.error(f"❌ 영상 업로드 실패: question_id={question.id}, {error}")
+            return
+        observe_stages(timings)
+        logger.info(f"💾 저장 완료: {future.result()}")
+    return callback
+
+
+def _save_video_in_background(video_bytes: bytes, question: QuizQuestion, force: bool = False) -> tuple[str, Future] | None:
+    """
+    업로드 스레드 풀에서 영상 저장 (응답은 업로드를 기다리지 않음)
+    
+    Returns:
+        tuple[str, Future] | None: (저장될 경로/URL, 업로드 Future) (저장하지 않으면 None)
+    """
+    timings: StageTimings = {}
+    return get_storage_manager().save_video_async(
+        video_bytes,
+        question,
+        force,
+        timings=timings,
+        callback=_upload_callback(question, timings),
+    )
+
+
 @app.post(
     "/generate",
     responses={
@@ -80,10 +324,11 @@ async def storage_info():
             "description": "생성된 MP4 영상 파일",
         },
         400: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
         500: {"model": ErrorResponse},
     },
 )
-async def generate_video(request: GenerateRequest):
+async def generate_video(request: GenerateRequest, stream: bool = False):
     """
     퀴즈 영상 생성
     
@@ -92,31 +337,26 @@ async def generate_video(request: GenerateRequest):
     - 0-3초: 인트로 (퀴즈 유형, 난이도)
     - 3-13초: 문제 + 선택지 + 10초 카운트다운
     - 13-20초: 정답 + 해설
+    
+    stream=true이면 인코더가 출력하는 대로 fragmented MP4를 청크 단위로 전송합니다.
     """
     question = request.question
-    logger.info(f"🎬 영상 생성 요청: question_id={question.id}, type={question.quiz_type}")
+    logger.info(f"🎬 영상 생성 요청: question_id={question.id}, type={question.quiz_type}, stream={stream}")
+    
+    cached = None
+    if stream:
+        # 캐시에 있으면 스트리밍할 필요 없이 바로 반환
+        cached = await _get_cached_video(question)
+        if cached is None:
+            return await _stream_video_response(question)
+        record_video(question.quiz_type.value, "cached")
     
     try:
         # 영상 생성
-        video_bytes, temp_path = generate_quiz_video(question)
-        logger.info(f"✅ 영상 생성 완료: {len(video_bytes)} bytes")
-        
-        # 디버그 모드일 때 저장
-        storage_manager = get_storage_manager()
-        saved_path = storage_manager.save_video(video_bytes, question)
-        if saved_path:
-            logger.info(f"💾 디버그 저장: {saved_path}")
+        video_bytes = cached if cached is not None else (await _render_video(question))[0]
         
-        # 임시 파일 삭제
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-                # 빈 디렉토리도 삭제
-                temp_dir = os.path.dirname(temp_path)
-                if os.path.isdir(temp_dir) and not os.listdir(temp_dir):
-                    os.rmdir(temp_dir)
-            except Exception as e:
-                logger.warning(f"임시 파일 삭제 실패: {e}")
+        # 디버그 모드일 때 저장 (백그라운드 업로드, 완료 시 콜백에서 로그)
+        _save_video_in_background(video_bytes, question)
         
         # MP4 응답 반환
         return Response(
@@ -129,52 +369,136 @@ async def generate_video(request: GenerateRequest):
             },
         )
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 영상 생성 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"영상 생성 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+def _iter_and_save(
+    question: QuizQuestion,
+    chunks: Iterator[bytes],
+    timings: StageTimings,
+) -> Iterator[bytes]:
+    """
+    스트리밍 청크 전달 + 디버그 저장 (끝나면 렌더 풀 용량 반환)
+    디버그 저장은 청크를 모아두지 않고 전송과 동시에 업로드 스레드로 넘겨 청크 단위로 업로드
+    호출 측이 첫 청크를 미리 받아 시작시켜야 함 - 시작하지 않은 제너레이터는 닫혀도 finally가 실행되지 않음
+    """
+    upload_timings: StageTimings = {}
+    upload = get_storage_manager().open_video_upload(
+        question,
+        timings=upload_timings,
+        callback=_upload_callback(question, upload_timings),
+    )
+    completed = False
+    try:
+        for chunk in chunks:
+            if upload is not None:
+                upload.write(chunk)
+            yield chunk
+        completed = True
+        
+        logger.info(f"✅ 영상 스트리밍 완료: question_id={question.id}")
+        record_video(question.quiz_type.value, "streamed")
+        observe_stages(timings)
+    finally:
+        if upload is not None:
+            # 인코딩 실패/연결 끊김이면 불완전한 영상이 저장되지 않도록 업로드 취소
+            if completed:
+                upload.close()
+            else:
+                upload.abort()
+        chunks.close()
+        get_render_pool().release()
+
+
+async def _stream_video_response(question: QuizQuestion) -> StreamingResponse:
+    """
+    fragmented MP4 스트리밍 응답 생성
+    인코딩은 ffmpeg 프로세스에서 진행되므로 렌더 풀 워커 대신 스레드에서 실행하되,
+    같은 용량 제한(back-pressure)을 받도록 풀 용량을 점유
+    """
+    render_pool = get_render_pool()
+    try:
+        render_pool.acquire()
+    except RenderQueueFull as e:
+        record_video(question.quiz_type.value, "rejected")
+        raise _queue_full_error(e)
+    
+    # 스트리밍은 이 프로세스에서 인코딩하므로 대기열 대기 시간 없음
+    timings: StageTimings = {}
+    body = _iter_and_save(question, stream_quiz_video(question, timings), timings)
+    try:
+        # 첫 청크까지는 미리 받아서 렌더링/인코더 시작 오류를 500으로 반환
+        # body를 여기서 시작시켜두면 응답 본문을 한 번도 읽지 않고 버려져도(연결 끊김 등)
+        # 닫히거나 수거될 때 finally가 실행되어 풀 용량이 반환됨 (실패 시에는 이미 반환됨)
+        first_chunk = await run_in_threadpool(next, body)
     except Exception as e:
+        record_video(question.quiz_type.value, "error")
         logger.error(f"❌ 영상 생성 실패: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"영상 생성 중 오류가 발생했습니다: {str(e)}",
         )
+    
+    return StreamingResponse(
+        chain([first_chunk], body),
+        media_type="video/mp4",
+        headers={
+            "Content-Disposition": f'attachment; filename="quiz_{question.id}.mp4"',
+            "X-Question-ID": str(question.id),
+        },
+    )
 
 
-@app.post("/generate-json", response_model=GenerateResponse)
-async def generate_video_json(request: GenerateRequest):
+@app.post(
+    "/generate-json",
+    response_model=GenerateResponse,
+    responses={429: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+)
+async def generate_video_json(request: GenerateRequest, wait_upload: bool = False):
     """
     퀴즈 영상 생성 (JSON 응답)
     
     영상을 생성하고 메타데이터를 JSON으로 반환합니다.
     DEBUG_SAVE_VIDEO=true일 때만 영상이 저장됩니다.
+    
+    업로드는 백그라운드에서 진행되며 video_url은 저장될 위치입니다.
+    wait_upload=true이면 업로드가 끝난 뒤 응답합니다.
     """
     question = request.question
     logger.info(f"🎬 영상 생성 요청 (JSON): question_id={question.id}")
     
     try:
         # 영상 생성
-        video_bytes, temp_path = generate_quiz_video(question)
-        logger.info(f"✅ 영상 생성 완료: {len(video_bytes)} bytes")
-        
-        # 저장
-        storage_manager = get_storage_manager()
-        saved_path = storage_manager.save_video(video_bytes, question)
+        video_bytes, _ = await _render_video(question)
         
-        # 임시 파일 삭제
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-                temp_dir = os.path.dirname(temp_path)
-                if os.path.isdir(temp_dir) and not os.listdir(temp_dir):
-                    os.rmdir(temp_dir)
-            except Exception as e:
-                logger.warning(f"임시 파일 삭제 실패: {e}")
+        # 저장 (업로드 스레드 풀에서 진행)
+        saved_path = None
+        message = "영상 생성 완료"
+        upload = _save_video_in_background(video_bytes, question)
+        if upload is not None:
+            saved_path, future = upload
+            if wait_upload:
+                await asyncio.wrap_future(future)
+            else:
+                message = "영상 생성 완료 (업로드 진행 중)"
         
         return GenerateResponse(
             success=True,
             question_id=question.id,
-            message="영상 생성 완료",
+            message=message,
             video_url=saved_path,
             file_size_bytes=len(video_bytes),
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 영상 생성 실패: {e}", exc_info=True)
         raise HTTPException(
@@ -183,6 +507,273 @@ async def generate_video_json(request: GenerateRequest):
         )
 
 
+async def _generate_batch_item(
+    question: QuizQuestion,
+    semaphore: asyncio.Semaphore,
+    admission_slot: list[bool],
+    check_cache: bool,
+) -> BatchItemResult:
+    """배치 항목 하나 생성 + 저장 (실패해도 다른 항목은 계속 진행)"""
+    render_pool = get_render_pool()
+    try:
+        async with semaphore:
+            # 실행 중인 항목마다 풀 용량을 한 칸씩 점유 (첫 항목은 배치 시작 시 점유한 칸을 넘겨받음)
+            if admission_slot:
+                admission_slot.pop()
+            else:
+                await render_pool.acquire_waiting()
+            try:
+                video_bytes, cached = await _render_video(question, acquire=False, check_cache=check_cache)
+            finally:
+                render_pool.release()
+        
+        # manifest의 URL은 업로드가 끝난 뒤 반환 (업로드 스레드 풀에서 진행, 이벤트 루프는 블로킹하지 않음)
+        saved_path, future = _save_video_in_background(video_bytes, question, force=True)
+        await asyncio.wrap_future(future)
+        return BatchItemResult(
+            question_id=question.id,
+            success=True,
+            video_url=saved_path,
+            file_size_bytes=len(video_bytes),
+            cached=cached,
+        )
+    except Exception as e:
+        logger.error(f"❌ 배치 항목 생성 실패: question_id={question.id}, {e}", exc_info=True)
+        return BatchItemResult(question_id=question.id, success=False, error=str(e))
+
+
+@app.post(
+    "/generate-batch",
+    response_model=BatchGenerateResponse,
+    responses={400: {"model": ErrorResponse}, 429: {"model": ErrorResponse}},
+)
+async def generate_video_batch(request: BatchGenerateRequest):
+    """
+    퀴즈 영상 배치 생성
+    
+    여러 문제를 렌더 풀 워커 수만큼 병렬로 생성하고, 저장소에 저장한 뒤 문제별 URL 목록(manifest)을 반환합니다.
+    워커는 폰트/이모지/배경음악/효과음을 프로세스 시작 시 한 번만 로드해 재사용합니다.
+    풀이 가득 차 있으면 429로 거절하고, 받아들인 뒤에는 실행 중인 항목마다 렌더 풀 용량을 한 칸씩 점유합니다.
+    """
+    questions = request.questions
+    if len(questions) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"배치 크기는 최대 {MAX_BATCH_SIZE}개입니다 (요청: {len(questions)}개)",
+        )
+    logger.info(f"🎬 배치 영상 생성 요청: {len(questions)}개")
+    
+    render_pool = get_render_pool()
+    try:
+        render_pool.acquire()
+    except RenderQueueFull as e:
+        raise _queue_full_error(e)
+    # 받아들일 때 점유한 칸 - 첫 항목이 넘겨받고, 항목이 시작되기 전에 끝나면 아래에서 반환
+    admission_slot = [True]
+    
+    try:
+        # 캐시 존재 여부는 문제마다 조회하지 않고 한 번에 확인 (GCS는 목록 조회 한 번)
+        render_cache = get_render_cache()
+        cached_keys = await run_in_threadpool(render_cache.contains_many, questions) if render_cache else set()
+        
+        semaphore = asyncio.Semaphore(render_pool.workers)
+        results = await asyncio.gather(
+            *(
+                _generate_batch_item(
+                    question,
+                    semaphore,
+                    admission_slot,
+                    check_cache=render_cache is None or question_cache_key(question) in cached_keys,
+                )
+                for question in questions
+            )
+        )
+    finally:
+        if admission_slot:
+            render_pool.release()
+    
+    succeeded = sum(1 for result in results if result.success)
+    logger.info(f"✅ 배치 영상 생성 완료: {succeeded}/{len(results)}개 성공")
+    return BatchGenerateResponse(
+        success=succeeded == len(results),
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+    )
+
+
+@app.post(
+    "/generate-outputs",
+    response_model=OutputsGenerateResponse,
+    responses={400: {"model": ErrorResponse}, 429: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+)
+async def generate_outputs(request: OutputsGenerateRequest):
+    """
+    출력 프로필별 생성
+    
+    한 번 렌더링한 프레임을 ffmpeg 하나로 여러 해상도/형식(1080p 쇼츠, 720p 미리보기, 정사각형 피드,
+    애니메이션 WebP/GIF 썸네일, 포스터 JPEG)으로 동시에 출력하고, 저장소에 저장한 뒤 프로필별 URL을 반환합니다.
+    결과를 URL로 돌려주기 위해 `DEBUG_SAVE_VIDEO` 설정과 관계없이 `STORAGE_TYPE` 저장소에 저장합니다.
+    """
+    question = request.question
+    profile_names = list(dict.fromkeys(request.profiles or OUTPUT_PROFILES))
+    unknown = [name for name in profile_names if name not in OUTPUT_PROFILES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 출력 프로필: {', '.join(unknown)} (사용 가능: {', '.join(OUTPUT_PROFILES)})",
+        )
+    logger.info(f"🎬 출력 프로필 생성 요청: question_id={question.id}, profiles={profile_names}")
+    
+    quiz_type = question.quiz_type.value
+    try:
+        result = await get_render_pool().render_outputs(question, profile_names)
+    except RenderQueueFull as e:
+        record_video(quiz_type, "rejected")
+        raise _queue_full_error(e)
+    except Exception as e:
+        record_video(quiz_type, "error")
+        logger.error(f"❌ 출력 프로필 생성 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"영상 생성 중 오류가 발생했습니다: {str(e)}",
+        )
+    
+    record_video(quiz_type, "rendered")
+    observe_stages({STAGE_QUEUE_WAIT: result.wait_seconds, **result.stages})
+    logger.info(
+        f"✅ 출력 프로필 생성 완료: {', '.join(f'{name}={len(data)}B' for name, data in result.outputs.items())} "
+        f"(대기 {result.wait_seconds:.2f}s, 렌더링 {result.render_seconds:.2f}s)"
+    )
+    
+    # 프로필별 업로드는 업로드 스레드 풀에서 동시에 진행
+    outputs = []
+    uploads = []
+    storage_manager = get_storage_manager()
+    for name, data in result.outputs.items():
+        profile = OUTPUT_PROFILES[name]
+        timings: StageTimings = {}
+        saved_path, future = storage_manager.save_video_async(
+            data,
+            question,
+            force=True,
+            timings=timings,
+            callback=_upload_callback(question, timings),
+            variant=name,
+            extension=profile.extension,
+            content_type=profile.media_type,
+        )
+        uploads.append(asyncio.wrap_future(future))
+        outputs.append(
+            OutputResult(profile=name, media_type=profile.media_type, url=saved_path, file_size_bytes=len(data))
+        )
+    try:
+        await asyncio.gather(*uploads)
+    except Exception as e:
+        logger.error(f"❌ 출력 저장 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"출력 저장 중 오류가 발생했습니다: {str(e)}",
+        )
+    
+    return OutputsGenerateResponse(success=True, question_id=question.id, outputs=outputs)
+
+
+@app.post(
+    "/preview",
+    responses={
+        200: {
+            "content": {"image/png": {}, "image/webp": {}, "image/jpeg": {}},
+            "description": "주요 장면 이미지 또는 컨택트 시트",
+        },
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+)
+async def preview(
+    request: GenerateRequest,
+    frame: str | None = None,
+    format: str = "png",
+    scale: float | None = None,
+):
+    """
+    미리보기 이미지 생성 (영상 인코딩 없음)
+    
+    영상을 만들지 않고 주요 장면(intro, question, answer, account)만 렌더링해서 이미지로 반환합니다.
+    frame을 지정하면 해당 장면 한 장, 생략하면 4개 장면을 가로로 이어 붙인 컨택트 시트를 반환합니다.
+    렌더 풀을 거치지 않고 요청 스레드에서 바로 렌더링하므로 수십 ms 안에 응답합니다.
+    """
+    question = request.question
+    try:
+        content, media_type = await run_in_threadpool(render_preview, question, frame, format, scale)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ 미리보기 생성 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"미리보기 생성 중 오류가 발생했습니다: {str(e)}",
+        )
+    
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"X-Question-ID": str(question.id)},
+    )
+
+
+@app.post(
+    "/jobs",
+    response_model=JobResponse,
+    status_code=202,
+    responses={
+        400: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+    },
+)
+async def create_job(request: JobCreateRequest):
+    """
+    비동기 영상 생성 작업 등록
+    
+    렌더링을 기다리지 않고 작업 ID를 바로 반환합니다. 진행 상황은 `GET /jobs/{job_id}`로 확인하고,
+    webhook_url을 넣으면 작업이 끝났을 때 같은 본문을 POST로 받습니다.
+    내부 주소(사설/루프백/링크 로컬 대역)로 확인되는 URL이나 `JOB_WEBHOOK_ALLOWED_HOSTS`에 없는 호스트는 400으로 거절합니다.
+    같은 문제(id 제외)의 작업이 진행 중이면 새 작업을 만들지 않고 기존 작업을 반환합니다 (deduplicated=true).
+    결과를 URL로 돌려주기 위해 `DEBUG_SAVE_VIDEO` 설정과 관계없이 `STORAGE_TYPE` 저장소에 저장합니다.
+    """
+    question = request.question
+    webhook_url = str(request.webhook_url) if request.webhook_url else None
+    if webhook_url:
+        try:
+            await check_webhook_url(webhook_url)
+        except WebhookURLError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    try:
+        job, deduplicated = await get_job_manager().submit(question, webhook_url)
+    except JobQueueFull as e:
+        logger.warning(f"⏳ 작업 거절: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+    return job.to_response(deduplicated)
+
+
+@app.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse}},
+)
+async def get_job(job_id: str):
+    """비동기 영상 생성 작업 상태 조회 (진행 중인 단계, 끝난 단계별 처리 시간, 결과 URL)"""
+    job = await get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return job.to_response()
+
+
 # 개발 서버 실행
 if __name__ == "__main__":
     import uvicorn
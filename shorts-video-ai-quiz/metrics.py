@@ -0,0 +1,137 @@
+"""
+Metrics - 단계별 처리 시간 측정 + Prometheus 지표
+prometheus_client가 설치되지 않은 환경에서는 측정값 기록만 생략 (/metrics는 503)
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+# 단계 이름
+STAGE_QUEUE_WAIT = "queue_wait"  # 렌더 풀 대기열
+STAGE_RENDER = "render"  # 프레임 렌더링
+STAGE_AUDIO_MIX = "audio_mix"  # 오디오 베드 준비
+STAGE_ENCODE = "encode"  # 인코딩 + 세그먼트 이어 붙이기
+STAGE_ENCODE_STREAM = "encode_stream"  # 스트리밍 응답 인코딩 (클라이언트가 청크를 받는 속도에 따라 길어짐)
+STAGE_STORAGE_UPLOAD = "storage_upload"  # 저장소 업로드
+
+# 단계별 처리 시간 = {단계 이름: 초}
+StageTimings = dict[str, float]
+
+# 히스토그램 구간 (초) - 캐시된 에셋 로드(수 ms)부터 MoviePy 인코딩(수십 초)까지
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+if PROMETHEUS_AVAILABLE:
+    STAGE_SECONDS = Histogram(
+        "quiz_video_stage_seconds",
+        "영상 생성 단계별 처리 시간 (초)",
+        ["stage"],
+        buckets=STAGE_BUCKETS,
+    )
+    VIDEOS_TOTAL = Counter(
+        "quiz_video_requests_total",
+        "퀴즈 유형/결과별 영상 요청 수",
+        ["quiz_type", "result"],
+    )
+    CACHE_LOOKUPS_TOTAL = Counter(
+        "quiz_video_cache_lookups_total",
+        "캐시 조회 수 (hit/miss)",
+        ["cache", "result"],
+    )
+    STARTUP_SECONDS = Gauge(
+        "quiz_video_startup_phase_seconds",
+        "시작 워밍업 단계별 처리 시간 (초)",
+        ["phase"],
+    )
+
+# register_gauges() 중복 등록 방지 (Prometheus 레지스트리는 같은 이름을 두 번 등록할 수 없음)
+_gauges_registered = False
+
+
+@contextmanager
+def timed(timings: StageTimings | None, stage: str):
+    """with 블록 실행 시간을 timings[stage]에 더함 (timings가 None이면 측정하지 않음)"""
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - started
+
+
+def observe_stages(timings: StageTimings):
+    """단계별 처리 시간을 히스토그램에 기록"""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.labels(stage=stage).observe(seconds)
+
+
+def record_video(quiz_type: str, result: str):
+    """
+    영상 요청 결과 기록
+
+    Args:
+        quiz_type: 퀴즈 유형 값 (jp_to_kr 등)
+        result: rendered / cached / coalesced / streamed / rejected / error
+    """
+    if PROMETHEUS_AVAILABLE:
+        VIDEOS_TOTAL.labels(quiz_type=quiz_type, result=result).inc()
+
+
+def record_startup(phases: StageTimings):
+    """시작 워밍업 단계별 처리 시간 기록"""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    for phase, seconds in phases.items():
+        STARTUP_SECONDS.labels(phase=phase).set(seconds)
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """캐시 조회 결과 기록"""
+    if PROMETHEUS_AVAILABLE:
+        CACHE_LOOKUPS_TOTAL.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def register_gauges(pool_stats: Callable[[], dict], cache_stats: Callable[[], dict | None]):
+    """
+    렌더 풀/렌더 캐시 상태 게이지 등록 (스크랩 시점에 값을 읽음)
+
+    Args:
+        pool_stats: RenderPool.get_stats
+        cache_stats: 렌더 캐시 통계 반환 함수 (비활성화면 None 반환)
+    """
+    global _gauges_registered
+    if not PROMETHEUS_AVAILABLE or _gauges_registered:
+        return
+    _gauges_registered = True
+
+    Gauge("quiz_video_pool_in_flight", "렌더 풀 실행 중 + 대기 중 요청 수").set_function(
+        lambda: pool_stats()["in_flight"]
+    )
+    Gauge("quiz_video_pool_queue_depth", "렌더 풀 대기열 깊이").set_function(
+        lambda: pool_stats()["queue_depth"]
+    )
+    Gauge("quiz_video_render_cache_hit_ratio", "렌더 캐시 적중률 (프로세스 시작 이후)").set_function(
+        lambda: (cache_stats() or {}).get("hit_rate", 0.0)
+    )
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Prometheus 텍스트 형식 지표
+
+    Returns:
+        tuple[bytes, str]: (본문, Content-Type)
+    """
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -2,7 +2,7 @@
 Pydantic models for Quiz Shorts Video Generator API
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, HttpUrl
 from enum import Enum
 
 
@@ -59,10 +59,84 @@ class GenerateResponse(BaseModel):
     file_size_bytes: int | None = None
 
 
+class BatchGenerateRequest(BaseModel):
+    """배치 영상 생성 요청"""
+    questions: list[QuizQuestion] = Field(..., min_length=1, description="영상으로 만들 퀴즈 문제 목록")
+
+
+class BatchItemResult(BaseModel):
+    """배치 영상 생성 결과 (문제별)"""
+    question_id: int
+    success: bool
+    video_url: str | None = None  # 저장된 영상 경로/URL
+    file_size_bytes: int | None = None
+    cached: bool = False  # 렌더 캐시 적중 여부
+    error: str | None = None
+
+
+class BatchGenerateResponse(BaseModel):
+    """배치 영상 생성 응답 (manifest)"""
+    success: bool
+    total: int
+    succeeded: int
+    failed: int
+    results: list[BatchItemResult]
+
+
+class OutputsGenerateRequest(BaseModel):
+    """출력 프로필별 생성 요청"""
+    question: QuizQuestion
+    profiles: list[str] | None = Field(
+        None,
+        min_length=1,
+        description="출력 프로필 이름 목록 (shorts_1080p, preview_720p, square_1080, thumbnail_webp, thumbnail_gif, poster_jpeg - 없으면 전체)",
+    )
+
+
+class OutputResult(BaseModel):
+    """출력 프로필 하나의 결과"""
+    profile: str
+    media_type: str
+    url: str | None = None  # 저장된 경로/URL
+    file_size_bytes: int
+
+
+class OutputsGenerateResponse(BaseModel):
+    """출력 프로필별 생성 응답"""
+    success: bool
+    question_id: int
+    outputs: list[OutputResult]
+
+
+class JobCreateRequest(BaseModel):
+    """비동기 영상 생성 작업 요청"""
+    question: QuizQuestion
+    webhook_url: HttpUrl | None = Field(None, description="작업이 끝나면 결과(GET /jobs/{id}와 같은 본문)를 POST할 URL")
+
+
+class JobResponse(BaseModel):
+    """비동기 영상 생성 작업 상태"""
+    job_id: str
+    status: str  # queued / running / completed / failed
+    stage: str | None = None  # 진행 중인 단계 (queue_wait / render / storage_upload, 끝나면 None)
+    stages: dict[str, float] = Field(default_factory=dict)  # 끝난 단계별 처리 시간 (초)
+    question_id: int
+    video_url: str | None = None  # 저장된 영상 경로/URL
+    file_size_bytes: int | None = None
+    cached: bool = False  # 렌더 캐시 적중 여부
+    error: str | None = None
+    webhook_status: str | None = None  # delivered / failed (웹훅이 없거나 보내기 전이면 None)
+    deduplicated: bool = False  # 진행 중인 같은 문제의 작업을 반환했는지 여부
+    created_at: float
+    updated_at: float
+    finished_at: float | None = None
+
+
 class HealthResponse(BaseModel):
     """헬스체크 응답"""
-    status: str = "ok"
+    status: str = "ok"  # ok / starting (워밍업 중)
     version: str = "1.0.0"
+    warmup: dict | None = None  # 워밍업 상태 (ready, error, phases, workers_ready, total_seconds)
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,144 @@
+"""
+Preview - 영상 인코딩 없이 주요 장면만 이미지로 렌더링
+인트로, 문제(카운트다운 10), 정답, 계정 정보 프레임을 한 장씩 또는 한 장의 컨택트 시트로 반환
+렌더러 캐시(폰트, 이모지 아틀라스, 텍스트 레이아웃, 그라데이션 배경)를 그대로 사용하므로 수십 ms 안에 응답
+"""
+
+import io
+from functools import lru_cache
+
+from PIL import Image
+
+from models import QuizQuestion
+from frame_renderer import (
+    render_intro_frame,
+    render_question_base,
+    render_countdown_overlay,
+    render_answer_frame,
+    render_account_frame,
+    BACKGROUND_COLOR,
+)
+
+# 주요 장면 (재생 순서)
+PREVIEW_FRAMES = ("intro", "question", "answer", "account")
+PREVIEW_COUNTDOWN = 10  # 문제 장면의 카운트다운 (문제 화면 첫 프레임)
+
+# 이미지 형식: (Pillow 형식, MIME 타입, 저장 옵션) - 속도 우선 (PNG 압축 단계 낮춤, WebP 빠른 방식)
+PREVIEW_FORMATS = {
+    "png": ("PNG", "image/png", {"compress_level": 1}),
+    "webp": ("WEBP", "image/webp", {"quality": 80, "method": 0}),
+    "jpeg": ("JPEG", "image/jpeg", {"quality": 85}),
+}
+
+# 축소 비율 (원본 WIDTH x HEIGHT 기준) - 인코딩 시간은 이미지 면적에 비례
+DEFAULT_FRAME_SCALE = 0.5  # 장면 한 장: 540x960
+DEFAULT_SHEET_SCALE = 0.25  # 컨택트 시트: 270x480 x 4장
+MIN_PREVIEW_SCALE = 0.1
+
+# 컨택트 시트 프레임 사이 여백 (px, 축소 후 기준)
+SHEET_GAP = 24
+
+
+@lru_cache(maxsize=1)
+def _account_frame() -> Image.Image:
+    """계정 정보 프레임 (문제와 무관하므로 한 번만 렌더링, 읽기 전용으로 사용)"""
+    return render_account_frame()
+
+
+def render_key_frames(question: QuizQuestion, frames: tuple[str, ...] = PREVIEW_FRAMES) -> dict[str, Image.Image]:
+    """
+    주요 장면 렌더링
+
+    Args:
+        question: 퀴즈 문제 데이터
+        frames: 렌더링할 장면 이름 (PREVIEW_FRAMES 중)
+
+    Returns:
+        dict[str, Image.Image]: {장면 이름: 프레임 이미지}
+    """
+    renderers = {
+        "intro": lambda: render_intro_frame(question),
+        "question": lambda: render_countdown_overlay(render_question_base(question), PREVIEW_COUNTDOWN),
+        "answer": lambda: render_answer_frame(question),
+        "account": _account_frame,
+    }
+    return {name: renderers[name]() for name in frames}
+
+
+def _scaled(img: Image.Image, scale: float) -> Image.Image:
+    """축소 (정수배 축소는 reduce, 그 외는 BOX 필터 - 둘 다 LANCZOS보다 훨씬 빠름)"""
+    if scale >= 1.0:
+        return img
+    factor = round(1 / scale)
+    if abs(1 / factor - scale) < 1e-6:
+        return img.reduce(factor)
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img.resize(size, Image.Resampling.BOX)
+
+
+def build_contact_sheet(images: list[Image.Image], scale: float = DEFAULT_SHEET_SCALE) -> Image.Image:
+    """프레임을 축소해서 가로로 이어 붙인 컨택트 시트"""
+    tiles = [_scaled(img, scale) for img in images]
+    tile_width = max(tile.width for tile in tiles)
+    tile_height = max(tile.height for tile in tiles)
+    sheet = Image.new(
+        "RGB",
+        (tile_width * len(tiles) + SHEET_GAP * (len(tiles) + 1), tile_height + SHEET_GAP * 2),
+        BACKGROUND_COLOR,
+    )
+    for index, tile in enumerate(tiles):
+        sheet.paste(tile, (SHEET_GAP + index * (tile_width + SHEET_GAP), SHEET_GAP))
+    return sheet
+
+
+def encode_image(img: Image.Image, image_format: str) -> tuple[bytes, str]:
+    """
+    이미지 인코딩
+
+    Returns:
+        tuple[bytes, str]: (이미지 바이트, MIME 타입)
+    """
+    pil_format, media_type, options = PREVIEW_FORMATS[image_format]
+    buffer = io.BytesIO()
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    img.save(buffer, format=pil_format, **options)
+    return buffer.getvalue(), media_type
+
+
+def render_preview(
+    question: QuizQuestion,
+    frame: str | None = None,
+    image_format: str = "png",
+    scale: float | None = None,
+) -> tuple[bytes, str]:
+    """
+    미리보기 이미지 생성 (영상 인코딩 없음)
+
+    Args:
+        question: 퀴즈 문제 데이터
+        frame: 장면 이름 (None이면 4개 장면 컨택트 시트)
+        image_format: 이미지 형식 ("png" / "webp" / "jpeg")
+        scale: 축소 비율 (MIN_PREVIEW_SCALE ~ 1.0, 원본 WIDTH x HEIGHT 기준,
+            None이면 장면 한 장은 DEFAULT_FRAME_SCALE, 컨택트 시트는 DEFAULT_SHEET_SCALE)
+
+    Returns:
+        tuple[bytes, str]: (이미지 바이트, MIME 타입)
+
+    Raises:
+        ValueError: 없는 장면/형식 또는 범위를 벗어난 축소 비율
+    """
+    if frame is not None and frame not in PREVIEW_FRAMES:
+        raise ValueError(f"알 수 없는 장면: {frame} (사용 가능: {', '.join(PREVIEW_FRAMES)})")
+    if image_format not in PREVIEW_FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {image_format} (사용 가능: {', '.join(PREVIEW_FORMATS)})")
+    if scale is None:
+        scale = DEFAULT_FRAME_SCALE if frame is not None else DEFAULT_SHEET_SCALE
+    if not MIN_PREVIEW_SCALE <= scale <= 1.0:
+        raise ValueError(f"scale은 {MIN_PREVIEW_SCALE} ~ 1.0 범위여야 합니다 (요청: {scale})")
+
+    if frame is not None:
+        img = _scaled(render_key_frames(question, (frame,))[frame], scale)
+    else:
+        img = build_contact_sheet(list(render_key_frames(question).values()), scale)
+    return encode_image(img, image_format)
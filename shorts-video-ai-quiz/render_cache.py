@@ -0,0 +1,214 @@
+"""
+Render Cache - QuizQuestion 내용 기반(content-addressed) 영상 캐시
+같은 문제를 다시 생성하면 렌더링/인코딩 없이 저장된 MP4 반환
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+import unicodedata
+from functools import lru_cache
+
+from models import QuizQuestion
+from storage import StorageBackend, LocalStorage, GCSStorage
+import frame_renderer
+import video_generator
+
+logger = logging.getLogger(__name__)
+
+
+# 렌더러 버전 - 프레임 레이아웃/인코딩 결과가 바뀌는 변경 시 올려서 기존 캐시 무효화
+RENDERER_VERSION = "1"
+
+# 캐시 설정
+RENDER_CACHE_ENABLED = os.getenv("RENDER_CACHE_ENABLED", "true").lower() == "true"
+RENDER_CACHE_DIR = os.getenv("RENDER_CACHE_DIR", "./cache")
+RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))  # 1GB
+RENDER_CACHE_PREFIX = "cache"  # GCS 사용 시 블롭 prefix
+
+
+def _normalize(value):
+    """문자열은 NFC 정규화 (같은 글자가 다른 조합형으로 들어와도 같은 키)"""
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    return value
+
+
+@lru_cache(maxsize=1)
+def get_asset_version() -> str:
+    """
+    에셋 버전 (assets 폴더 파일 내용 + 선택된 폰트 파일 해시)
+    프로세스당 한 번만 계산
+    """
+    digest = hashlib.sha256()
+    assets_dir = frame_renderer.ASSETS_DIR
+    if assets_dir.exists():
+        for file_path in sorted(p for p in assets_dir.rglob("*") if p.is_file()):
+            digest.update(str(file_path.relative_to(assets_dir)).encode())
+            digest.update(file_path.read_bytes())
+
+    # 시스템 폰트는 경로 + 크기로 구분 (assets 밖에 있을 수 있음)
+    for source in frame_renderer.resolve_fonts().values():
+        if source is None:
+            digest.update(b"default-font")
+            continue
+        font_path, index = source
+        size = os.path.getsize(font_path) if os.path.exists(font_path) else -1
+        digest.update(f"{font_path}:{index}:{size}".encode())
+    return digest.hexdigest()[:16]
+
+
+def get_renderer_version() -> str:
+    """렌더러 버전 (코드 버전 + 영상 규격 + 인코딩 모드)"""
+    return ":".join(
+        str(value)
+        for value in (
+            RENDERER_VERSION,
+            frame_renderer.WIDTH,
+            frame_renderer.HEIGHT,
+            video_generator.FPS,
+            video_generator.TOTAL_DURATION,
+            video_generator.VIDEO_ENCODE_MODE,
+        )
+    )
+
+
+def question_cache_key(question: QuizQuestion) -> str:
+    """
+    문제 내용 + 렌더러/에셋 버전 해시
+    id는 영상에 표시되지 않으므로 키에서 제외 (재게시/재시도 시에도 캐시 적중)
+    """
+    payload = {
+        "question": _normalize(question.model_dump(mode="json", exclude={"id"})),
+        "renderer": get_renderer_version(),
+        "assets": get_asset_version(),
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    StorageBackend(LocalStorage/GCSStorage)에 저장되는 영상 캐시
+    LocalStorage는 max_bytes를 넘으면 오래 사용하지 않은 영상부터 삭제
+    """
+
+    def __init__(self, backend: StorageBackend, max_bytes: int | None = None):
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _filename(key: str) -> str:
+        """캐시 파일명 (앞 2글자로 디렉토리 분산)"""
+        return f"{key[:2]}/{key}.mp4"
+
+    def get(self, question: QuizQuestion) -> bytes | None:
+        """캐시된 영상 반환 (없으면 None)"""
+        key = question_cache_key(question)
+        try:
+            data = self.backend.load(self._filename(key))
+        except Exception as e:
+            logger.warning(f"렌더 캐시 읽기 실패 {key}: {e}")
+            data = None
+
+        with self._lock:
+            if data is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return data
+
+    def contains_many(self, questions: list[QuizQuestion]) -> set[str]:
+        """
+        여러 문제의 캐시 존재 여부를 한 번에 확인 (GCS는 로컬 인덱스 + 이름별 확인 또는 샤드 디렉토리 목록 조회)
+        배치에서 캐시에 없는 문제는 get()을 건너뛰어 문제마다 404 요청을 보내지 않도록 사용
+        없는 문제는 미적중으로 집계
+        
+        Returns:
+            set[str]: 캐시에 있는 문제의 캐시 키 (확인 실패 시 모든 키 - 문제별 get()으로 확인)
+        """
+        keys = {question_cache_key(question) for question in questions}
+        try:
+            present = self.backend.exists_many(self._filename(key) for key in keys)
+        except Exception as e:
+            logger.warning(f"렌더 캐시 일괄 확인 실패: {e}")
+            return keys
+
+        cached_keys = {key for key in keys if self._filename(key) in present}
+        with self._lock:
+            self._misses += sum(
+                1 for question in questions if question_cache_key(question) not in cached_keys
+            )
+        return cached_keys
+
+    def put(self, question: QuizQuestion, video_bytes: bytes):
+        """영상 저장 (LocalStorage는 크기 제한 적용)"""
+        key = question_cache_key(question)
+        try:
+            self.backend.save(video_bytes, self._filename(key))
+        except Exception as e:
+            logger.warning(f"렌더 캐시 저장 실패 {key}: {e}")
+            return
+
+        evicted = []
+        if self.max_bytes is not None and isinstance(self.backend, LocalStorage):
+            with self._lock:
+                evicted = self.backend.enforce_size_limit(self.max_bytes)
+        with self._lock:
+            self._stores += 1
+            self._evictions += len(evicted)
+
+    def get_stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": True,
+                "backend": type(self.backend).__name__,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "stores": self._stores,
+                "evictions": self._evictions,
+                "index": self.backend.get_index_stats() if isinstance(self.backend, GCSStorage) else None,
+            }
+
+
+def _create_render_cache() -> RenderCache | None:
+    """환경 변수(STORAGE_TYPE)에 맞는 저장소로 렌더 캐시 생성"""
+    if not RENDER_CACHE_ENABLED:
+        return None
+
+    if os.getenv("STORAGE_TYPE", "local").lower() == "gcs":
+        bucket_name = os.getenv("GCS_BUCKET")
+        if not bucket_name:
+            raise ValueError("GCS_BUCKET 환경 변수가 설정되지 않았습니다.")
+        return RenderCache(GCSStorage(bucket_name, prefix=RENDER_CACHE_PREFIX))
+
+    return RenderCache(LocalStorage(RENDER_CACHE_DIR), max_bytes=RENDER_CACHE_MAX_BYTES)
+
+
+# 싱글톤 인스턴스
+_render_cache: RenderCache | None = None
+_render_cache_initialized = False
+
+
+def get_render_cache() -> RenderCache | None:
+    """RenderCache 싱글톤 인스턴스 반환 (비활성화 시 None)"""
+    global _render_cache, _render_cache_initialized
+    if not _render_cache_initialized:
+        _render_cache = _create_render_cache()
+        _render_cache_initialized = True
+    return _render_cache
@@ -0,0 +1,319 @@
+"""
+Render Pool - 영상 생성을 이벤트 루프 밖의 프로세스 풀에서 실행
+대기열 크기를 제한하고 가득 차면 즉시 거절 (back-pressure)
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from models import QuizQuestion
+from metrics import StageTimings
+from video_generator import generate_quiz_outputs, generate_quiz_video, render_warmup_video, warm_up_assets
+
+logger = logging.getLogger(__name__)
+
+
+# 풀 설정
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "2"))  # 동시에 렌더링하는 프로세스 수
+RENDER_QUEUE_SIZE = int(os.getenv("RENDER_QUEUE_SIZE", "8"))  # 워커가 모두 바쁠 때 대기 가능한 요청 수
+
+# 워밍업 중 아직 준비되지 않은 워커가 있을 때 다시 확인하는 간격 (초)
+WARM_UP_POLL_SECONDS = 0.1
+# acquire_waiting()에서 풀이 가득 찼을 때 빈자리 확인 간격 (초)
+ACQUIRE_POLL_SECONDS = 0.5
+
+# 워커 프로세스에서 버리는 영상을 인코딩했는지 여부 (워커당 한 번)
+_worker_warmed = False
+
+
+class RenderQueueFull(Exception):
+    """렌더링 대기열이 가득 참"""
+    pass
+
+
+@dataclass
+class RenderResult:
+    """렌더링 결과"""
+    video_bytes: bytes
+    wait_seconds: float  # 대기열에서 기다린 시간
+    render_seconds: float  # 워커에서 렌더링+인코딩에 걸린 시간
+    stages: StageTimings = field(default_factory=dict)  # 워커 안의 단계별 처리 시간 (render, audio_mix, encode)
+
+
+@dataclass
+class OutputsRenderResult:
+    """출력 프로필별 렌더링 결과"""
+    outputs: dict[str, bytes]  # {프로필 이름: 출력 바이트}
+    wait_seconds: float
+    render_seconds: float
+    stages: StageTimings = field(default_factory=dict)
+
+
+def _remove_temp_file(temp_path: str | None):
+    """임시 파일 및 빈 임시 디렉토리 삭제 (MoviePy 엔진은 임시 파일에 씀)"""
+    if temp_path and os.path.exists(temp_path):
+        try:
+            os.remove(temp_path)
+            # 빈 디렉토리도 삭제
+            temp_dir = os.path.dirname(temp_path)
+            if os.path.isdir(temp_dir) and not os.listdir(temp_dir):
+                os.rmdir(temp_dir)
+        except Exception as e:
+            logger.warning(f"임시 파일 삭제 실패: {e}")
+
+
+def _init_worker():
+    """워커 프로세스 시작 시 에셋(폰트, 이모지, 배경음악/효과음 등)을 한 번만 로드"""
+    try:
+        warm_up_assets()
+    except Exception as e:
+        # 실패해도 요청 처리 시 다시 로드하므로 워커는 계속 사용
+        logger.warning(f"워커 에셋 로드 실패: {e}")
+
+
+def _warm_up_worker() -> int:
+    """워커에서 버리는 영상 렌더링/인코딩 (워커당 한 번, initializer가 끝난 뒤 실행됨), 워커 PID 반환"""
+    global _worker_warmed
+    if not _worker_warmed:
+        render_warmup_video()
+        _worker_warmed = True
+    return os.getpid()
+
+
+def _render_in_worker(question: QuizQuestion, submitted_at: float) -> tuple[bytes, float, float, StageTimings]:
+    """
+    워커 프로세스에서 영상 생성
+
+    Returns:
+        tuple[bytes, float, float, StageTimings]: (영상 바이트, 대기 시간, 렌더링 시간, 단계별 처리 시간)
+    """
+    started_at = time.time()
+    timings: StageTimings = {}
+    video_bytes, temp_path = generate_quiz_video(question, timings=timings)
+    _remove_temp_file(temp_path)
+    return video_bytes, started_at - submitted_at, time.time() - started_at, timings
+
+
+def _render_outputs_in_worker(
+    question: QuizQuestion,
+    profile_names: list[str] | None,
+    submitted_at: float,
+) -> tuple[dict[str, bytes], float, float, StageTimings]:
+    """
+    워커 프로세스에서 여러 출력 프로필 생성 (한 번 렌더링 + ffmpeg 하나로 동시 출력)
+
+    Returns:
+        tuple: ({프로필 이름: 출력 바이트}, 대기 시간, 렌더링 시간, 단계별 처리 시간)
+    """
+    started_at = time.time()
+    timings: StageTimings = {}
+    outputs = generate_quiz_outputs(question, profile_names, timings=timings)
+    return outputs, started_at - submitted_at, time.time() - started_at, timings
+
+
+class RenderPool:
+    """
+    영상 생성 프로세스 풀
+    워커 수 + 대기열 크기를 넘는 요청은 RenderQueueFull로 거절
+    """
+
+    def __init__(self, workers: int = RENDER_WORKERS, queue_size: int = RENDER_QUEUE_SIZE):
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self._executor: ProcessPoolExecutor | None = None
+        self._in_flight = 0  # 실행 중 + 대기 중
+        self._lock = threading.Lock()  # 스트리밍 응답은 스레드에서 release() 호출
+
+        # 통계
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._render_total = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """동시에 받을 수 있는 최대 요청 수"""
+        return self.workers + self.queue_size
+
+    def start(self):
+        """프로세스 풀 시작"""
+        if self._executor is None:
+            # fork는 스레드(이벤트 루프, 인코더 보조 스레드)가 있는 부모에서 안전하지 않으므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            logger.info(f"🧵 렌더 풀 시작: workers={self.workers}, queue_size={self.queue_size}")
+
+    async def warm_up(self, timeout: float) -> int:
+        """
+        워커 프로세스를 모두 띄우고 워커마다 에셋 로드(initializer) + 버리는 영상 인코딩
+        워커 수만큼 동시에 제출해서 프로세스를 모두 시작시키고, 모든 워커가 한 번씩 응답할 때까지 반복
+        각 회차도 남은 시간만큼만 기다리므로 initializer가 멈춘 워커가 있어도 timeout 안에 반환
+
+        Returns:
+            int: 준비된 워커 수 (timeout 안에 모두 준비되지 않으면 workers보다 작음)
+        """
+        self.start()
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        ready: set[int] = set()
+        while len(ready) < self.workers and time.monotonic() < deadline:
+            try:
+                pids = await asyncio.wait_for(
+                    asyncio.gather(
+                        *(loop.run_in_executor(self._executor, _warm_up_worker) for _ in range(self.workers))
+                    ),
+                    deadline - time.monotonic(),
+                )
+            except asyncio.TimeoutError:
+                break
+            if ready.issuperset(pids):
+                # 이미 준비된 워커가 다시 받은 경우 - 나머지 워커의 initializer가 끝나길 기다림
+                await asyncio.sleep(WARM_UP_POLL_SECONDS)
+            ready.update(pids)
+        return len(ready)
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def acquire(self):
+        """
+        풀 용량 한 칸 점유 (가득 차면 RenderQueueFull)
+        워커 밖에서 실행되는 작업(스트리밍 등)도 같은 용량 제한을 받도록 사용, 끝나면 release() 호출
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                raise RenderQueueFull(f"렌더링 대기열이 가득 찼습니다 (최대 {self.capacity}건)")
+            self._in_flight += 1
+
+    async def acquire_waiting(self):
+        """
+        풀 용량 한 칸 점유 (가득 차 있으면 거절하지 않고 빈자리가 날 때까지 대기)
+        이미 받아들인 작업(비동기 작업, 배치 항목)이 실행하는 동안 용량을 점유하도록 사용, 끝나면 release() 호출
+        """
+        while True:
+            with self._lock:
+                if self._in_flight < self.capacity:
+                    self._in_flight += 1
+                    return
+            await asyncio.sleep(ACQUIRE_POLL_SECONDS)
+
+    def release(self):
+        """acquire()로 점유한 용량 반환"""
+        with self._lock:
+            self._in_flight -= 1
+
+    @contextmanager
+    def reserve(self):
+        """acquire()/release()를 with 블록으로 사용"""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def render(self, question: QuizQuestion, acquire: bool = True) -> RenderResult:
+        """
+        워커 프로세스에서 영상 생성 (이벤트 루프는 블로킹하지 않음)
+
+        Args:
+            question: 퀴즈 문제 데이터
+            acquire: 풀 용량을 점유할지 여부
+                (배치처럼 호출 측이 이미 용량을 점유하고 동시 실행 수를 직접 제한하는 경우 False)
+
+        Raises:
+            RenderQueueFull: 대기열이 가득 찬 경우
+        """
+        video_bytes, wait_seconds, render_seconds, stages = await self._run(
+            acquire, _render_in_worker, question, time.time()
+        )
+        return RenderResult(video_bytes, wait_seconds, render_seconds, stages)
+
+    async def render_outputs(
+        self,
+        question: QuizQuestion,
+        profile_names: list[str] | None = None,
+        acquire: bool = True,
+    ) -> OutputsRenderResult:
+        """
+        워커 프로세스에서 여러 출력 프로필 생성 (video_generator.generate_quiz_outputs)
+
+        Raises:
+            RenderQueueFull: 대기열이 가득 찬 경우
+            ValueError: 없는 프로필 이름
+        """
+        outputs, wait_seconds, render_seconds, stages = await self._run(
+            acquire, _render_outputs_in_worker, question, profile_names, time.time()
+        )
+        return OutputsRenderResult(outputs, wait_seconds, render_seconds, stages)
+
+    async def _run(self, acquire: bool, fn, *args) -> tuple:
+        """워커에서 fn 실행 (용량 점유 + 통계) - fn은 (결과, 대기 시간, 렌더링 시간, 단계별 시간) 반환"""
+        self.start()
+        if acquire:
+            self.acquire()
+        try:
+            self._submitted += 1
+            loop = asyncio.get_running_loop()
+            try:
+                result, wait_seconds, render_seconds, stages = await loop.run_in_executor(
+                    self._executor, fn, *args
+                )
+            except Exception:
+                self._failed += 1
+                raise
+        finally:
+            if acquire:
+                self.release()
+
+        self._completed += 1
+        wait_seconds = max(0.0, wait_seconds)
+        self._wait_total += wait_seconds
+        self._wait_max = max(self._wait_max, wait_seconds)
+        self._render_total += render_seconds
+        return result, wait_seconds, render_seconds, stages
+
+    def get_stats(self) -> dict:
+        """풀 상태 및 대기열 통계"""
+        completed = self._completed
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": self._in_flight,
+            "queue_depth": max(0, self._in_flight - self.workers),
+            "submitted": self._submitted,
+            "completed": completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "wait_seconds_avg": self._wait_total / completed if completed else 0.0,
+            "wait_seconds_max": self._wait_max,
+            "render_seconds_avg": self._render_total / completed if completed else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_render_pool: RenderPool | None = None
+
+
+def get_render_pool() -> RenderPool:
+    """RenderPool 싱글톤 인스턴스 반환"""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = RenderPool()
+    return _render_pool
@@ -0,0 +1,57 @@
+"""
+Single Flight - 같은 키의 작업이 진행 중이면 새로 실행하지 않고 진행 중인 결과를 함께 기다림
+스케줄러가 느린 요청을 재시도해서 같은 문제가 동시에 두 번 들어와도 렌더링/인코딩은 한 번만 실행
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    키별 진행 중 작업 공유 (이벤트 루프 안에서만 사용)
+    작업은 별도 Task로 실행하므로 먼저 요청한 쪽이 취소돼도(연결 끊김 등) 기다리는 쪽은 결과를 받음
+    """
+
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
+
+        # 통계
+        self._leaders = 0
+        self._shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        key로 진행 중인 작업이 있으면 그 결과를, 없으면 fn()을 실행해서 결과 반환
+        fn()에서 발생한 예외는 기다리던 호출 모두에게 전달
+
+        Returns:
+            tuple[T, bool]: (결과, 다른 호출의 결과를 공유했는지 여부)
+        """
+        task = self._tasks.get(key)
+        shared = task is not None
+        if shared:
+            self._shared += 1
+        else:
+            self._leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task):
+        """끝난 작업 제거 (아무도 기다리지 않는 예외는 여기서 읽어서 경고 로그 방지)"""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict:
+        """통계 (in_flight: 진행 중인 키 수, shared: 진행 중인 결과를 공유한 호출 수)"""
+        return {
+            "in_flight": len(self._tasks),
+            "leaders": self._leaders,
+            "shared": self._shared,
+        }
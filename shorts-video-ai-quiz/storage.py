@@ -1,46 +1,120 @@
 """
 Storage - 로컬/GCS 저장소 추상화
 디버깅용 영상 저장 기능 제공
+업로드는 전용 I/O 스레드 풀에서 실행 (요청 처리와 분리, 완료 시 콜백)
 """
 
 import os
+import time
+import posixpath
+import importlib.util
+import queue
+import logging
+import tempfile
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from metrics import StageTimings, STAGE_STORAGE_UPLOAD, timed
 
 if TYPE_CHECKING:
+    from google.cloud import storage as gcs_storage
     from models import QuizQuestion
 
-# GCS 사용 여부에 따라 조건부 import
-try:
-    from google.cloud import storage as gcs_storage
-    GCS_AVAILABLE = True
-except ImportError:
-    GCS_AVAILABLE = False
+
+def _gcs_available() -> bool:
+    """google-cloud-storage 설치 여부 (import는 GCS를 처음 사용할 때 - import 비용이 커서 로컬 모드에서는 생략)"""
+    try:
+        return importlib.util.find_spec("google.cloud.storage") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+GCS_AVAILABLE = _gcs_available()
+
+logger = logging.getLogger(__name__)
+
+
+# 업로드 설정
+STORAGE_UPLOAD_WORKERS = int(os.getenv("STORAGE_UPLOAD_WORKERS", "4"))  # 업로드 전용 스레드 수
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # resumable upload 청크 크기 (256KB 배수)
+GCS_HTTP_POOL_SIZE = int(os.getenv("GCS_HTTP_POOL_SIZE", "32"))  # 공유 HTTP 연결 풀 크기 (keep-alive 연결 수)
+GCS_INDEX_TTL_SECONDS = float(os.getenv("GCS_INDEX_TTL_SECONDS", "300"))  # 디렉토리 목록 조회 결과 유지 시간
+GCS_INDEX_MAX_ENTRIES = int(os.getenv("GCS_INDEX_MAX_ENTRIES", "50000"))  # 인덱스 최대 블롭 이름 수 (오래 안 쓴 이름부터 제거)
+# exists_many()에서 확인할 이름이 이 수 이하면 목록 조회 대신 이름마다 메타데이터 요청
+GCS_EXISTS_LIST_THRESHOLD = 8
+
+# 업로드 완료 콜백 (Future.result()는 저장된 경로/URL, 실패 시 예외)
+UploadCallback = Callable[[Future], None]
 
 
 class StorageBackend(ABC):
     """저장소 추상 클래스"""
     
     @abstractmethod
-    def save(self, data: bytes, filename: str) -> str:
+    def save(self, data: bytes, filename: str, content_type: str = "video/mp4") -> str:
         """
         데이터 저장
         
         Args:
             data: 저장할 바이트 데이터
             filename: 파일명
+            content_type: MIME 타입 (GCS 메타데이터)
+        
+        Returns:
+            str: 저장된 파일의 URL 또는 경로
+        """
+        pass
+    
+    def save_stream(self, chunks: Iterable[bytes], filename: str, content_type: str = "video/mp4") -> str:
+        """
+        청크 단위로 받으면서 저장 (기본 구현은 모두 모은 뒤 save() 호출)
+        chunks에서 예외가 나면 저장을 취소
+        
+        Args:
+            chunks: 저장할 데이터 청크
+            filename: 파일명
         
         Returns:
             str: 저장된 파일의 URL 또는 경로
         """
+        return self.save(b"".join(chunks), filename, content_type)
+    
+    @abstractmethod
+    def get_url(self, filename: str) -> str:
+        """저장될(된) 파일의 URL 또는 경로 (업로드 전에 미리 알 수 있음)"""
         pass
     
     @abstractmethod
     def exists(self, filename: str) -> bool:
         """파일 존재 여부 확인"""
         pass
+    
+    def exists_many(self, filenames: Iterable[str]) -> set[str]:
+        """
+        여러 파일 존재 여부를 한 번에 확인 (기본 구현은 exists()를 하나씩 호출)
+        
+        Returns:
+            set[str]: 존재하는 파일명
+        """
+        return {filename for filename in filenames if self.exists(filename)}
+    
+    @abstractmethod
+    def load(self, filename: str) -> bytes | None:
+        """
+        데이터 읽기
+        
+        Args:
+            filename: 파일명
+        
+        Returns:
+            bytes | None: 저장된 데이터 (없으면 None)
+        """
+        pass
 
 
 class LocalStorage(StorageBackend):
@@ -50,24 +124,95 @@ class LocalStorage(StorageBackend):
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
     
-    def save(self, data: bytes, filename: str) -> str:
-        """로컬에 파일 저장"""
+    def save(self, data: bytes, filename: str, content_type: str = "video/mp4") -> str:
+        """로컬에 파일 저장 (임시 파일에 쓴 뒤 이름 변경)"""
+        return self._write_file(filename, [data])
+    
+    def save_stream(self, chunks: Iterable[bytes], filename: str, content_type: str = "video/mp4") -> str:
+        """청크 단위로 임시 파일에 쓴 뒤 이름 변경 (중간에 실패하면 임시 파일 삭제)"""
+        return self._write_file(filename, chunks)
+    
+    def _write_file(self, filename: str, chunks: Iterable[bytes]) -> str:
+        """
+        같은 디렉토리의 고유한 임시 파일(mkstemp)에 쓴 뒤 os.replace로 교체
+        같은 파일을 동시에 읽거나 쓰는 쪽(렌더 캐시 조회 등)이 반쯤 쓴 파일을 보지 않고,
+        쓰는 도중 중단돼도 이전 파일이 그대로 남음
+        """
         file_path = self.base_dir / filename
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f"{file_path.name}.", suffix=".part")
         
-        with open(file_path, "wb") as f:
-            f.write(data)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
         
         return str(file_path.absolute())
     
+    def get_url(self, filename: str) -> str:
+        """저장 경로 반환"""
+        return self.get_path(filename)
+    
     def exists(self, filename: str) -> bool:
         """파일 존재 여부 확인"""
         file_path = self.base_dir / filename
         return file_path.exists()
     
+    def load(self, filename: str) -> bytes | None:
+        """
+        로컬 파일 읽기
+        읽을 때 수정 시각을 갱신하여 enforce_size_limit()에서 최근 사용 파일로 취급
+        """
+        file_path = self.base_dir / filename
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(file_path)
+        except OSError:
+            pass
+        return data
+    
     def get_path(self, filename: str) -> str:
         """파일 경로 반환"""
         return str((self.base_dir / filename).absolute())
+    
+    def enforce_size_limit(self, max_bytes: int) -> list[str]:
+        """
+        전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (LRU)
+        
+        Returns:
+            list[str]: 삭제된 파일명 목록
+        """
+        files = []
+        total_size = 0
+        for file_path in self.base_dir.rglob("*"):
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue
+            if not file_path.is_file():
+                continue
+            files.append((stat.st_mtime, stat.st_size, file_path))
+            total_size += stat.st_size
+        
+        removed = []
+        for _, size, file_path in sorted(files):
+            if total_size <= max_bytes:
+                break
+            try:
+                file_path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            removed.append(str(file_path.relative_to(self.base_dir)))
+        return removed
 
 
 class GCSStorage(StorageBackend):
@@ -82,24 +227,138 @@ class GCSStorage(StorageBackend):
         
         self.bucket_name = bucket_name
         self.prefix = prefix
-        self.client = gcs_storage.Client()
+        # 클라이언트(인증 토큰, HTTP 연결 풀)는 프로세스 안의 모든 GCSStorage가 공유
+        self.client = get_gcs_client()
         self.bucket = self.client.bucket(bucket_name)
+        
+        # 업로드했거나 존재를 확인한 블롭 이름 인덱스 (prefix 제외, LRU) - exists()/exists_many()는 여기서 먼저 확인
+        self._index: OrderedDict[str, None] = OrderedDict()
+        self._listed_dirs: dict[str, float] = {}  # {목록을 조회한 디렉토리: 조회 시각}
+        self._index_lock = threading.Lock()
+        
+        # 로컬 가짜 GCS 서버는 버킷이 없는 상태로 시작하므로 미리 생성
+        if os.getenv("STORAGE_EMULATOR_HOST") and not self.bucket.exists():
+            self.bucket = self.client.create_bucket(bucket_name)
     
-    def save(self, data: bytes, filename: str) -> str:
+    def save(self, data: bytes, filename: str, content_type: str = "video/mp4") -> str:
         """GCS에 파일 저장"""
         blob_name = f"{self.prefix}/{filename}"
         blob = self.bucket.blob(blob_name)
         
-        blob.upload_from_string(data, content_type="video/mp4")
+        blob.upload_from_string(data, content_type=content_type)
+        self._add_to_index(filename)
         
         # Public URL 반환 (또는 signed URL 사용 가능)
-        return f"gs://{self.bucket_name}/{blob_name}"
+        return self.get_url(filename)
+    
+    def save_stream(self, chunks: Iterable[bytes], filename: str, content_type: str = "video/mp4") -> str:
+        """
+        resumable upload로 청크 단위 업로드 (GCS_UPLOAD_CHUNK_SIZE만큼 모이면 전송)
+        chunks에서 예외가 나면 업로드 세션을 취소 (BlobWriter.terminate)
+        """
+        blob = self.bucket.blob(f"{self.prefix}/{filename}")
+        with blob.open("wb", chunk_size=GCS_UPLOAD_CHUNK_SIZE, content_type=content_type) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        self._add_to_index(filename)
+        return self.get_url(filename)
+    
+    def get_url(self, filename: str) -> str:
+        """gs:// URL 반환"""
+        return f"gs://{self.bucket_name}/{self.prefix}/{filename}"
     
     def exists(self, filename: str) -> bool:
-        """파일 존재 여부 확인"""
+        """파일 존재 여부 확인 (인덱스에 있으면 요청 없이 True)"""
+        with self._index_lock:
+            if filename in self._index:
+                self._index.move_to_end(filename)
+                return True
+        blob_name = f"{self.prefix}/{filename}"
+        blob = self.bucket.blob(blob_name)
+        if not blob.exists():
+            return False
+        self._add_to_index(filename)
+        return True
+    
+    def exists_many(self, filenames: Iterable[str]) -> set[str]:
+        """
+        여러 파일 존재 여부를 한 번에 확인 (요청 수는 전체 블롭 수가 아니라 확인할 이름 수에 비례)
+        인덱스에 없는 이름이 GCS_EXISTS_LIST_THRESHOLD개 이하면 이름마다 메타데이터 요청,
+        많으면 이름이 속한 디렉토리(렌더 캐시는 키 앞 2글자 샤드)만 목록 조회
+        디렉토리 목록은 GCS_INDEX_TTL_SECONDS 동안 재사용 (그 사이 다른 인스턴스가 올린 블롭은 없는 것으로 볼 수 있음)
+        """
+        filenames = list(dict.fromkeys(filenames))
+        now = time.monotonic()
+        with self._index_lock:
+            present = {filename for filename in filenames if filename in self._index}
+            unknown = [
+                filename for filename in filenames
+                if filename not in present
+                and now - self._listed_dirs.get(posixpath.dirname(filename), float("-inf")) >= GCS_INDEX_TTL_SECONDS
+            ]
+        
+        if len(unknown) <= GCS_EXISTS_LIST_THRESHOLD:
+            present.update(filename for filename in unknown if self.exists(filename))
+            return present
+        
+        for directory in dict.fromkeys(posixpath.dirname(filename) for filename in unknown):
+            self.refresh_index(directory)
+        with self._index_lock:
+            return present | {filename for filename in unknown if filename in self._index}
+    
+    def refresh_index(self, directory: str = ""):
+        """디렉토리(prefix 기준 상대 경로) 바로 아래 블롭 이름을 조회해서 인덱스 갱신 (이름만 요청)"""
+        listed_at = time.monotonic()
+        blob_prefix = f"{self.prefix}/{directory}/" if directory else f"{self.prefix}/"
+        names = [
+            blob.name[len(self.prefix) + 1:]
+            for blob in self.client.list_blobs(
+                self.bucket,
+                prefix=blob_prefix,
+                delimiter="/",
+                fields="items(name),nextPageToken",
+            )
+        ]
+        for name in names:
+            self._add_to_index(name)
+        with self._index_lock:
+            self._listed_dirs[directory] = listed_at
+            # 오래된 조회 기록 정리 (렌더 캐시 샤드는 최대 256개)
+            for listed_dir in [d for d, at in self._listed_dirs.items() if listed_at - at >= GCS_INDEX_TTL_SECONDS]:
+                del self._listed_dirs[listed_dir]
+    
+    def load(self, filename: str) -> bytes | None:
+        """GCS에서 파일 읽기"""
+        from google.api_core.exceptions import NotFound
+        
         blob_name = f"{self.prefix}/{filename}"
         blob = self.bucket.blob(blob_name)
-        return blob.exists()
+        try:
+            data = blob.download_as_bytes()
+        except NotFound:
+            # 삭제된 블롭 (수명 주기 규칙 등)은 인덱스에서도 제거
+            with self._index_lock:
+                self._index.pop(filename, None)
+            return None
+        self._add_to_index(filename)
+        return data
+    
+    def get_index_stats(self) -> dict:
+        """블롭 이름 인덱스 통계"""
+        with self._index_lock:
+            return {
+                "size": len(self._index),
+                "max_entries": GCS_INDEX_MAX_ENTRIES,
+                "listed_dirs": len(self._listed_dirs),
+            }
+    
+    def _add_to_index(self, filename: str):
+        """인덱스에 블롭 이름 추가 (GCS_INDEX_MAX_ENTRIES를 넘으면 오래 안 쓴 이름부터 제거)"""
+        with self._index_lock:
+            self._index[filename] = None
+            self._index.move_to_end(filename)
+            while len(self._index) > GCS_INDEX_MAX_ENTRIES:
+                self._index.popitem(last=False)
     
     def get_public_url(self, filename: str) -> str:
         """Public URL 반환"""
@@ -107,6 +366,90 @@ class GCSStorage(StorageBackend):
         return f"https://storage.googleapis.com/{self.bucket_name}/{blob_name}"
 
 
+def _create_gcs_client() -> "gcs_storage.Client":
+    """
+    GCS 클라이언트 생성 (GCS_HTTP_POOL_SIZE 크기의 keep-alive 연결 풀 사용)
+    STORAGE_EMULATOR_HOST가 있으면 로컬 가짜 GCS 서버(fake-gcs-server 등)에 인증 없이 접속
+    """
+    import google.auth
+    from google.auth.credentials import AnonymousCredentials
+    from google.auth.transport.requests import AuthorizedSession
+    from google.cloud import storage as gcs_storage
+    from requests.adapters import HTTPAdapter
+    
+    emulator_host = os.getenv("STORAGE_EMULATOR_HOST")
+    if emulator_host:
+        credentials = AnonymousCredentials()
+        project = os.getenv("GOOGLE_CLOUD_PROJECT", "local")
+    else:
+        credentials, project = google.auth.default(scopes=gcs_storage.Client.SCOPE)
+        project = os.getenv("GOOGLE_CLOUD_PROJECT") or project
+    
+    # 기본 requests 연결 풀(10개)은 업로드 스레드 + 렌더 캐시 저장이 겹치면 연결을 버리고 새로 맺음
+    session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(pool_connections=GCS_HTTP_POOL_SIZE, pool_maxsize=GCS_HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    return gcs_storage.Client(
+        project=project,
+        credentials=credentials,
+        _http=session,
+        client_options={"api_endpoint": emulator_host} if emulator_host else None,
+    )
+
+
+# 공유 GCS 클라이언트
+_gcs_client: "gcs_storage.Client | None" = None
+_gcs_client_lock = threading.Lock()
+
+
+def get_gcs_client() -> "gcs_storage.Client":
+    """공유 GCS 클라이언트 반환 (프로세스당 하나, 영상 저장소와 렌더 캐시가 연결 풀 공유)"""
+    global _gcs_client
+    with _gcs_client_lock:
+        if _gcs_client is None:
+            _gcs_client = _create_gcs_client()
+        return _gcs_client
+
+
+class UploadStream:
+    """
+    스트리밍 응답의 청크를 받으면서 업로드 (업로드 스레드는 큐에서 청크를 꺼내 save_stream에 전달)
+    write()는 큐에 넣기만 하므로 응답 전송을 기다리게 하지 않음
+    끝나면 close(), 응답이 중간에 끊기면 abort()로 업로드 취소
+    """
+    
+    _END = object()
+    _ABORT = object()
+    
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self.future: Future | None = None
+    
+    def write(self, chunk: bytes):
+        """청크 추가"""
+        self._queue.put(chunk)
+    
+    def close(self):
+        """마지막 청크까지 추가됨 (업로드 완료 처리)"""
+        self._queue.put(self._END)
+    
+    def abort(self):
+        """업로드 취소"""
+        self._queue.put(self._ABORT)
+    
+    def chunks(self) -> Iterator[bytes]:
+        """업로드 스레드에서 청크 읽기 (abort()면 예외를 내서 저장소가 업로드를 취소하도록 함)"""
+        while True:
+            chunk = self._queue.get()
+            if chunk is self._END:
+                return
+            if chunk is self._ABORT:
+                raise RuntimeError("스트리밍이 중단되어 업로드를 취소합니다")
+            yield chunk
+
+
 class StorageManager:
     """
     저장소 관리자
@@ -118,6 +461,8 @@ class StorageManager:
         self.storage_type = os.getenv("STORAGE_TYPE", "local").lower()
         
         self._storage: StorageBackend | None = None
+        self._init_lock = threading.Lock()
+        self._upload_executor: ThreadPoolExecutor | None = None
         
         if self.debug_save_enabled:
             self._init_storage()
@@ -138,20 +483,122 @@ class StorageManager:
         """저장소 인스턴스 반환"""
         return self._storage
     
-    def save_video(self, video_bytes: bytes, question: "QuizQuestion") -> str | None:
+    def save_video(
+        self,
+        video_bytes: bytes,
+        question: "QuizQuestion",
+        force: bool = False,
+        timings: StageTimings | None = None,
+    ) -> str | None:
         """
         영상 저장 (디버그 모드일 때만)
         
         Args:
             video_bytes: 영상 바이트 데이터
             question: QuizQuestion 객체
+            force: 디버그 모드가 아니어도 저장 (배치 생성처럼 저장 URL을 반환해야 하는 경우)
+            timings: 업로드 시간(storage_upload)을 기록할 dict (None이면 측정하지 않음)
         
         Returns:
             str | None: 저장된 파일 경로/URL (디버그 모드 아니면 None)
         """
-        if not self.debug_save_enabled or self._storage is None:
+        if not self._should_save(force):
+            return None
+        
+        filename = self._video_filename(question)
+        with timed(timings, STAGE_STORAGE_UPLOAD):
+            saved_path = self._storage.save(video_bytes, filename)
+        return saved_path
+    
+    def save_video_async(
+        self,
+        video_bytes: bytes,
+        question: "QuizQuestion",
+        force: bool = False,
+        timings: StageTimings | None = None,
+        callback: UploadCallback | None = None,
+        variant: str | None = None,
+        extension: str = "mp4",
+        content_type: str = "video/mp4",
+    ) -> tuple[str, Future] | None:
+        """
+        업로드 전용 스레드 풀에서 영상 저장 (호출 측은 기다리지 않음)
+        
+        Args:
+            video_bytes: 영상 바이트 데이터
+            question: QuizQuestion 객체
+            force: 디버그 모드가 아니어도 저장
+            timings: 업로드 시간(storage_upload)을 기록할 dict (콜백 시점에 채워져 있음)
+            callback: 업로드 완료/실패 시 Future를 받아 호출 (업로드 스레드에서 실행)
+            variant: 파일명 끝에 붙일 구분자 (출력 프로필 이름 등)
+            extension: 파일 확장자
+            content_type: MIME 타입
+        
+        Returns:
+            tuple[str, Future] | None: (저장될 경로/URL, 업로드 Future) (저장하지 않으면 None)
+        """
+        if not self._should_save(force):
             return None
         
+        filename = self._video_filename(question, variant, extension)
+        storage = self._storage
+        
+        def upload() -> str:
+            with timed(timings, STAGE_STORAGE_UPLOAD):
+                return storage.save(video_bytes, filename, content_type)
+        
+        return storage.get_url(filename), self._submit_upload(upload, callback)
+    
+    def open_video_upload(
+        self,
+        question: "QuizQuestion",
+        force: bool = False,
+        timings: StageTimings | None = None,
+        callback: UploadCallback | None = None,
+    ) -> UploadStream | None:
+        """
+        청크 단위 업로드 시작 (스트리밍 응답용)
+        반환된 UploadStream에 write()로 청크를 넣으면 업로드 스레드가 바로 저장소로 전송
+        
+        Returns:
+            UploadStream | None: 업로드 스트림 (저장하지 않으면 None)
+        """
+        if not self._should_save(force):
+            return None
+        
+        filename = self._video_filename(question)
+        storage = self._storage
+        upload_stream = UploadStream()
+        
+        def upload() -> str:
+            # 큐에서 첫 청크를 기다리는 시간까지 포함
+            with timed(timings, STAGE_STORAGE_UPLOAD):
+                return storage.save_stream(upload_stream.chunks(), filename)
+        
+        upload_stream.future = self._submit_upload(upload, callback)
+        return upload_stream
+    
+    def shutdown(self, wait: bool = True):
+        """업로드 스레드 풀 종료 (wait=True면 진행 중인 업로드가 끝날 때까지 대기)"""
+        if self._upload_executor is not None:
+            self._upload_executor.shutdown(wait=wait)
+            self._upload_executor = None
+    
+    def _should_save(self, force: bool) -> bool:
+        """저장 여부 (force면 저장소가 없을 때 초기화)"""
+        if force and self._storage is None:
+            with self._init_lock:
+                if self._storage is None:
+                    self._init_storage()
+        return (self.debug_save_enabled or force) and self._storage is not None
+    
+    def _video_filename(
+        self,
+        question: "QuizQuestion",
+        variant: str | None = None,
+        extension: str = "mp4",
+    ) -> str:
+        """저장 파일명 (variant가 있으면 타임스탬프 뒤에 붙임)"""
         # 타임스탬프 포함 파일명
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -161,10 +608,21 @@ class StorageManager:
         problem_text = f"{question_prompt} 「{question_text}」"
         
         # 파일명 생성: quiz_{quizId}_다음 단어의 뜻은? 「勉強」_20251206_180030.mp4
-        filename = f"quiz_{question.id}_{problem_text}_{timestamp}.mp4"
-        
-        saved_path = self._storage.save(video_bytes, filename)
-        return saved_path
+        suffix = f"_{variant}" if variant else ""
+        return f"quiz_{question.id}_{problem_text}_{timestamp}{suffix}.{extension}"
+    
+    def _submit_upload(self, upload: Callable[[], str], callback: UploadCallback | None) -> Future:
+        """업로드 스레드 풀에 작업 제출"""
+        with self._init_lock:
+            if self._upload_executor is None:
+                self._upload_executor = ThreadPoolExecutor(
+                    max_workers=max(1, STORAGE_UPLOAD_WORKERS),
+                    thread_name_prefix="storage-upload",
+                )
+            future = self._upload_executor.submit(upload)
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
     
     def is_debug_enabled(self) -> bool:
         """디버그 저장 활성화 여부"""
@@ -0,0 +1,173 @@
+"""
+Text Layout - 텍스트/이모지 분리 결과, 측정한 너비, 글자 마스크 타일 캐시
+같은 문구(선택지 번호, "💡 해설", 계정 정보 등)는 영상마다 반복되므로
+한 번 측정/렌더링한 결과를 재사용하고 프레임에는 타일을 붙여넣기만 함
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+
+# 캐시 크기
+TEXT_LAYOUT_CACHE_SIZE = 512  # (문구, 폰트) 조합별 레이아웃 수
+TEXT_TILE_CACHE_SIZE = 256  # (문구, 폰트) 조합별 글자 마스크 수
+
+
+@dataclass(frozen=True)
+class TextRun:
+    """텍스트 조각 (일반 텍스트 또는 이모지 하나)"""
+    text: str
+    is_emoji: bool
+    width: int
+
+
+@dataclass(frozen=True)
+class TextLayout:
+    """한 줄 텍스트 레이아웃 (조각 목록 + 전체 너비)"""
+    runs: tuple[TextRun, ...]
+    width: int
+
+
+@dataclass(frozen=True)
+class TextTile:
+    """글자 마스크 ("L" 모드) + 그리기 기준점에서의 위치"""
+    mask: Image.Image
+    offset: tuple[int, int]
+
+
+def font_key(font: ImageFont.FreeTypeFont) -> tuple:
+    """폰트 식별 키 (경로, 크기, TTC 인덱스)"""
+    return (
+        getattr(font, "path", None) or id(font),
+        getattr(font, "size", None),
+        getattr(font, "index", 0),
+    )
+
+
+def _measure(text: str, font: ImageFont.FreeTypeFont) -> int:
+    """텍스트 너비 (ImageDraw.textbbox와 같은 값)"""
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
+
+
+def _render_tile(text: str, font: ImageFont.FreeTypeFont) -> TextTile:
+    """글자 마스크 렌더링 - 이미지에 draw.text로 그린 결과와 같은 픽셀이 되도록 bbox 기준으로 그림"""
+    x0, y0, x1, y1 = font.getbbox(text)
+    mask = Image.new("L", (max(1, x1 - x0), max(1, y1 - y0)), 0)
+    ImageDraw.Draw(mask).text((-x0, -y0), text, font=font, fill=255)
+    return TextTile(mask, (x0, y0))
+
+
+class _LRU:
+    """OrderedDict 기반 LRU (lock은 호출 측에서 관리)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "max_size": self.max_entries,
+        }
+
+
+class TextLayoutCache:
+    """
+    텍스트 레이아웃/글자 타일 캐시 (스레드 안전)
+
+    Args:
+        segmenter: 텍스트를 (조각, 이모지 여부) 목록으로 나누는 함수
+        max_layouts: 레이아웃 최대 캐시 수
+        max_tiles: 글자 마스크 최대 캐시 수
+    """
+
+    def __init__(
+        self,
+        segmenter: Callable[[str], list[tuple[str, bool]]],
+        max_layouts: int = TEXT_LAYOUT_CACHE_SIZE,
+        max_tiles: int = TEXT_TILE_CACHE_SIZE,
+    ):
+        self.segmenter = segmenter
+        self._lock = threading.Lock()
+        self._layouts = _LRU(max_layouts)
+        self._tiles = _LRU(max_tiles)
+
+    def layout(self, text: str, font: ImageFont.FreeTypeFont, emoji_size: int) -> TextLayout:
+        """텍스트를 조각으로 나누고 조각별 너비 측정 (이모지는 emoji_size 너비)"""
+        key = (text, font_key(font), emoji_size)
+        with self._lock:
+            cached = self._layouts.get(key)
+        if cached is not None:
+            return cached
+
+        runs = tuple(
+            TextRun(part, is_emoji, emoji_size if is_emoji else _measure(part, font))
+            for part, is_emoji in self.segmenter(text)
+        )
+        layout = TextLayout(runs, sum(run.width for run in runs))
+        with self._lock:
+            self._layouts.put(key, layout)
+        return layout
+
+    def tile(self, text: str, font: ImageFont.FreeTypeFont) -> TextTile:
+        """글자 마스크 타일 (색상과 무관하게 (문구, 폰트)별로 한 번만 렌더링)"""
+        key = (text, font_key(font))
+        with self._lock:
+            cached = self._tiles.get(key)
+        if cached is not None:
+            return cached
+
+        tile = _render_tile(text, font)
+        with self._lock:
+            self._tiles.put(key, tile)
+        return tile
+
+    def draw_text(
+        self,
+        img: Image.Image,
+        xy: tuple[int, int],
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        fill: str | tuple[int, ...],
+    ):
+        """캐시된 글자 마스크로 텍스트 그리기 (ImageDraw.text와 같은 결과)"""
+        if not text:
+            return
+        tile = self.tile(text, font)
+        color = ImageColor.getcolor(fill, img.mode) if isinstance(fill, str) else fill
+        img.paste(color, (xy[0] + tile.offset[0], xy[1] + tile.offset[1]), tile.mask)
+
+    def get_stats(self) -> dict:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                "layouts": self._layouts.get_stats(),
+                "tiles": self._tiles.get_stats(),
+            }
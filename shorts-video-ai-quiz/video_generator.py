@@ -1,30 +1,73 @@
 """
-Video Generator - MoviePy를 사용하여 23초 쇼츠 영상 생성
+Video Generator - 23초 쇼츠 영상 생성 (ffmpeg 직접 인코딩 / MoviePy 클립 합성)
+MoviePy는 import 비용이 커서 moviepy 엔진을 처음 사용할 때 필요한 하위 모듈만 import
 """
 
 import os
+import math
+import shutil
+import hashlib
+import importlib
 import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator
 
-from moviepy.editor import (
-    ImageClip,
-    concatenate_videoclips,
-    concatenate_audioclips,
-    CompositeVideoClip,
-    AudioFileClip,
-    CompositeAudioClip,
-)
 import numpy as np
 from PIL import Image
 
 from models import QuizQuestion
+from metrics import (
+    StageTimings,
+    STAGE_AUDIO_MIX,
+    STAGE_ENCODE,
+    STAGE_ENCODE_STREAM,
+    STAGE_RENDER,
+    timed,
+)
 from frame_renderer import (
     render_intro_frame,
-    render_question_frame,
+    render_question_base,
+    render_question_frames,
+    render_countdown_overlay,
     render_answer_frame,
     render_account_frame,
+    preload_assets,
     WIDTH,
     HEIGHT,
+    BACKGROUND_COLOR,
+)
+from ffmpeg_encoder import (
+    FrameRun,
+    AudioInput,
+    OutputProfile,
+    ENCODE_MODE_STANDARD,
+    ENCODE_MODES,
+    AUDIO_SAMPLE_RATE,
+    MEMORY_FORMAT_FASTSTART,
+    OUTPUT_KIND_ANIMATION,
+    OUTPUT_KIND_IMAGE,
+    OUTPUT_KIND_VIDEO,
+    concat_segments,
+    decode_audio,
+    encode_audio,
+    encode_frames,
+    encode_profiles,
+    get_ffmpeg_exe,
+    iter_encode_frames,
+    video_codec_args,
+)
+
+if TYPE_CHECKING:
+    from moviepy.video.VideoClip import ImageClip
+    from frame_ring import FrameRing
+
+# moviepy 엔진이 사용하는 하위 모듈 (moviepy.editor는 IPython 등까지 import해서 느림)
+MOVIEPY_MODULES = (
+    "moviepy.video.VideoClip",
+    "moviepy.video.compositing.concatenate",
+    "moviepy.audio.io.AudioFileClip",
 )
 
 # Assets 경로
@@ -43,168 +86,562 @@ ANSWER_DURATION = 5  # 13-18초: 정답
 ACCOUNT_DURATION = 5  # 18-23초: 계정 정보
 TOTAL_DURATION = INTRO_DURATION + QUESTION_DURATION + ANSWER_DURATION + ACCOUNT_DURATION  # 23초
 
+# 오디오 설정
+BACKGROUND_MUSIC_VOLUME = 0.3  # 배경음악 30% 볼륨
+TICK_DURATION = 0.2  # 효과음 길이 (초)
+
+# 미리 인코딩한 오디오 베드(배경음악 + 효과음) 저장 경로 - 렌더 워커 프로세스끼리 공유
+AUDIO_BED_DIR = Path(os.getenv("AUDIO_BED_DIR", os.path.join(tempfile.gettempdir(), "quiz-audio-bed")))
+
+# 영상 인코딩 설정 (미리 인코딩한 세그먼트와 이어 붙이려면 모든 세그먼트가 같은 값 사용)
+VIDEO_PRESET = "medium"  # 인코딩 속도 vs 품질
+VIDEO_THREADS = 4
+# 인코딩 모드 (standard: 30fps 전체 프레임 / still: 장면당 한 장 입력 + 정지 화면 튜닝, 30fps 출력 / lowfps: 장면당 한 프레임, 1fps 출력)
+VIDEO_ENCODE_MODE = os.getenv("VIDEO_ENCODE_MODE", ENCODE_MODE_STANDARD).lower()
+if VIDEO_ENCODE_MODE not in ENCODE_MODES:
+    raise ValueError(f"알 수 없는 VIDEO_ENCODE_MODE: {VIDEO_ENCODE_MODE} (사용 가능: {', '.join(ENCODE_MODES)})")
+
+# 고정 세그먼트(계정 정보 아웃트로, 퀴즈 유형/JLPT 레벨별 인트로)를 미리 인코딩해두고 이어 붙이기
+SEGMENT_CACHE_ENABLED = os.getenv("SEGMENT_CACHE_ENABLED", "true").lower() == "true"
+SEGMENT_CACHE_DIR = Path(os.getenv("SEGMENT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "quiz-segments")))
+# 문제별 세그먼트 임시 경로 (메모리 기반 /dev/shm 우선)
+SEGMENT_WORK_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+# 인코딩 엔진 (ffmpeg: 고유 프레임을 ffmpeg에 직접 전달, moviepy: 기존 클립 합성 방식)
+VIDEO_ENGINE = os.getenv("VIDEO_ENGINE", "ffmpeg").lower()
+# 메모리 출력 형식 (ffmpeg 엔진에서 output_path 없이 생성할 때, faststart/fragmented)
+VIDEO_MEMORY_FORMAT = os.getenv("VIDEO_MEMORY_FORMAT", MEMORY_FORMAT_FASTSTART).lower()
+
+# 출력 프로필 - generate_quiz_outputs()는 프레임을 한 번만 렌더링하고 ffmpeg 하나로 모두 출력
+# 썸네일/포스터는 문제 화면(카운트다운 시작)부터 사용
+OUTPUT_PROFILES: dict[str, OutputProfile] = {
+    profile.name: profile
+    for profile in (
+        # 쇼츠 원본 (1080x1920)
+        OutputProfile("shorts_1080p", OUTPUT_KIND_VIDEO, WIDTH, HEIGHT, "mp4", "mp4", "video/mp4"),
+        # 미리보기 (720x1280)
+        OutputProfile("preview_720p", OUTPUT_KIND_VIDEO, 720, 1280, "mp4", "mp4", "video/mp4"),
+        # 피드용 정사각형 (세로 영상을 가운데 두고 좌우를 배경색으로 채움)
+        OutputProfile(
+            "square_1080", OUTPUT_KIND_VIDEO, 1080, 1080, "mp4", "mp4", "video/mp4",
+            pad_color=BACKGROUND_COLOR,
+        ),
+        # 애니메이션 썸네일 (문제 화면 3초)
+        OutputProfile(
+            "thumbnail_webp", OUTPUT_KIND_ANIMATION, 360, 640, "webp", "webp", "image/webp",
+            fps=10, start=INTRO_DURATION, duration=3,
+            codec_args=("-c:v", "libwebp_anim", "-quality", "70", "-loop", "0"),
+        ),
+        OutputProfile(
+            "thumbnail_gif", OUTPUT_KIND_ANIMATION, 270, 480, "gif", "gif", "image/gif",
+            fps=10, start=INTRO_DURATION, duration=3,
+            codec_args=("-loop", "0"),
+        ),
+        # 포스터 (문제 화면 한 장)
+        OutputProfile(
+            "poster_jpeg", OUTPUT_KIND_IMAGE, WIDTH, HEIGHT, "image2", "jpg", "image/jpeg",
+            start=INTRO_DURATION,
+            codec_args=("-c:v", "mjpeg", "-q:v", "3", "-pix_fmt", "yuvj420p"),
+        ),
+    )
+}
+DEFAULT_OUTPUT_PROFILE = "shorts_1080p"
+
 
 def pil_to_numpy(pil_image: Image.Image) -> np.ndarray:
     """PIL 이미지를 numpy 배열로 변환"""
     return np.array(pil_image)
 
 
-def create_intro_clip(question: QuizQuestion) -> ImageClip:
+def create_intro_clip(question: QuizQuestion) -> "ImageClip":
     """인트로 클립 생성 (3초)"""
+    from moviepy.video.VideoClip import ImageClip
+
     frame = render_intro_frame(question)
     frame_array = pil_to_numpy(frame)
     clip = ImageClip(frame_array).set_duration(INTRO_DURATION)
     return clip
 
 
-def create_question_clip(question: QuizQuestion) -> CompositeVideoClip:
+def create_question_clip(question: QuizQuestion) -> "ImageClip":
     """
     문제 클립 생성 (10초)
-    매 초마다 카운트다운이 바뀌는 프레임 생성 + 효과음 추가
+    매 초마다 카운트다운이 바뀌는 프레임 생성 (효과음은 오디오 베드에 미리 믹싱됨)
     """
-    clips = []
+    from moviepy.video.VideoClip import ImageClip
+    from moviepy.video.compositing.concatenate import concatenate_videoclips
 
-    # 효과음 로드
-    tick_sound_path = SOUNDS_DIR / "tick.wav"
-    tick_audio = None
-    if tick_sound_path.exists():
-        try:
-            tick_audio = AudioFileClip(str(tick_sound_path))
-            # 효과음 길이 조절 (0.15초 정도로 짧게)
-            if tick_audio.duration > 0.2:
-                tick_audio = tick_audio.subclip(0, 0.2)
-        except Exception as e:
-            print(f"⚠️  효과음 로드 실패: {e}")
-            tick_audio = None
-
-    for countdown in range(10, 0, -1):
-        frame = render_question_frame(question, countdown)
-        frame_array = pil_to_numpy(frame)
-        clip = ImageClip(frame_array).set_duration(1)
-
-        # 효과음 추가 (각 초마다)
-        if tick_audio:
-            try:
-                # 각 클립마다 오디오를 새로 로드 (MoviePy 버그 회피)
-                clip_audio = AudioFileClip(str(tick_sound_path))
-                if clip_audio.duration > 0.2:
-                    clip_audio = clip_audio.subclip(0, 0.2)
-                clip = clip.set_audio(clip_audio)
-            except Exception as e:
-                print(f"⚠️  효과음 추가 실패: {e}")
-
-        clips.append(clip)
+    # 정적 레이어는 한 번만 렌더링하고 타이머만 합성한 10개 프레임
+    clips = [
+        ImageClip(pil_to_numpy(frame)).set_duration(1)
+        for frame in render_question_frames(question, QUESTION_DURATION)
+    ]
 
     # 클립들을 순차적으로 연결
-    final_clip = concatenate_videoclips(clips, method="compose")
-
-    # 효과음 정리
-    if tick_audio:
-        tick_audio.close()
-
-    return final_clip
+    return concatenate_videoclips(clips, method="compose")
 
 
-def create_answer_clip(question: QuizQuestion) -> ImageClip:
+def create_answer_clip(question: QuizQuestion) -> "ImageClip":
     """정답 클립 생성 (5초)"""
+    from moviepy.video.VideoClip import ImageClip
+
     frame = render_answer_frame(question)
     frame_array = pil_to_numpy(frame)
     clip = ImageClip(frame_array).set_duration(ANSWER_DURATION)
     return clip
 
 
-def create_account_clip() -> ImageClip:
+def create_account_clip() -> "ImageClip":
     """계정 정보 클립 생성 (5초)"""
+    from moviepy.video.VideoClip import ImageClip
+
     frame = render_account_frame()
     frame_array = pil_to_numpy(frame)
     clip = ImageClip(frame_array).set_duration(ACCOUNT_DURATION)
     return clip
 
 
-def generate_quiz_video(
-    question: QuizQuestion,
-    output_path: str | None = None,
-) -> tuple[bytes, str]:
+def build_question_runs(question: QuizQuestion) -> list[FrameRun]:
+    """문제별로 달라지는 구간 (카운트다운 10개 + 정답 = 11개 고유 프레임)"""
+    runs: list[FrameRun] = [(frame, FPS) for frame in render_question_frames(question, QUESTION_DURATION)]
+    runs.append((render_answer_frame(question), ANSWER_DURATION * FPS))
+    return runs
+
+
+def build_frame_runs(question: QuizQuestion) -> list[FrameRun]:
     """
-    퀴즈 영상 생성
+    영상 전체를 고유 프레임과 반복 프레임 수 목록으로 구성
+    인트로, 카운트다운 10개, 정답, 계정 정보 = 13개 고유 프레임
+    """
+    runs: list[FrameRun] = [(render_intro_frame(question), INTRO_DURATION * FPS)]
+    runs += build_question_runs(question)
+    runs.append((render_account_frame(), ACCOUNT_DURATION * FPS))
+    return runs
 
-    Args:
-        question: 퀴즈 문제 데이터
-        output_path: 저장할 경로 (None이면 임시 파일 사용)
 
-    Returns:
-        tuple[bytes, str]: (영상 바이트 데이터, 파일 경로)
+# build_frame_runs 반복 프레임 수의 공약수 - 지연 입력(FrameRing)을 still/lowfps 모드로 인코딩할 때 사용
+FRAME_RUN_STEP = math.gcd(INTRO_DURATION * FPS, FPS, ANSWER_DURATION * FPS, ACCOUNT_DURATION * FPS)
+
+
+def iter_frame_runs(question: QuizQuestion) -> Iterator[FrameRun]:
+    """build_frame_runs와 같은 순서로 렌더링하는 대로 반환 (렌더링과 인코딩을 겹쳐서 실행할 때)"""
+    yield render_intro_frame(question), INTRO_DURATION * FPS
+    base = render_question_base(question)
+    for countdown in range(QUESTION_DURATION, 0, -1):
+        yield render_countdown_overlay(base, countdown), FPS
+    yield render_answer_frame(question), ANSWER_DURATION * FPS
+    yield render_account_frame(), ACCOUNT_DURATION * FPS
+
+
+def render_into_ring(ring: "FrameRing", question: QuizQuestion):
     """
-    # 클립 생성
-    intro_clip = create_intro_clip(question)
-    question_clip = create_question_clip(question)
-    answer_clip = create_answer_clip(question)
-    account_clip = create_account_clip()
-
-    # 클립 연결
-    final_clip = concatenate_videoclips(
-        [intro_clip, question_clip, answer_clip, account_clip],
-        method="compose",
+    렌더러 프로세스 진입점 - 영상 전체 프레임을 FrameRing 슬롯에 쓰기
+    인코더 프로세스는 encode_from_ring()으로 같은 링에서 읽어 인코딩
+    """
+    try:
+        for frame, repeat in iter_frame_runs(question):
+            ring.write(frame, repeat)
+    except Exception as e:
+        ring.fail(str(e))
+        raise
+    ring.finish()
+
+
+def encode_from_ring(ring: "FrameRing", output_path: str | None = None) -> bytes | None:
+    """
+    인코더 프로세스 쪽 - 렌더러가 FrameRing에 쓴 프레임을 복사 없이 ffmpeg에 전달해서 인코딩 (오디오 베드 포함)
+
+    Raises:
+        FrameRingError: 렌더러가 실패했거나 응답이 없는 경우
+    """
+    return encode_frames(
+        ring.runs(),
+        output_path,
+        width=WIDTH,
+        height=HEIGHT,
+        fps=FPS,
+        audio=get_audio_input(),
+        preset=VIDEO_PRESET,
+        threads=VIDEO_THREADS,
+        memory_format=VIDEO_MEMORY_FORMAT,
+        encode_mode=VIDEO_ENCODE_MODE,
+        repeat_step=FRAME_RUN_STEP,
     )
 
-    # 배경음악 추가
-    bg_music = None
+
+def _write_and_replace(target: Path, write: Callable[[str], None]):
+    """
+    같은 디렉토리의 고유한 임시 파일(mkstemp)에 write(임시 경로)로 쓴 뒤 target으로 교체
+    다른 워커/스레드가 같은 파일을 동시에 만들어도 서로의 임시 파일을 덮어쓰거나 반쯤 쓴 파일을 공개하지 않음
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f"{target.stem}.", suffix=f".tmp{target.suffix}")
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+# 인트로 세그먼트 캐시: (퀴즈 유형, JLPT 레벨) -> 세그먼트 경로
+_intro_segments: dict[tuple, str] = {}
+_segment_lock = threading.Lock()
+
+
+def _encode_still_segment(name: str, frame: Image.Image, frame_count: int) -> str:
+    """
+    한 장면을 frame_count 프레임 길이의 무음 MP4 세그먼트로 인코딩
+    파일명은 프레임 내용 + 인코딩 인자 해시라 레이아웃/폰트가 바뀌면 새로 인코딩하고, 같으면 워커끼리 재사용
+    """
+    digest = hashlib.sha256()
+    digest.update(frame.tobytes())
+    codec_args = video_codec_args(VIDEO_PRESET, VIDEO_THREADS, VIDEO_ENCODE_MODE, FPS)
+    digest.update(f"{frame.size}:{FPS}:{frame_count}:{codec_args}".encode())
+    segment_path = SEGMENT_CACHE_DIR / f"{name}_{digest.hexdigest()[:16]}.mp4"
+    if segment_path.exists():
+        return str(segment_path)
+
+    # 다른 워커가 읽는 도중 덮어쓰지 않도록 임시 파일에 쓰고 교체
+    _write_and_replace(segment_path, lambda temp_path: encode_frames(
+        [(frame, frame_count)],
+        temp_path,
+        width=WIDTH,
+        height=HEIGHT,
+        fps=FPS,
+        preset=VIDEO_PRESET,
+        threads=VIDEO_THREADS,
+        encode_mode=VIDEO_ENCODE_MODE,
+    ))
+    return str(segment_path)
+
+
+def get_intro_segment(question: QuizQuestion) -> str:
+    """퀴즈 유형/JLPT 레벨별 인트로 세그먼트 경로 (처음 사용할 때 한 번만 인코딩)"""
+    key = (question.quiz_type, question.jlpt_level)
+    with _segment_lock:
+        if key not in _intro_segments:
+            level = f"n{question.jlpt_level}" if question.jlpt_level else "none"
+            _intro_segments[key] = _encode_still_segment(
+                f"intro_{question.quiz_type.value}_{level}",
+                render_intro_frame(question),
+                INTRO_DURATION * FPS,
+            )
+        return _intro_segments[key]
+
+
+@lru_cache(maxsize=1)
+def get_outro_segment() -> str:
+    """계정 정보 아웃트로 세그먼트 경로 (모든 영상 공통, 한 번만 인코딩)"""
+    # lru_cache는 동시에 들어온 첫 호출을 막지 않으므로 인트로와 같은 락으로 직렬화
+    with _segment_lock:
+        return _encode_still_segment("outro", render_account_frame(), ACCOUNT_DURATION * FPS)
+
+
+@lru_cache(maxsize=8)
+def load_sound(path: str, sample_rate: int = AUDIO_SAMPLE_RATE) -> np.ndarray:
+    """
+    사운드 파일 디코딩 결과 캐시 (프로세스당 파일별 한 번만 디코딩)
+    반환 배열은 여러 영상에서 공유하므로 읽기 전용
+    """
+    samples = decode_audio(path, sample_rate)
+    samples.flags.writeable = False
+    return samples
+
+
+def build_audio_track(sample_rate: int = AUDIO_SAMPLE_RATE) -> np.ndarray | None:
+    """
+    배경음악 + 카운트다운 효과음을 미리 믹싱한 오디오 트랙 생성
+
+    Returns:
+        np.ndarray | None: (샘플 수, 채널 수) float32 PCM (사운드 파일이 없으면 None)
+    """
+    total_samples = TOTAL_DURATION * sample_rate
+    track = None
+
+    # 배경음악 (영상 길이에 맞춰 반복/자르기, 볼륨 30%)
     for music_file in BACKGROUND_MUSIC_FILES:
         music_path = SOUNDS_DIR / music_file
         if music_path.exists():
             try:
-                bg_music = AudioFileClip(str(music_path))
-                # 영상 길이에 맞춰 조절
-                if bg_music.duration > TOTAL_DURATION:
-                    bg_music = bg_music.subclip(0, TOTAL_DURATION)
-                elif bg_music.duration < TOTAL_DURATION:
-                    # 루프 (간단하게 처음부터 반복)
-                    loops_needed = int(TOTAL_DURATION / bg_music.duration) + 1
-                    bg_music = concatenate_audioclips(
-                        [bg_music] * loops_needed
-                    ).subclip(0, TOTAL_DURATION)
-
-                # 볼륨 조절 (배경음악은 낮게)
-                bg_music = bg_music.volumex(0.3)  # 30% 볼륨
+                music = load_sound(str(music_path), sample_rate)
+                if len(music) == 0:
+                    continue
+                loops_needed = total_samples // len(music) + 1
+                track = np.tile(music, (loops_needed, 1))[:total_samples] * BACKGROUND_MUSIC_VOLUME
                 break
             except Exception as e:
                 print(f"⚠️  배경음악 로드 실패 {music_file}: {e}")
-                if bg_music:
-                    bg_music.close()
-                bg_music = None
                 continue
 
-    # 배경음악과 효과음 결합
-    if bg_music and final_clip.audio:
-        # CompositeAudioClip으로 배경음악과 효과음 결합
-        final_audio = CompositeAudioClip([bg_music, final_clip.audio])
-        final_clip = final_clip.set_audio(final_audio)
-    elif bg_music:
-        # 배경음악만 있는 경우
-        final_clip = final_clip.set_audio(bg_music)
+    # 효과음 (문제 구간 매 초마다)
+    tick_sound_path = SOUNDS_DIR / "tick.wav"
+    if tick_sound_path.exists():
+        try:
+            tick = load_sound(str(tick_sound_path), sample_rate)[: int(TICK_DURATION * sample_rate)]
+            if track is None:
+                track = np.zeros((total_samples, tick.shape[1]), dtype=np.float32)
+            for second in range(INTRO_DURATION, INTRO_DURATION + QUESTION_DURATION):
+                start = second * sample_rate
+                track[start : start + len(tick)] += tick
+        except Exception as e:
+            print(f"⚠️  효과음 로드 실패: {e}")
 
-    # 출력 경로 결정
-    if output_path is None:
-        # 임시 파일 사용
-        temp_dir = tempfile.mkdtemp()
-        output_path = os.path.join(temp_dir, f"quiz_{question.id}.mp4")
-    else:
-        # 디렉토리 생성
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if track is None:
+        return None
+    return np.clip(track, -1.0, 1.0).astype(np.float32)
+
+
+@lru_cache(maxsize=1)
+def get_audio_bed() -> np.ndarray | None:
+    """
+    오디오 베드(배경음악 + 카운트다운 효과음) PCM 캐시
+    타임라인이 고정(TOTAL_DURATION, 효과음 위치)이므로 모든 영상에서 같은 트랙을 공유 (읽기 전용)
+    """
+    track = build_audio_track()
+    if track is not None:
+        track.flags.writeable = False
+    return track
+
+
+_audio_bed_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_encoded_audio_bed() -> str | None:
+    """
+    오디오 베드를 AAC(m4a)로 한 번만 인코딩한 파일 경로
+    파일명은 PCM 내용 해시라 사운드 파일이나 타임라인이 바뀌면 새로 인코딩하고, 같은 트랙이면 워커끼리 재사용
+
+    Returns:
+        str | None: AAC 파일 경로 (사운드 파일이 없거나 인코딩에 실패하면 None)
+    """
+    track = get_audio_bed()
+    if track is None:
+        return None
+
+    digest = hashlib.sha256(track.tobytes()).hexdigest()[:16]
+    bed_path = AUDIO_BED_DIR / f"audio_bed_{digest}.m4a"
+    # lru_cache는 동시에 들어온 첫 호출을 막지 않으므로 (워밍업 스레드 + 스트리밍 요청) 직접 직렬화
+    with _audio_bed_lock:
+        if bed_path.exists():
+            return str(bed_path)
+        try:
+            # 다른 워커가 읽는 도중 덮어쓰지 않도록 임시 파일에 쓰고 교체
+            _write_and_replace(bed_path, lambda temp_path: encode_audio(track, temp_path))
+        except Exception as e:
+            print(f"⚠️  오디오 베드 인코딩 실패 (PCM으로 대체): {e}")
+            return None
+    return str(bed_path)
+
+
+def get_audio_input() -> AudioInput | None:
+    """ffmpeg 엔진에 넘길 오디오 (미리 인코딩한 AAC, 실패 시 PCM)"""
+    encoded_path = get_encoded_audio_bed()
+    if encoded_path is not None:
+        return encoded_path
+    return get_audio_bed()
+
+
+# 워밍업 단계 이름 (warm_up_assets/render_warmup_video 처리 시간 키)
+WARMUP_ASSETS = "assets"  # 폰트, 그라데이션 배경, 이모지
+WARMUP_FFMPEG = "ffmpeg"  # ffmpeg 실행 파일 탐색
+WARMUP_AUDIO_BED = "audio_bed"  # 사운드 디코딩 + 믹싱 + AAC 인코딩
+WARMUP_SEGMENTS = "segments"  # 아웃트로 세그먼트 인코딩
+WARMUP_MOVIEPY = "moviepy"  # MoviePy 하위 모듈 import (VIDEO_ENGINE=moviepy일 때만)
+WARMUP_ENCODE = "throwaway_encode"  # 버리는 영상 렌더링/인코딩
+
+# 버리는 영상 - 실제 요청과 같은 렌더링 경로(텍스트 레이아웃, 이모지)를 거치도록 일반적인 문제 사용
+WARMUP_QUESTION = QuizQuestion(
+    id=0,
+    question="勉強",
+    options=["공부", "운동", "독서", "여행"],
+    correct_answer="공부",
+    explanation="💡 勉(힘쓸 면) + 強(강할 강) = 공부하다",
+    jlpt_level=5,
+)
+WARMUP_SCALE = 10  # 버리는 영상 축소 비율 (1080x1920 → 108x192)
+
+
+def warm_up_assets(timings: StageTimings | None = None):
+    """
+    영상 생성 에셋 미리 로드 (렌더 워커 프로세스 시작 시 호출)
+    - 폰트, 그라데이션 배경, 이모지 이미지
+    - ffmpeg 실행 파일 탐색
+    - 오디오 베드 믹싱 + AAC 인코딩
+    - 계정 정보 아웃트로 세그먼트 인코딩 (인트로는 퀴즈 유형/레벨별로 처음 사용할 때 인코딩)
+    - MoviePy 하위 모듈 import (VIDEO_ENGINE=moviepy일 때만)
+
+    Args:
+        timings: 단계별(WARMUP_*) 처리 시간을 기록할 dict
+    """
+    with timed(timings, WARMUP_ASSETS):
+        preload_assets()
+    with timed(timings, WARMUP_FFMPEG):
+        get_ffmpeg_exe()
+    with timed(timings, WARMUP_AUDIO_BED):
+        get_encoded_audio_bed()
+    if SEGMENT_CACHE_ENABLED:
+        with timed(timings, WARMUP_SEGMENTS):
+            get_outro_segment()
+    if VIDEO_ENGINE == "moviepy":
+        with timed(timings, WARMUP_MOVIEPY):
+            for module in MOVIEPY_MODULES:
+                importlib.import_module(module)
+
+
+def render_warmup_video(timings: StageTimings | None = None) -> bytes:
+    """
+    버리는 영상 렌더링/인코딩 (프로세스 시작 시 한 번)
+    첫 요청이 ffmpeg 프로세스 시작/코덱 초기화/메모리 출력 비용을 내지 않도록 실제 인코딩 설정으로 한 번 실행
+    프레임은 WARMUP_SCALE로 축소하고 장면당 한 프레임만 인코딩
+    """
+    with timed(timings, WARMUP_ENCODE):
+        runs = [(frame.reduce(WARMUP_SCALE), 1) for frame, _ in build_frame_runs(WARMUP_QUESTION)]
+        return encode_frames(
+            runs,
+            None,
+            width=WIDTH // WARMUP_SCALE,
+            height=HEIGHT // WARMUP_SCALE,
+            fps=FPS,
+            preset=VIDEO_PRESET,
+            threads=VIDEO_THREADS,
+            memory_format=VIDEO_MEMORY_FORMAT,
+            encode_mode=VIDEO_ENCODE_MODE,
+        )
+
+
+def _write_with_segments(
+    question: QuizQuestion,
+    output_path: str | None,
+    timings: StageTimings | None = None,
+) -> bytes | None:
+    """
+    문제별 구간(카운트다운 + 정답)만 인코딩하고, 미리 인코딩한 인트로/아웃트로와 스트림 복사로 이어 붙임
+    오디오 베드는 이어 붙이는 단계에서 mux
+    """
+    with timed(timings, STAGE_ENCODE):
+        segments = [get_intro_segment(question), None, get_outro_segment()]
+    with timed(timings, STAGE_RENDER):
+        runs = build_question_runs(question)
+    with timed(timings, STAGE_AUDIO_MIX):
+        audio = get_audio_input()
+
+    work_dir = tempfile.mkdtemp(prefix="quiz_", dir=SEGMENT_WORK_DIR)
+    try:
+        with timed(timings, STAGE_ENCODE):
+            return _encode_and_concat(runs, segments, work_dir, output_path, audio)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _encode_and_concat(
+    runs: list[FrameRun],
+    segments: list[str | None],
+    work_dir: str,
+    output_path: str | None,
+    audio: AudioInput | None,
+) -> bytes | None:
+    """문제별 구간을 work_dir에 인코딩한 뒤 인트로/아웃트로와 이어 붙임"""
+    segments[1] = os.path.join(work_dir, "question.mp4")
+    encode_frames(
+        runs,
+        segments[1],
+        width=WIDTH,
+        height=HEIGHT,
+        fps=FPS,
+        preset=VIDEO_PRESET,
+        threads=VIDEO_THREADS,
+        encode_mode=VIDEO_ENCODE_MODE,
+    )
+    return concat_segments(
+        segments,
+        output_path,
+        audio=audio,
+        memory_format=VIDEO_MEMORY_FORMAT,
+    )
+
+
+def _write_with_ffmpeg(
+    question: QuizQuestion,
+    output_path: str | None,
+    timings: StageTimings | None = None,
+) -> bytes | None:
+    """
+    고유 프레임을 raw RGB로 ffmpeg에 직접 파이프하여 인코딩
+    output_path가 None이면 디스크를 거치지 않고 영상 바이트를 반환
+    """
+    if SEGMENT_CACHE_ENABLED:
+        try:
+            return _write_with_segments(question, output_path, timings)
+        except Exception as e:
+            print(f"⚠️  세그먼트 이어 붙이기 실패 (전체 인코딩으로 대체): {e}")
+
+    with timed(timings, STAGE_RENDER):
+        runs = build_frame_runs(question)
+    with timed(timings, STAGE_AUDIO_MIX):
+        audio = get_audio_input()
+    with timed(timings, STAGE_ENCODE):
+        return encode_frames(
+            runs,
+            output_path,
+            width=WIDTH,
+            height=HEIGHT,
+            fps=FPS,
+            audio=audio,
+            preset=VIDEO_PRESET,
+            threads=VIDEO_THREADS,
+            memory_format=VIDEO_MEMORY_FORMAT,
+            encode_mode=VIDEO_ENCODE_MODE,
+        )
+
+
+def _write_with_moviepy(question: QuizQuestion, output_path: str, timings: StageTimings | None = None):
+    """MoviePy 클립 합성으로 인코딩 (기존 방식)"""
+    from moviepy.audio.io.AudioFileClip import AudioFileClip
+    from moviepy.video.compositing.concatenate import concatenate_videoclips
+
+    # 클립 생성
+    with timed(timings, STAGE_RENDER):
+        intro_clip = create_intro_clip(question)
+        question_clip = create_question_clip(question)
+        answer_clip = create_answer_clip(question)
+        account_clip = create_account_clip()
+
+        # 클립 연결
+        final_clip = concatenate_videoclips(
+            [intro_clip, question_clip, answer_clip, account_clip],
+            method="compose",
+        )
+
+    # 오디오 베드 (배경음악 + 효과음이 미리 믹싱된 트랙)
+    with timed(timings, STAGE_AUDIO_MIX):
+        bed_path = get_encoded_audio_bed()
+    bed_audio = None
+    if bed_path is not None:
+        try:
+            bed_audio = AudioFileClip(bed_path).subclip(0, TOTAL_DURATION)
+            final_clip = final_clip.set_audio(bed_audio)
+        except Exception as e:
+            print(f"⚠️  오디오 베드 로드 실패: {e}")
+            bed_audio = None
 
     # 영상 렌더링
     # 오디오가 있는 경우 audio=True, 없으면 audio=False
     has_audio = final_clip.audio is not None
-    final_clip.write_videofile(
-        output_path,
-        fps=FPS,
-        codec="libx264",
-        audio=has_audio,  # 오디오가 있으면 포함
-        audio_codec="aac" if has_audio else None,
-        preset="medium",  # 인코딩 속도 vs 품질
-        threads=4,
-        logger=None,  # 로그 비활성화
-    )
+    with timed(timings, STAGE_ENCODE):
+        final_clip.write_videofile(
+            output_path,
+            fps=FPS,
+            codec="libx264",
+            audio=has_audio,  # 오디오가 있으면 포함
+            audio_codec="aac" if has_audio else None,
+            preset=VIDEO_PRESET,
+            threads=VIDEO_THREADS,
+            logger=None,  # 로그 비활성화
+        )
 
     # 클립 정리
     final_clip.close()
@@ -213,9 +650,49 @@ def generate_quiz_video(
     answer_clip.close()
     account_clip.close()
 
-    # 배경음악 정리
-    if bg_music:
-        bg_music.close()
+    # 오디오 베드 정리
+    if bed_audio:
+        bed_audio.close()
+
+
+def generate_quiz_video(
+    question: QuizQuestion,
+    output_path: str | None = None,
+    engine: str | None = None,
+    timings: StageTimings | None = None,
+) -> tuple[bytes, str | None]:
+    """
+    퀴즈 영상 생성
+
+    Args:
+        question: 퀴즈 문제 데이터
+        output_path: 저장할 경로
+            (None이면 ffmpeg 엔진은 메모리로 바로 출력, moviepy 엔진은 임시 파일 사용)
+        engine: 인코딩 엔진 ("ffmpeg" / "moviepy", None이면 VIDEO_ENGINE 환경 변수)
+        timings: 단계별 처리 시간(render, audio_mix, encode)을 기록할 dict (None이면 측정하지 않음)
+
+    Returns:
+        tuple[bytes, str | None]: (영상 바이트 데이터, 파일 경로 - 메모리 출력이면 None)
+    """
+    engine = (engine or VIDEO_ENGINE).lower()
+
+    # 메모리 출력 (임시 파일 쓰기/다시 읽기 없음)
+    if output_path is None and engine != "moviepy":
+        return _write_with_ffmpeg(question, None, timings), None
+
+    # 출력 경로 결정
+    if output_path is None:
+        # 임시 파일 사용
+        temp_dir = tempfile.mkdtemp()
+        output_path = os.path.join(temp_dir, f"quiz_{question.id}.mp4")
+    else:
+        # 디렉토리 생성
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    if engine == "moviepy":
+        _write_with_moviepy(question, output_path, timings)
+    else:
+        _write_with_ffmpeg(question, output_path, timings)
 
     # 파일 읽기
     with open(output_path, "rb") as f:
@@ -224,6 +701,84 @@ def generate_quiz_video(
     return video_bytes, output_path
 
 
+def stream_quiz_video(question: QuizQuestion, timings: StageTimings | None = None) -> Iterator[bytes]:
+    """
+    퀴즈 영상을 fragmented MP4로 인코딩하면서 청크 단위로 반환 (스트리밍 응답용)
+    항상 ffmpeg 엔진 사용 (MoviePy는 파일 출력만 지원)
+
+    Args:
+        question: 퀴즈 문제 데이터
+        timings: 단계별 처리 시간을 기록할 dict
+            (인코딩은 청크 전송 대기 시간이 포함되므로 encode와 섞이지 않도록 encode_stream으로 기록)
+
+    Yields:
+        bytes: 인코더가 출력한 MP4 데이터 청크
+    """
+    with timed(timings, STAGE_RENDER):
+        runs = build_frame_runs(question)
+    with timed(timings, STAGE_AUDIO_MIX):
+        audio = get_audio_input()
+    with timed(timings, STAGE_ENCODE_STREAM):
+        yield from iter_encode_frames(
+            runs,
+            width=WIDTH,
+            height=HEIGHT,
+            fps=FPS,
+            audio=audio,
+            preset=VIDEO_PRESET,
+            threads=VIDEO_THREADS,
+            encode_mode=VIDEO_ENCODE_MODE,
+        )
+
+
+def generate_quiz_outputs(
+    question: QuizQuestion,
+    profile_names: list[str] | None = None,
+    output_dir: str | None = None,
+    timings: StageTimings | None = None,
+) -> dict[str, bytes | str]:
+    """
+    여러 출력 프로필(해상도/형식)을 한 번에 생성
+    프레임은 한 번만 렌더링하고, ffmpeg 프로세스 하나가 입력을 한 번만 받아 split 필터로 프로필별 출력
+
+    Args:
+        question: 퀴즈 문제 데이터
+        profile_names: OUTPUT_PROFILES의 프로필 이름 목록 (None이면 전체)
+        output_dir: 출력 디렉토리 (None이면 메모리로 출력)
+        timings: 단계별 처리 시간(render, audio_mix, encode)을 기록할 dict
+
+    Returns:
+        dict[str, bytes | str]: {프로필 이름: 출력 바이트 (output_dir이 None) 또는 파일 경로}
+
+    Raises:
+        ValueError: 없는 프로필 이름
+    """
+    names = list(dict.fromkeys(profile_names or OUTPUT_PROFILES))
+    unknown = [name for name in names if name not in OUTPUT_PROFILES]
+    if unknown:
+        raise ValueError(f"알 수 없는 출력 프로필: {', '.join(unknown)} (사용 가능: {', '.join(OUTPUT_PROFILES)})")
+
+    with timed(timings, STAGE_RENDER):
+        runs = build_frame_runs(question)
+    with timed(timings, STAGE_AUDIO_MIX):
+        audio = get_audio_input()
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    with timed(timings, STAGE_ENCODE):
+        return encode_profiles(
+            runs,
+            [OUTPUT_PROFILES[name] for name in names],
+            width=WIDTH,
+            height=HEIGHT,
+            fps=FPS,
+            audio=audio,
+            preset=VIDEO_PRESET,
+            threads=VIDEO_THREADS,
+            encode_mode=VIDEO_ENCODE_MODE,
+            output_dir=output_dir,
+        )
+
+
 def generate_quiz_video_to_file(
     question: QuizQuestion,
     output_dir: str = "./output",
@@ -0,0 +1,102 @@
+"""
+Warm-up - 서버 시작 시 에셋 로드 + 버리는 영상 인코딩 + 렌더 풀 워커 준비
+lifespan에서 백그라운드로 실행하고, 끝날 때까지 /health는 503을 반환해서
+오토스케일로 새로 뜬 인스턴스가 준비되기 전에 트래픽을 받아 첫 요청이 콜드 스타트 비용을 내지 않도록 함
+"""
+
+import os
+import time
+import logging
+from dataclasses import dataclass, field
+
+from fastapi.concurrency import run_in_threadpool
+
+from metrics import StageTimings, record_startup, timed
+from render_pool import RenderPool
+from video_generator import render_warmup_video, warm_up_assets
+
+logger = logging.getLogger(__name__)
+
+
+# 워밍업 설정
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_TIMEOUT_SECONDS", "300"))  # 렌더 풀 워커 준비 최대 대기 시간
+
+# 워밍업 단계 이름 (video_generator.WARMUP_* 외)
+WARMUP_RENDER_POOL = "render_pool"  # 워커 프로세스 시작 + 워커별 에셋 로드 + 버리는 영상 인코딩
+
+
+@dataclass
+class WarmupState:
+    """워밍업 진행 상태"""
+    ready: bool = False
+    error: str | None = None
+    phases: StageTimings = field(default_factory=dict)  # 끝난 단계별 처리 시간 (초)
+    workers_ready: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self) -> dict:
+        end = self.finished_at or time.perf_counter()
+        return {
+            "ready": self.ready,
+            "error": self.error,
+            "phases": dict(self.phases),
+            "workers_ready": self.workers_ready,
+            "total_seconds": end - self.started_at if self.started_at is not None else None,
+        }
+
+
+# 싱글톤 상태
+_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    """워밍업 상태 반환"""
+    return _state
+
+
+async def run_warmup(render_pool: RenderPool):
+    """
+    워밍업 실행 (lifespan에서 백그라운드 태스크로 실행)
+    실패해도 준비 완료로 표시 (요청 처리 시 에셋을 다시 로드하므로 503으로 인스턴스를 계속 막지 않음)
+    """
+    state = _state
+    state.started_at = time.perf_counter()
+    if not WARMUP_ENABLED:
+        state.ready = True
+        state.finished_at = state.started_at
+        return
+
+    logger.info("🔥 워밍업 시작")
+    try:
+        # 이 프로세스 (스트리밍 응답, /preview는 API 프로세스에서 렌더링)
+        phases: StageTimings = {}
+        await run_in_threadpool(warm_up_assets, phases)
+        state.phases.update(phases)
+
+        phases = {}
+        await run_in_threadpool(render_warmup_video, phases)
+        state.phases.update(phases)
+
+        # 렌더 풀 워커
+        with timed(state.phases, WARMUP_RENDER_POOL):
+            state.workers_ready = await render_pool.warm_up(WARMUP_TIMEOUT_SECONDS)
+        if state.workers_ready < render_pool.workers:
+            # 기다리지 않고 준비 완료로 표시 (남은 워커는 첫 요청에서 준비됨)
+            state.error = (
+                f"렌더 풀 워커 일부만 준비됨: {state.workers_ready}/{render_pool.workers} "
+                f"({WARMUP_TIMEOUT_SECONDS:.0f}초 초과)"
+            )
+            logger.warning(f"⚠️ {state.error}")
+    except Exception as e:
+        state.error = str(e)
+        logger.error(f"❌ 워밍업 실패: {e}", exc_info=True)
+
+    state.finished_at = time.perf_counter()
+    state.ready = True
+    record_startup(state.phases)
+    logger.info(
+        f"✅ 워밍업 완료 ({state.finished_at - state.started_at:.2f}s): "
+        + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in state.phases.items())
+    )